@@ -18,3 +18,7 @@ class ConditionsConfig(AppConfig):
     """Configuration class for the Conditions app."""
     default_auto_field = 'django.db.models.BigAutoField'  # Use BigAutoField for model primary keys by default
     name = 'conditions'  # Name used by Django to refer to this app internally
+
+    def ready(self):
+        """Connect signal handlers (cache invalidation, version stamps)."""
+        from . import signals  # noqa: F401
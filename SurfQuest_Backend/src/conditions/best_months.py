@@ -0,0 +1,152 @@
+"""
+Best-month engine: scores every month of every surf zone from its conditions.
+
+`SurfZone.best_months` is curated by hand; this engine derives a score in
+[0, 1] per (zone, month) from the Condition row of the month, as the
+weighted average of components (each between 0 and 1):
+
+- surf_rating: world_surf_rating, 1 -> 0, 5 -> 1
+- swell_consistency: % of days with surfable swell
+- wind: wind_force, 5 (strongest) -> 0, 1 -> 1
+- crowd: Low -> 1 .. Very High -> 0
+- water_temp: water_temp_c, 12 °C or less -> 0, 26 °C or more -> 1
+
+A missing metric leaves its component out of the average; a month without
+a condition row gets no score. Weights default to DEFAULT_WEIGHTS and are
+overridden by settings.BEST_MONTH_WEIGHTS.
+
+Scores are computed column-wise over a ConditionMatrix (all zones, one
+month at a time) and stored in the ZoneMonthScore table with the rank of
+the month within its zone. The rows of a zone are rewritten when one of
+its conditions changes (see conditions/signals.py); `manage.py
+compute_best_months` rewrites the whole table in one pass.
+"""
+
+# ============================
+# Standard Library
+# ============================
+import math   # NaN of missing metrics
+
+# ============================
+# Django Imports
+# ============================
+from django.conf import settings   # BEST_MONTH_WEIGHTS
+from django.db import transaction   # Rewrite the rows of a zone atomically
+
+# ============================
+# Local Application Imports
+# ============================
+from .matrix import ConditionMatrix, CROWD_LEVELS, MONTHS, NUMERIC_METRICS
+from .models import Condition, ZoneMonthScore
+
+
+DEFAULT_WEIGHTS = {
+    "surf_rating": 3.0,
+    "swell_consistency": 2.0,
+    "wind": 1.0,
+    "crowd": 1.0,
+    "water_temp": 1.0,
+}
+
+WATER_TEMP_RANGE_C = (12.0, 26.0)   # Score 0 at or below the first, 1 at or above the second
+
+
+# ============================
+# Scoring
+# ============================
+def get_weights():
+    """DEFAULT_WEIGHTS overridden by settings.BEST_MONTH_WEIGHTS (unknown names and negative weights ignored)."""
+    weights = dict(DEFAULT_WEIGHTS)
+    for name, weight in getattr(settings, "BEST_MONTH_WEIGHTS", {}).items():
+        if name in weights and weight >= 0:
+            weights[name] = float(weight)
+    return weights
+
+
+def _clamp(value):
+    return min(1.0, max(0.0, value))
+
+
+def component_columns(matrix, month):
+    """{component: [score or None per zone slot]} for a month index of `matrix`."""
+    count = matrix.zone_count
+    columns = slice(month * count, (month + 1) * count)
+    low, high = WATER_TEMP_RANGE_C
+
+    def numeric(metric, score):
+        return [None if math.isnan(value) else _clamp(score(value)) for value in matrix.metrics[metric][columns]]
+
+    crowd_span = max(len(CROWD_LEVELS) - 1, 1)
+    return {
+        "surf_rating": numeric("world_surf_rating", lambda rating: (rating - 1) / 4),
+        "swell_consistency": numeric("swell_consistency", lambda percent: percent / 100),
+        "wind": numeric("wind_force", lambda force: (5 - force) / 4),
+        "crowd": [None if code < 0 else 1 - code / crowd_span for code in matrix.crowd[columns]],
+        "water_temp": numeric("water_temp_c", lambda temp: (temp - low) / (high - low)),
+    }
+
+
+def score_months(matrix, weights=None):
+    """{zone_id: [score or None for each month]} of every zone of `matrix`."""
+    weights = get_weights() if weights is None else weights
+    scores = {zone_id: [None] * 12 for zone_id in matrix.zone_ids}
+    count = matrix.zone_count
+    for month in range(12):
+        totals, weight_sums = [0.0] * count, [0.0] * count
+        for name, column in component_columns(matrix, month).items():
+            weight = weights.get(name, 0.0)
+            if not weight:
+                continue
+            for zone, value in enumerate(column):
+                if value is not None:
+                    totals[zone] += weight * value
+                    weight_sums[zone] += weight
+        for zone, zone_id in enumerate(matrix.zone_ids):
+            if matrix.present[month * count + zone] and weight_sums[zone]:
+                scores[zone_id][month] = round(totals[zone] / weight_sums[zone], 4)
+    return scores
+
+
+def ranked_rows(scores):
+    """(zone_id, month name, score, rank) of `score_months` results; ties rank in calendar order."""
+    rows = []
+    for zone_id, months in scores.items():
+        ranked = sorted(
+            ((score, month) for month, score in enumerate(months) if score is not None),
+            key=lambda item: (-item[0], item[1]),
+        )
+        rows += [
+            (zone_id, MONTHS[month], score, rank)
+            for rank, (score, month) in enumerate(ranked, start=1)
+        ]
+    return rows
+
+
+# ============================
+# Storage
+# ============================
+def condition_rows(queryset):
+    return queryset.order_by().values_list("surfzone_id", "month", "surf_level_mask", "crowd", *NUMERIC_METRICS)
+
+
+def refresh_best_months(zone_ids=None, condition_model=Condition, score_model=ZoneMonthScore):
+    """
+    Recompute the month scores of `zone_ids` (every zone when None) in one
+    batch, and replace their ZoneMonthScore rows.
+
+    `condition_model` / `score_model` may be historical models (migrations).
+    """
+    conditions = condition_model.objects.all()
+    scores = score_model.objects.all()
+    if zone_ids is not None:
+        conditions = conditions.filter(surfzone_id__in=zone_ids)
+        scores = scores.filter(surfzone_id__in=zone_ids)
+
+    rows = ranked_rows(score_months(ConditionMatrix(condition_rows(conditions))))
+    with transaction.atomic():
+        scores.delete()
+        score_model.objects.bulk_create([
+            score_model(surfzone_id=zone_id, month=month, score=score, rank=rank)
+            for zone_id, month, score, rank in rows
+        ])
+    return len(rows)
@@ -0,0 +1,34 @@
+"""
+Management command to recompute the best-month scores of every surf zone.
+
+Needed after changing settings.BEST_MONTH_WEIGHTS, or after bulk operations
+that bypass the condition signals (bulk_create, fixtures, raw SQL imports).
+
+Usage:
+    python manage.py compute_best_months
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.core.management.base import BaseCommand
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import invalidate_catalogue_cache   # Cached responses may embed the scores
+
+# ============================
+# Local Application Imports
+# ============================
+from conditions.best_months import refresh_best_months, get_weights
+
+
+class Command(BaseCommand):
+    help = "Recompute the ZoneMonthScore table (score and rank of every month of every surf zone)."
+
+    def handle(self, *args, **options):
+        rows = refresh_best_months()
+        invalidate_catalogue_cache()
+        weights = ", ".join(f"{name}={weight:g}" for name, weight in get_weights().items())
+        self.stdout.write(self.style.SUCCESS(f"Scored {rows} zone month(s) ({weights})."))
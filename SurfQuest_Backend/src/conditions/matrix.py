@@ -0,0 +1,406 @@
+"""
+In-memory zone x month condition matrix.
+
+Loads every Condition row once (a single query) into compact columnar arrays
+laid out month-major: the value of a metric for zone `z` in month `m` lives at
+`m * zone_count + z`. Missing values are NaN (numeric metrics) or -1 (crowd).
+
+Month-based filters are evaluated as zone bitmasks (one Python int per
+predicate, bit `z` set when zone `z` matches) combined with `&`:
+- numeric ranges bisect a per (metric, month) sorted column;
+- surf level (read from `Condition.surf_level_mask`) and crowd use
+  precomputed per-month masks.
+The result is a list of zone IDs, so the surf zone query never joins
+`conditions`.
+
+The same predicates can be evaluated over a window of consecutive months
+(`filter_window_zone_ids`): in every month (all), in at least one (any), or
+on the day-weighted average of the window (avg). Averages read per-zone
+prefix sums over two years of months, so a window of any width costs one
+subtraction per zone.
+
+The matrix is also exported whole (`/api/v1/conditions/matrix/`) as dense
+[zone][month] arrays under a single zone-id header (see `MatrixExport`).
+
+The matrix is rebuilt lazily when the catalogue changes (see surfquest/indexes.py).
+"""
+
+# ============================
+# Standard Library
+# ============================
+import hashlib   # ETags of the exported bodies
+import math   # NaN for missing values
+import threading   # Guard the export cache
+from array import array   # Compact typed columns
+from bisect import bisect_left, bisect_right   # Range lookups in sorted columns
+
+# ============================
+# Django Imports
+# ============================
+from django.utils.http import quote_etag   # ETag header formatting
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.indexes import CatalogueIndex   # Lazily rebuilt in-memory index
+from surfquest.renderers import ORJSONRenderer   # Same JSON output as the API (orjson when installed)
+from surfzones.bitmasks import choice_bits   # Bits of the surf_level_mask column
+from surfzones.choices import MONTHS_CHOICES, SURF_LEVEL_CHOICES
+
+# ============================
+# Local Application Imports
+# ============================
+from .choices import CROWD_CHOICES
+from .models import Condition
+
+
+# ============================
+# Encodings
+# ============================
+MONTHS = list(MONTHS_CHOICES.values)   # January..December
+MONTH_INDEX = {month: i for i, month in enumerate(MONTHS)}
+
+NUMERIC_METRICS = (
+    "water_temp_c",
+    "swell_size_meter",
+    "swell_consistency",
+    "sunny_days",
+    "rain_days",
+    "rain_quantity",
+    "world_surf_rating",
+    "local_surf_rating",
+    "wind_force",
+    "wind_consistency",
+    "min_air_temp_c",
+    "max_air_temp_c",
+)
+
+CROWD_LEVELS = list(CROWD_CHOICES.values)   # Ordered Low..Very High
+CROWD_CODE = {crowd: i for i, crowd in enumerate(CROWD_LEVELS)}
+
+SURF_LEVEL_BIT = choice_bits(SURF_LEVEL_CHOICES)
+
+MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)   # Weights of the window averages
+WINDOW_MATCHES = ("all", "any", "avg")
+
+INTEGER_METRICS = frozenset(
+    name for name in NUMERIC_METRICS
+    if Condition._meta.get_field(name).get_internal_type() != "FloatField"
+)
+EXPORT_METRICS = NUMERIC_METRICS + ("crowd", "surf_level")   # Selectable on the matrix endpoint
+
+
+# ============================
+# Matrix
+# ============================
+class ConditionMatrix:
+    """Columnar zone x month view of all Condition rows."""
+
+    def __init__(self, rows):
+        """`rows`: iterables of (surfzone_id, month, surf_level_mask, crowd, *NUMERIC_METRICS)."""
+        rows = list(rows)
+        self.zone_ids = sorted({row[0] for row in rows})
+        self.zone_index = {zone_id: i for i, zone_id in enumerate(self.zone_ids)}
+        size = len(self.zone_ids) * 12
+
+        self.present = array("b", bytes(size))
+        self.crowd = array("b", [-1]) * size
+        self.surf_level = array("B", bytes(size))
+        self.metrics = {name: array("d", [math.nan]) * size for name in NUMERIC_METRICS}
+
+        for zone_id, month, surf_level_mask, crowd, *values in rows:
+            if month not in MONTH_INDEX:
+                continue
+            offset = self.offset(self.zone_index[zone_id], MONTH_INDEX[month])
+            self.present[offset] = 1
+            self.crowd[offset] = CROWD_CODE.get(crowd, -1)
+            self.surf_level[offset] = surf_level_mask
+            for name, value in zip(NUMERIC_METRICS, values):
+                if value is not None:
+                    self.metrics[name][offset] = value
+
+        self._build_masks()
+        self._window_sums = {}
+        self.export = MatrixExport(self)
+
+    @property
+    def zone_count(self):
+        return len(self.zone_ids)
+
+    def offset(self, zone, month):
+        """Flat position of (zone index, month index)."""
+        return month * self.zone_count + zone
+
+    def value(self, metric, zone_id, month):
+        """Value of a metric for a zone and month name (None when missing)."""
+        zone = self.zone_index.get(zone_id)
+        if zone is None or month not in MONTH_INDEX:
+            return None
+        value = self.metrics[metric][self.offset(zone, MONTH_INDEX[month])]
+        return None if math.isnan(value) else value
+
+    def _build_masks(self):
+        """Precompute per-month bitmasks and sorted columns."""
+        count = self.zone_count
+        self.present_masks = []
+        self.crowd_masks = []
+        self.surf_level_masks = []
+        self.sorted_columns = {name: [] for name in NUMERIC_METRICS}
+
+        for month in range(12):
+            base = month * count
+            present, crowd, levels = 0, {}, {}
+            for zone in range(count):
+                offset = base + zone
+                if not self.present[offset]:
+                    continue
+                bit = 1 << zone
+                present |= bit
+                code = self.crowd[offset]
+                if code >= 0:
+                    crowd[code] = crowd.get(code, 0) | bit
+                for level_bit in SURF_LEVEL_BIT.values():
+                    if self.surf_level[offset] & level_bit:
+                        levels[level_bit] = levels.get(level_bit, 0) | bit
+            self.present_masks.append(present)
+            self.crowd_masks.append(crowd)
+            self.surf_level_masks.append(levels)
+
+            for name, column in self.metrics.items():
+                pairs = sorted(
+                    (column[base + zone], 1 << zone)
+                    for zone in range(count)
+                    if not math.isnan(column[base + zone])
+                )
+                self.sorted_columns[name].append(
+                    ([value for value, _ in pairs], [bit for _, bit in pairs])
+                )
+
+    # ----------------------------
+    # Masks
+    # ----------------------------
+    def range_mask(self, metric, month, low=None, high=None):
+        """Zones whose metric for the month lies in [low, high] (missing values never match)."""
+        values, bits = self.sorted_columns[metric][month]
+        start = 0 if low is None else bisect_left(values, low)
+        end = len(values) if high is None else bisect_right(values, high)
+        return sum(bits[start:end])   # Distinct bits: sum == OR
+
+    def surf_level_mask(self, month, levels, match="any"):
+        """Zones whose surf levels for the month include any / all of `levels`."""
+        masks = [self.surf_level_masks[month].get(SURF_LEVEL_BIT.get(level), 0) for level in levels]
+        if match == "all":
+            mask = self.present_masks[month]
+            for level_mask in masks:
+                mask &= level_mask
+            return mask
+        mask = 0
+        for level_mask in masks:
+            mask |= level_mask
+        return mask
+
+    def month_mask(self, month, ranges=(), surf_level=None, crowd=None, surf_level_match="any"):
+        """Zones with a condition row for `month` matching every predicate."""
+        mask = self.present_masks[month]
+        for metric, low, high in ranges:
+            mask &= self.range_mask(metric, month, low, high)
+            if not mask:
+                return 0
+        if surf_level:
+            mask &= self.surf_level_mask(month, surf_level, surf_level_match)
+        if crowd:
+            mask &= self.crowd_masks[month].get(CROWD_CODE.get(crowd, -1), 0)
+        return mask
+
+    def zone_ids_from_mask(self, mask):
+        """Decode a zone bitmask into zone IDs."""
+        zone_ids = []
+        while mask:
+            low_bit = mask & -mask
+            zone_ids.append(self.zone_ids[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return zone_ids
+
+    def filter_zone_ids(self, month=None, ranges=(), surf_level=None, crowd=None, surf_level_match="any"):
+        """
+        Return the IDs of zones matching every predicate in the same month.
+
+        - month: month name; when omitted, any month satisfying all predicates matches
+        - ranges: iterable of (metric, low, high), bounds inclusive, None = open
+        - surf_level: SURF_LEVEL_CHOICES values (a single value is accepted too),
+          any / all of which must be in the month's levels (surf_level_match)
+        - crowd: a CROWD_CHOICES value
+        """
+        if month is not None and month not in MONTH_INDEX:
+            return []
+        months = [MONTH_INDEX[month]] if month else range(12)
+        ranges = list(ranges)
+        if isinstance(surf_level, str):
+            surf_level = [surf_level]
+
+        mask = 0
+        for m in months:
+            mask |= self.month_mask(m, ranges, surf_level, crowd, surf_level_match)
+        return self.zone_ids_from_mask(mask)
+
+    # ----------------------------
+    # Month windows
+    # ----------------------------
+    def window_sums(self, metric):
+        """
+        Per-zone prefix sums of a metric over 24 consecutive months, weighted
+        by MONTH_DAYS: (sums, weights), both month-major (`k * zone_count + z`,
+        k = 0..24), so the months [start, start + length) of zone z weigh
+        `weights[(start + length) * count + z] - weights[start * count + z]`.
+        Missing months add nothing to either sum. Built on first use.
+        """
+        if metric not in self._window_sums:
+            count = self.zone_count
+            column = self.metrics[metric]
+            sums = array("d", bytes(8 * count))
+            weights = array("d", bytes(8 * count))
+            for k in range(24):
+                base = (k % 12) * count
+                days = MONTH_DAYS[k % 12]
+                for zone in range(count):
+                    value = column[base + zone]
+                    previous = k * count + zone
+                    if math.isnan(value):
+                        sums.append(sums[previous])
+                        weights.append(weights[previous])
+                    else:
+                        sums.append(sums[previous] + value * days)
+                        weights.append(weights[previous] + days)
+            self._window_sums[metric] = (sums, weights)
+        return self._window_sums[metric]
+
+    def average_mask(self, metric, start, length, low=None, high=None):
+        """Zones whose day-weighted average of a metric over `length` months from `start` lies in [low, high]."""
+        sums, weights = self.window_sums(metric)
+        count = self.zone_count
+        begin, end = start * count, (start + length) * count
+        mask = 0
+        for zone in range(count):
+            weight = weights[end + zone] - weights[begin + zone]
+            if not weight:
+                continue
+            average = (sums[end + zone] - sums[begin + zone]) / weight
+            if (low is None or average >= low) and (high is None or average <= high):
+                mask |= 1 << zone
+        return mask
+
+    def filter_window_zone_ids(self, start, end, match="all", length=None, ranges=(),
+                               surf_level=None, crowd=None, surf_level_match="any"):
+        """
+        Return the IDs of zones matching the predicates over a month window.
+
+        - start / end: month names, inclusive (wraps around the year, e.g.
+          November..February)
+        - match: "all" (every month matches), "any" (at least one month) or
+          "avg" (every month has a condition row matching surf_level / crowd,
+          and ranges hold for the day-weighted average of the metric)
+        - length: with "all" / "avg", a run of `length` consecutive months
+          anywhere in the window is enough (default: the whole window)
+        - ranges / surf_level / crowd / surf_level_match: as in filter_zone_ids
+        """
+        if start not in MONTH_INDEX or end not in MONTH_INDEX or match not in WINDOW_MATCHES:
+            return []
+        first = MONTH_INDEX[start]
+        size = (MONTH_INDEX[end] - first) % 12 + 1
+        months = [(first + i) % 12 for i in range(size)]
+        length = size if length is None else min(length, size)
+        ranges = list(ranges)
+        if isinstance(surf_level, str):
+            surf_level = [surf_level]
+
+        if match == "any":
+            mask = 0
+            for m in months:
+                mask |= self.month_mask(m, ranges, surf_level, crowd, surf_level_match)
+            return self.zone_ids_from_mask(mask)
+
+        if match == "all":
+            month_masks = [self.month_mask(m, ranges, surf_level, crowd, surf_level_match) for m in months]
+        else:
+            month_masks = [self.month_mask(m, (), surf_level, crowd, surf_level_match) for m in months]
+
+        mask = 0
+        for offset in range(size - length + 1):
+            run = month_masks[offset]
+            for month_mask in month_masks[offset + 1:offset + length]:
+                run &= month_mask
+            if match == "avg":
+                for metric, low, high in ranges:
+                    if not run:
+                        break
+                    run &= self.average_mask(metric, first + offset, length, low, high)
+            mask |= run
+        return self.zone_ids_from_mask(mask)
+
+    # ----------------------------
+    # Dense export
+    # ----------------------------
+    def dense(self, metric):
+        """[zone][month] values of an EXPORT_METRICS metric, None when missing (zones in `zone_ids` order)."""
+        if metric == "crowd":
+            flat = [None if code < 0 else code for code in self.crowd]
+        elif metric == "surf_level":
+            flat = [mask if present else None for mask, present in zip(self.surf_level, self.present)]
+        else:
+            cast = int if metric in INTEGER_METRICS else float
+            flat = [None if math.isnan(value) else cast(value) for value in self.metrics[metric]]
+        count = self.zone_count
+        return [flat[zone::count] for zone in range(count)]   # Month-major: a zone's months are `count` apart
+
+
+class MatrixExport:
+    """
+    Encoded JSON exports of a matrix, by metric selection, with their ETags.
+
+    A selection is encoded on first request and kept with the matrix, so it
+    is served as stored bytes until the catalogue changes. At most
+    `max_entries` selections are kept.
+    """
+    max_entries = 64
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+    def body(self, metrics=EXPORT_METRICS):
+        """(JSON bytes, ETag) of the export of `metrics`."""
+        key = tuple(metrics)
+        if key not in self._bodies:
+            body = ORJSONRenderer().render(self.document(key))
+            with self._lock:
+                if len(self._bodies) >= self.max_entries:
+                    self._bodies.pop(next(iter(self._bodies)))
+                self._bodies[key] = (body, quote_etag(hashlib.md5(body).hexdigest()))
+        return self._bodies[key]
+
+    def document(self, metrics):
+        return {
+            "months": MONTHS,
+            "zones": [str(zone_id) for zone_id in self.matrix.zone_ids],
+            "crowd_levels": CROWD_LEVELS,   # crowd values index this list
+            "surf_level_bits": SURF_LEVEL_BIT,   # surf_level values are bitmasks of these
+            "metrics": {metric: self.matrix.dense(metric) for metric in metrics},
+        }
+
+
+# ============================
+# Process-wide index
+# ============================
+class ConditionMatrixIndex(CatalogueIndex):
+    """The condition matrix of the whole catalogue, rebuilt when conditions change."""
+
+    def build(self):
+        return ConditionMatrix(
+            Condition.objects.order_by().values_list(
+                "surfzone_id", "month", "surf_level_mask", "crowd", *NUMERIC_METRICS,
+            )
+        )
+
+
+condition_matrix = ConditionMatrixIndex()
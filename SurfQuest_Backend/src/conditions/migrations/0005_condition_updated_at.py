@@ -0,0 +1,19 @@
+# Generated by Django 5.1.4 on 2026-10-18 16:06
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conditions', '0004_alter_condition_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='condition',
+            name='updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
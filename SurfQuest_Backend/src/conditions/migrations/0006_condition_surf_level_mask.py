@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-18 16:15
+
+import surfzones.bitmasks
+from django.db import migrations
+
+
+def backfill(apps, schema_editor):
+    surfzones.bitmasks.backfill_bitmasks(apps.get_model('conditions', 'Condition'), ("surf_level",))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conditions', '0005_condition_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='condition',
+            name='surf_level_mask',
+            field=surfzones.bitmasks.BitmaskField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:15
+
+import conditions.best_months
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill(apps, schema_editor):
+    conditions.best_months.refresh_best_months(
+        condition_model=apps.get_model('conditions', 'Condition'),
+        score_model=apps.get_model('conditions', 'ZoneMonthScore'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conditions', '0006_condition_surf_level_mask'),
+        ('surfzones', '0029_bbox_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ZoneMonthScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.CharField(choices=[('January', 'January'), ('February', 'February'), ('March', 'March'), ('April', 'April'), ('May', 'May'), ('June', 'June'), ('July', 'July'), ('August', 'August'), ('September', 'September'), ('October', 'October'), ('November', 'November'), ('December', 'December')], max_length=12)),
+                ('score', models.FloatField()),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('surfzone', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='month_scores', to='surfzones.surfzone')),
+            ],
+            options={
+                'ordering': ['surfzone', 'rank'],
+                'indexes': [models.Index(fields=['month', 'rank'], name='month_score_month_rank_idx'), models.Index(fields=['month', '-score'], name='month_score_month_score_idx')],
+                'constraints': [models.UniqueConstraint(fields=('surfzone', 'month'), name='unique_month_score_surfzone_month')],
+            },
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -2,7 +2,8 @@
 Model definitions for surf condition data in the SurfQuest project.
 
 This file defines the Condition model, which stores monthly surf and weather conditions
-for each surf zone, including swell size, water temperature, wind, and user ratings.
+for each surf zone, including swell size, water temperature, wind, and user ratings,
+and the ZoneMonthScore read model computed from them.
 """
 
 # ============================
@@ -17,6 +18,7 @@ from django.db import models   # Base classes for all model definitions
 from django.utils.text import slugify   # Used to generate slugs from surf zone names and months
 from django.core.validators import MinValueValidator, MaxValueValidator   # Ensures field values are within specified ranges
 from django.contrib.postgres.fields import ArrayField   # Enables storing lists in PostgreSQL
+from django.utils import timezone   # Timestamp for the content version stamp
 
 # ============================
 # Local Application Imports
@@ -28,6 +30,7 @@ from surfzones.choices import (  # Reuse shared surf-related choices
     MONTHS_CHOICES,
     SURF_LEVEL_CHOICES,
 )
+from surfzones.bitmasks import BitmaskField, sync_bitmasks   # Integer companion of surf_level
 
 
 # ============================
@@ -63,11 +66,17 @@ class Condition(models.Model):
     wind_direction = models.CharField(max_length=10, choices=SURF_WIND_DIRECTION_CHOICES.choices, blank=True)
     wind_consistency = models.IntegerField(null=True, blank=True)   # % of days with consistent wind
     slug = models.SlugField(max_length=150, blank=True, unique=True)   # Slug for SEO/friendly URLs
+    updated_at = models.DateTimeField(default=timezone.now, editable=False)   # Last change (ETag / Last-Modified)
+    surf_level_mask = BitmaskField(default=0, editable=False)   # Bitmask of surf_level (see surfzones/bitmasks.py)
 
     def save(self, *args, **kwargs):
-        """Automatically generate a slug from surf zone name and month if not set."""
+        """Automatically generate a slug from surf zone name and month if not set, refresh the bitmask and version stamp."""
         if not self.slug:
             self.slug = slugify(f"{self.surfzone.name}-{self.month}")
+        kwargs["update_fields"] = sync_bitmasks(self, ("surf_level",), kwargs.get("update_fields"))
+        self.updated_at = timezone.now()
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "updated_at"}
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -78,4 +87,31 @@ class Condition(models.Model):
         constraints = [
             models.UniqueConstraint(fields=['surfzone', 'month'], name='unique_conditions_surfzone_month')   # Ensure one condition per surf zone per month
         ]
-        ordering = ['surfzone', 'month']   # Order by surf zone and month for easier querying
\ No newline at end of file
+        ordering = ['surfzone', 'month']   # Order by surf zone and month for easier querying
+
+
+class ZoneMonthScore(models.Model):
+    """
+    Computed score of a month for a surf zone, from its Condition row.
+
+    Read model of the best-months engine (see conditions/best_months.py):
+    rewritten for a zone whenever one of its conditions changes, and for the
+    whole catalogue by `manage.py compute_best_months`.
+    """
+    surfzone = models.ForeignKey(SurfZone, on_delete=models.CASCADE, related_name='month_scores')
+    month = models.CharField(max_length=12, choices=MONTHS_CHOICES.choices)
+    score = models.FloatField()   # 0 (worst) .. 1 (best)
+    rank = models.PositiveSmallIntegerField()   # 1 = the zone's best month
+
+    def __str__(self):
+        return f"{self.surfzone_id} {self.month}: {self.score} (#{self.rank})"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['surfzone', 'month'], name='unique_month_score_surfzone_month')
+        ]
+        indexes = [
+            models.Index(fields=['month', 'rank'], name='month_score_month_rank_idx'),   # surfzones-lite top_month filter
+            models.Index(fields=['month', '-score'], name='month_score_month_score_idx'),   # Best zones of a month
+        ]
+        ordering = ['surfzone', 'rank']
@@ -14,6 +14,8 @@ from rest_framework import serializers  # DRF serializer base class
 # Local Application Imports
 # ============================
 from .models import Condition
+from .matrix import EXPORT_METRICS   # Metrics of the matrix endpoint
+from surfzones.choices import MONTHS_CHOICES   # Month of the best-months ranking
 
 
 # ============================
@@ -28,4 +30,39 @@ class ConditionSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = Condition
-        fields = '__all__'  # Serialize all fields from the model
\ No newline at end of file
+        fields = '__all__'  # Serialize all fields from the model
+
+class ConditionMatrixQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the condition matrix endpoint.
+
+    - metrics: comma-separated metrics to export (all of them by default)
+    """
+    metrics = serializers.CharField(required=False)
+
+    def validate_metrics(self, value):
+        metrics = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = [name for name in metrics if name not in EXPORT_METRICS]
+        if unknown:
+            raise serializers.ValidationError(f"Unknown metric(s): {', '.join(unknown)}.")
+        return tuple(name for name in EXPORT_METRICS if name in metrics)   # Canonical order: one cached body per set
+
+
+class BestMonthsQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the best-months endpoint.
+
+    - surfzone_id or surfzone_slug: ranked months of one zone
+    - month: zones ranked by their score for that month
+    - limit: number of zones for month= (default 20)
+    """
+    surfzone_id = serializers.UUIDField(required=False)
+    surfzone_slug = serializers.SlugField(required=False)
+    month = serializers.ChoiceField(choices=MONTHS_CHOICES.choices, required=False)
+    limit = serializers.IntegerField(min_value=1, default=20)
+
+    def validate(self, attrs):
+        zone = "surfzone_id" in attrs or "surfzone_slug" in attrs
+        if zone == ("month" in attrs):
+            raise serializers.ValidationError("Provide either a surf zone (surfzone_id / surfzone_slug) or a month.")
+        return attrs
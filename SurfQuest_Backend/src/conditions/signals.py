@@ -0,0 +1,46 @@
+"""
+Signal handlers for the conditions app.
+
+Saving or deleting a Condition:
+- invalidates the cached API responses;
+- rolls up into `SurfZone.content_updated_at` (zone payloads embed their conditions);
+- recomputes the zone's month scores (see conditions/best_months.py).
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.db.models.signals import post_save, post_delete   # Model lifecycle signals
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import invalidate_catalogue_cache   # Bumps the cached API responses version
+from surfzones.signals import touch_surfzones   # Zone-level "last changed" stamp
+
+# ============================
+# Local Application Imports
+# ============================
+from .models import Condition
+from .best_months import refresh_best_months   # Computed month scores of a zone
+
+
+# ============================
+# Receivers
+# ============================
+def condition_changed(sender, instance, **kwargs):
+    """A zone payload embeds its monthly conditions."""
+    touch_surfzones(pk=instance.surfzone_id)
+
+
+def condition_scores_changed(sender, instance, **kwargs):
+    """The zone's month scores (and their ranks) derive from all its conditions."""
+    refresh_best_months([instance.surfzone_id])
+
+
+post_save.connect(invalidate_catalogue_cache, sender=Condition, dispatch_uid="api-cache-save-Condition")
+post_delete.connect(invalidate_catalogue_cache, sender=Condition, dispatch_uid="api-cache-delete-Condition")
+post_save.connect(condition_changed, sender=Condition, dispatch_uid="version-stamp-save-Condition")
+post_delete.connect(condition_changed, sender=Condition, dispatch_uid="version-stamp-delete-Condition")
+post_save.connect(condition_scores_changed, sender=Condition, dispatch_uid="best-months-save-Condition")
+post_delete.connect(condition_scores_changed, sender=Condition, dispatch_uid="best-months-delete-Condition")
@@ -0,0 +1,112 @@
+"""
+Tests for the computed best months (conditions/best_months.py).
+
+These tests verify that:
+- months are scored from the weighted components and ranked per zone
+- saving or deleting a condition rewrites the zone's scores
+- the best-months endpoint ranks the months of a zone and the zones of a month
+- surfzones-lite filters on top_month / top_month_rank
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Django & Local Imports
+# ============================
+from conditions.best_months import refresh_best_months
+from conditions.models import Condition, ZoneMonthScore
+from surfzones.models import SurfZone, Country, Continent
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def zones(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    country = Country.objects.create(name="Portugal", code="PRT", continent=continent)
+    ericeira = SurfZone.objects.create(name="Ericeira", country=country)
+    peniche = SurfZone.objects.create(name="Peniche", country=country)
+    Condition.objects.create(surfzone=ericeira, month="January", world_surf_rating=5, crowd="Low", water_temp_c=14)
+    Condition.objects.create(surfzone=ericeira, month="July", world_surf_rating=2, crowd="Very High", water_temp_c=20)
+    Condition.objects.create(surfzone=ericeira, month="October", world_surf_rating=4, crowd="Medium")
+    Condition.objects.create(surfzone=peniche, month="January", world_surf_rating=3, crowd="High")
+    return ericeira, peniche
+
+
+def scores_of(zone):
+    return {score.month: (score.score, score.rank) for score in ZoneMonthScore.objects.filter(surfzone=zone)}
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_scores_and_ranks(zones, settings):
+    """Test the weighted components, the ranks, and the configurable weights."""
+    ericeira, peniche = zones
+    scores = scores_of(ericeira)
+    assert [month for month, _ in sorted(scores.items(), key=lambda item: item[1][1])] == ["January", "October", "July"]
+    assert all(0 <= score <= 1 for score, _ in scores.values())
+    assert scores_of(peniche) == {"January": (round((3 * 0.5 + 1 / 3) / 4, 4), 1)}   # Rating 0.5 x3, crowd 1/3 x1
+
+    settings.BEST_MONTH_WEIGHTS = {"surf_rating": 0, "crowd": 0}   # Water temperature only
+    call_command("compute_best_months", stdout=StringIO())
+    assert scores_of(ericeira)["July"][1] == 1
+    assert "October" not in scores_of(ericeira)   # No metric left to score it
+
+
+@pytest.mark.django_db
+def test_signals_refresh_scores(zones):
+    """Test that a condition change rewrites the scores of its zone only."""
+    ericeira, peniche = zones
+    july = Condition.objects.get(surfzone=ericeira, month="July")
+    july.world_surf_rating = 5
+    july.crowd = "Low"
+    july.water_temp_c = 24
+    july.save()
+    assert scores_of(ericeira)["July"][1] == 1
+
+    july.delete()
+    assert set(scores_of(ericeira)) == {"January", "October"}
+
+    ZoneMonthScore.objects.all().delete()
+    assert refresh_best_months([peniche.id]) == 1
+    assert set(scores_of(peniche)) == {"January"} and not scores_of(ericeira)
+
+
+@pytest.mark.django_db
+def test_best_months_endpoint(api_client, zones):
+    """Test the months of a zone, the zones of a month, and parameter validation."""
+    ericeira, peniche = zones
+    data = api_client.get("/api/v1/conditions/best-months/", {"surfzone_slug": ericeira.slug}).json()
+    assert data["surfzone"] == str(ericeira.id)
+    assert [entry["month"] for entry in data["months"]] == ["January", "October", "July"]
+    assert [entry["rank"] for entry in data["months"]] == [1, 2, 3]
+
+    data = api_client.get("/api/v1/conditions/best-months/", {"month": "January", "limit": 1}).json()
+    assert data["count"] == 1 and data["results"][0]["surfzone_name"] == "Ericeira"
+
+    assert api_client.get("/api/v1/conditions/best-months/").status_code == status.HTTP_400_BAD_REQUEST
+    response = api_client.get("/api/v1/conditions/best-months/", {"surfzone_slug": "nowhere"})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_surfzones_lite_top_month(api_client, zones):
+    """Test the top_month filter of surfzones-lite."""
+    url = "/api/v1/surfzones-lite/"
+    names = lambda params: [zone["name"] for zone in api_client.get(url, {"all": "true", **params}).json()]
+    assert names({"top_month": "July"}) == ["Ericeira"]
+    assert names({"top_month": "July", "top_month_rank": 2}) == []
+    assert names({"top_month": "January", "top_month_rank": 1}) == ["Ericeira", "Peniche"]
+    assert api_client.get(url, {"top_month": "Juley"}).status_code == status.HTTP_400_BAD_REQUEST
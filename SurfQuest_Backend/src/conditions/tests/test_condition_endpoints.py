@@ -46,11 +46,11 @@ def sample_condition(db, sample_surfzone):
 
 @pytest.mark.django_db
 def test_list_conditions(api_client, sample_condition):
-    """Test listing all conditions via the endpoint."""
+    """Test listing all conditions via the endpoint (cursor-paginated)."""
     response = api_client.get("/api/v1/conditions/")
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) >= 1
-    assert any(cond["id"] == str(sample_condition.id) for cond in response.data)
+    assert len(response.data["results"]) >= 1
+    assert any(cond["id"] == str(sample_condition.id) for cond in response.data["results"])
 
 
 @pytest.mark.django_db
@@ -61,3 +61,31 @@ def test_retrieve_condition(api_client, sample_condition):
     assert response.status_code == status.HTTP_200_OK
     assert response.data["id"] == str(sample_condition.id)
     assert response.data["month"] == "January"
+
+
+@pytest.mark.django_db
+def test_list_conditions_paginates_with_cursor(api_client, sample_surfzone):
+    """Test that page_size limits the page and the `next` cursor walks the remaining rows."""
+    for month in ("January", "February", "March"):
+        Condition.objects.create(surfzone=sample_surfzone, month=month)
+
+    first = api_client.get("/api/v1/conditions/", {"page_size": 2})
+    assert first.status_code == status.HTTP_200_OK
+    assert len(first.data["results"]) == 2
+    assert first.data["next"] is not None
+
+    second = api_client.get(first.data["next"])
+    assert len(second.data["results"]) == 1
+    assert second.data["next"] is None
+
+    seen = {c["id"] for c in first.data["results"] + second.data["results"]}
+    assert seen == {str(c.id) for c in Condition.objects.all()}
+
+
+@pytest.mark.django_db
+def test_list_conditions_fetch_all(api_client, sample_condition):
+    """Test that all=true returns the plain unpaginated list."""
+    response = api_client.get("/api/v1/conditions/", {"all": "true"})
+    assert response.status_code == status.HTTP_200_OK
+    assert isinstance(response.data, list)
+    assert response.data[0]["id"] == str(sample_condition.id)
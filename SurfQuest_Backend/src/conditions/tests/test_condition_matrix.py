@@ -0,0 +1,113 @@
+"""
+Tests for the in-memory zone x month condition matrix.
+
+These tests verify that:
+- every predicate is evaluated on the same (zone, month) condition row
+- missing (NULL) values never match a range filter
+- surf level and crowd filters use the per-month masks
+- the matrix is rebuilt after a condition change
+- surfzones-lite month filters are answered from the matrix
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework.test import APIClient
+
+# ============================
+# Django & Local Imports
+# ============================
+from conditions.matrix import condition_matrix
+from conditions.models import Condition
+from surfzones.models import SurfZone, Country, Continent
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def sample_country(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    return Country.objects.create(name="Portugal", code="PRT", continent=continent)
+
+@pytest.fixture
+def zones(sample_country):
+    """Ericeira: warm in July, big in January. Peniche: no July water temp."""
+    ericeira = SurfZone.objects.create(name="Ericeira", country=sample_country)
+    peniche = SurfZone.objects.create(name="Peniche", country=sample_country)
+    Condition.objects.create(
+        surfzone=ericeira, month="July", water_temp_c=20, swell_size_meter=0.8,
+        surf_level=["Beginner", "Intermediate"], crowd="High",
+    )
+    Condition.objects.create(
+        surfzone=ericeira, month="January", water_temp_c=14, swell_size_meter=3.0,
+        surf_level=["Advanced"], crowd="Low",
+    )
+    Condition.objects.create(
+        surfzone=peniche, month="July", swell_size_meter=1.2, surf_level=["Beginner"], crowd="Low",
+    )
+    return ericeira, peniche
+
+
+@pytest.mark.django_db
+def test_predicates_apply_to_the_same_month(zones):
+    """Test that warm water in July and big swell in January don't combine."""
+    ericeira, _ = zones
+    matrix = condition_matrix.get()
+
+    ranges = [("water_temp_c", 18, None), ("swell_size_meter", 2.0, None)]
+    assert matrix.filter_zone_ids(ranges=ranges) == []
+    assert matrix.filter_zone_ids(month="July", ranges=ranges[:1]) == [ericeira.pk]
+    assert matrix.filter_zone_ids(ranges=ranges[1:]) == [ericeira.pk]
+
+
+@pytest.mark.django_db
+def test_missing_values_never_match(zones):
+    """Test that a NULL metric is excluded from open and closed ranges."""
+    ericeira, peniche = zones
+    matrix = condition_matrix.get()
+
+    assert matrix.filter_zone_ids(month="July", ranges=[("water_temp_c", None, 30)]) == [ericeira.pk]
+    assert matrix.value("water_temp_c", peniche.pk, "July") is None
+    assert sorted(matrix.filter_zone_ids(month="July")) == sorted([ericeira.pk, peniche.pk])
+
+
+@pytest.mark.django_db
+def test_surf_level_and_crowd_masks(zones):
+    """Test the bitmask-encoded categorical filters."""
+    ericeira, peniche = zones
+    matrix = condition_matrix.get()
+
+    assert matrix.filter_zone_ids(month="July", surf_level="Intermediate") == [ericeira.pk]
+    assert matrix.filter_zone_ids(month="July", crowd="Low") == [peniche.pk]
+    assert matrix.filter_zone_ids(surf_level="Advanced", crowd="Low") == [ericeira.pk]
+    assert matrix.filter_zone_ids(month="Smarch") == []
+
+
+@pytest.mark.django_db
+def test_matrix_rebuilds_after_condition_change(zones):
+    """Test that saving a condition invalidates the matrix."""
+    _, peniche = zones
+    assert condition_matrix.get().filter_zone_ids(month="July", ranges=[("water_temp_c", 18, None)]) != [peniche.pk]
+
+    condition = Condition.objects.get(surfzone=peniche, month="July")
+    condition.water_temp_c = 25
+    condition.save()
+
+    assert peniche.pk in condition_matrix.get().filter_zone_ids(month="July", ranges=[("water_temp_c", 24, None)])
+
+
+@pytest.mark.django_db
+def test_lite_endpoint_month_filters(api_client, zones):
+    """Test that surfzones-lite filters through the matrix with same-month semantics."""
+    response = api_client.get("/api/v1/surfzones-lite/", {
+        "all": "true", "month": "July", "swell_size_meter_min": "1", "crowd": "Low",
+    })
+    assert [zone["name"] for zone in response.json()] == ["Peniche"]
+
+    response = api_client.get("/api/v1/surfzones-lite/", {
+        "all": "true", "water_temp_c_min": "18", "swell_size_meter_min": "2",
+    })
+    assert response.json() == []
@@ -0,0 +1,89 @@
+"""
+Tests for the dense condition matrix endpoint (/api/v1/conditions/matrix/).
+
+These tests verify that:
+- metrics are [zone][month] arrays in the order of the zone-id and month headers
+- integer metrics stay integers, missing values are null
+- crowd and surf level are encoded against their headers
+- the metric selection and the ETag / 304 revalidation work, and a change
+  to a condition moves the ETag
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Django & Local Imports
+# ============================
+from conditions.matrix import EXPORT_METRICS
+from conditions.models import Condition
+from surfzones.models import SurfZone, Country, Continent
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def zones(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    country = Country.objects.create(name="Portugal", code="PRT", continent=continent)
+    ericeira = SurfZone.objects.create(name="Ericeira", country=country)
+    peniche = SurfZone.objects.create(name="Peniche", country=country)
+    Condition.objects.create(
+        surfzone=ericeira, month="July", water_temp_c=20, swell_size_meter=0.8,
+        surf_level=["Beginner", "Intermediate"], crowd="High",
+    )
+    Condition.objects.create(surfzone=peniche, month="January", swell_size_meter=3.0, crowd="Low")
+    return ericeira, peniche
+
+
+@pytest.mark.django_db
+def test_matrix_layout(api_client, zones):
+    """Test the headers and the dense [zone][month] arrays."""
+    ericeira, peniche = zones
+    data = api_client.get("/api/v1/conditions/matrix/").json()
+    assert data["months"][0] == "January" and len(data["months"]) == 12
+    assert list(data["metrics"]) == list(EXPORT_METRICS)
+
+    row = {zone_id: i for i, zone_id in enumerate(data["zones"])}
+    water = data["metrics"]["water_temp_c"]
+    assert water[row[str(ericeira.id)]] == [None] * 6 + [20] + [None] * 5
+    assert water[row[str(peniche.id)]] == [None] * 12
+    assert data["metrics"]["swell_size_meter"][row[str(peniche.id)]][0] == 3.0
+
+    crowd = data["metrics"]["crowd"][row[str(ericeira.id)]][6]
+    assert data["crowd_levels"][crowd] == "High"
+    levels = data["metrics"]["surf_level"][row[str(ericeira.id)]][6]
+    assert levels == data["surf_level_bits"]["Beginner"] | data["surf_level_bits"]["Intermediate"]
+    assert data["metrics"]["surf_level"][row[str(ericeira.id)]][0] is None
+
+
+@pytest.mark.django_db
+def test_metric_selection(api_client, zones):
+    """Test that metrics= keeps the selected metrics, in canonical order, and rejects unknown ones."""
+    data = api_client.get("/api/v1/conditions/matrix/", {"metrics": "sunny_days,water_temp_c"}).json()
+    assert list(data["metrics"]) == ["water_temp_c", "sunny_days"]
+
+    response = api_client.get("/api/v1/conditions/matrix/", {"metrics": "water_temp_c,slug"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "slug" in response.json()["metrics"][0]
+
+
+@pytest.mark.django_db
+def test_matrix_etag(api_client, zones):
+    """Test revalidation, and that updating a condition changes the matrix."""
+    etag = api_client.get("/api/v1/conditions/matrix/")["ETag"]
+    response = api_client.get("/api/v1/conditions/matrix/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    condition = Condition.objects.get(month="July")
+    condition.water_temp_c = 22
+    condition.save()
+    response = api_client.get("/api/v1/conditions/matrix/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert 22 in sum(response.json()["metrics"]["water_temp_c"], [])
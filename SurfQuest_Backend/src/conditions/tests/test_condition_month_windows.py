@@ -0,0 +1,96 @@
+"""
+Tests for the month window search of the condition matrix.
+
+These tests verify that:
+- all / any / avg evaluate the predicates over every month of the window
+- averages are weighted by the days of each month
+- window_length accepts any run of consecutive months within the window
+- windows wrap around the year
+- surfzones-lite exposes the window and validates its parameters
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Django & Local Imports
+# ============================
+from conditions.matrix import condition_matrix
+from conditions.models import Condition
+from surfzones.models import SurfZone, Country, Continent
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def zones(db):
+    """Ericeira: warm all summer. Peniche: warm in July only. Taghazout: warm in winter."""
+    continent = Continent.objects.create(name="Europe", code="EU")
+    country = Country.objects.create(name="Portugal", code="PRT", continent=continent)
+    temperatures = {
+        "Ericeira": {"June": 18, "July": 20, "August": 21, "September": 19},
+        "Peniche": {"June": 14, "July": 22, "August": 15, "September": 17},
+        "Taghazout": {"November": 20, "December": 19, "January": 18, "February": 17},
+    }
+    zones = {}
+    for name, months in temperatures.items():
+        zones[name] = SurfZone.objects.create(name=name, country=country)
+        for month, water_temp_c in months.items():
+            Condition.objects.create(surfzone=zones[name], month=month, water_temp_c=water_temp_c, crowd="Low")
+    return zones
+
+
+def names(zones, zone_ids):
+    return sorted(name for name, zone in zones.items() if zone.id in zone_ids)
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_window_matches(zones):
+    """Test all-of, any-of and the weighted average over June..September."""
+    matrix = condition_matrix.get()
+    warm = [("water_temp_c", 18, None)]
+    assert names(zones, matrix.filter_window_zone_ids("June", "September", "all", ranges=warm)) == ["Ericeira"]
+    assert names(zones, matrix.filter_window_zone_ids("June", "September", "any", ranges=warm)) == ["Ericeira", "Peniche"]
+
+    # Peniche: (14*30 + 22*31 + 15*31 + 17*30) / 122 = 17.02
+    mild = [("water_temp_c", 17, None)]
+    assert names(zones, matrix.filter_window_zone_ids("June", "September", "all", ranges=mild)) == ["Ericeira"]
+    assert names(zones, matrix.filter_window_zone_ids("June", "September", "avg", ranges=mild)) == ["Ericeira", "Peniche"]
+    assert names(zones, matrix.filter_window_zone_ids("June", "September", "avg", ranges=[("water_temp_c", 17.03, None)])) == ["Ericeira"]
+    assert matrix.filter_window_zone_ids("June", "September", "avg", ranges=mild, crowd="High") == []
+
+
+@pytest.mark.django_db
+def test_window_length_and_wrap(zones):
+    """Test runs of consecutive months and windows across the new year."""
+    matrix = condition_matrix.get()
+    warm = [("water_temp_c", 18, None)]
+    assert names(zones, matrix.filter_window_zone_ids("June", "September", "all", length=2, ranges=warm)) == ["Ericeira"]
+    assert names(zones, matrix.filter_window_zone_ids("June", "September", "all", length=1, ranges=warm)) == ["Ericeira", "Peniche"]
+    assert names(zones, matrix.filter_window_zone_ids("November", "February", "all", length=3, ranges=warm)) == ["Taghazout"]
+    assert matrix.filter_window_zone_ids("November", "February", "all", ranges=warm) == []   # February: 17
+    assert names(zones, matrix.filter_window_zone_ids("November", "February", "avg", ranges=warm)) == ["Taghazout"]
+
+
+@pytest.mark.django_db
+def test_surfzones_lite_window(api_client, zones):
+    """Test the window parameters of surfzones-lite."""
+    url = "/api/v1/surfzones-lite/"
+    get = lambda **params: api_client.get(url, {"all": "true", **params})
+    response = get(window_start="June", window_end="September", window_match="avg", water_temp_c_min=17)
+    assert [zone["name"] for zone in response.json()] == ["Ericeira", "Peniche"]
+    response = get(window_start="June", window_end="September", window_length=2, water_temp_c_min=18)
+    assert [zone["name"] for zone in response.json()] == ["Ericeira"]
+
+    response = get(window_start="June", window_end="Septembre", window_match="most", window_length=13, month="July")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert set(response.json()) == {"window_end", "window_match", "window_length", "month"}
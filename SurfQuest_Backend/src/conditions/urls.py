@@ -17,7 +17,7 @@ from rest_framework.routers import DefaultRouter   # Import DRF's router to auto
 # ============================
 # Local Imports
 # ============================
-from .views import ConditionViewSet   # Import the ViewSet that manages surf conditions
+from .views import ConditionViewSet, ConditionMatrixAPIView, BestMonthsAPIView   # Import the ViewSet that manages surf conditions
 
 
 # ============================
@@ -30,5 +30,7 @@ router.register(r'conditions', ConditionViewSet)   # Register condition endpoint
 # URL Patterns
 # ============================
 urlpatterns = [
+    path('conditions/matrix/', ConditionMatrixAPIView.as_view(), name='conditions-matrix'),   # Before the router: not a condition id
+    path('conditions/best-months/', BestMonthsAPIView.as_view(), name='conditions-best-months'),   # Before the router: not a condition id
     path('', include(router.urls)),   # Include all ViewSet-generated routes
 ]
\ No newline at end of file
@@ -8,25 +8,120 @@ via a read-only API endpoint using Django REST Framework.
 # ============================
 # Django REST Framework Imports
 # ============================
+from django.conf import settings   # API_MAX_PAGE_SIZE
+from django.shortcuts import get_object_or_404   # 404 on unknown zone
 from rest_framework import viewsets  # Base class for building ViewSets
+from rest_framework.response import Response   # Best-months rankings
+from rest_framework.permissions import AllowAny   # Public catalogue data
+from rest_framework.views import APIView   # Matrix endpoint
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.pagination import IdCursorPagination   # Keyset pagination ordered by id
+from surfquest.cache import CachedResponseMixin   # Cached responses, invalidated on catalogue changes
+from surfquest.conditional import ConditionalGetMixin, precomputed_response   # ETag / Last-Modified from version stamps; precomputed bodies
+from surfquest.async_views import AsyncReadOnlyMixin   # Async dispatch in ASGI serving mode
 
 # ============================
 # Local Application Imports
 # ============================
-from .models import Condition
-from .serializers import ConditionSerializer
+from surfzones.models import SurfZone   # Zone of the best-months ranking
+from .models import Condition, ZoneMonthScore
+from .serializers import ConditionSerializer, ConditionMatrixQuerySerializer, BestMonthsQuerySerializer
+from .matrix import condition_matrix, EXPORT_METRICS   # In-memory zone x month matrix
 
 
 # ============================
 # ViewSets
 # ============================
-class ConditionViewSet(viewsets.ModelViewSet):
+class ConditionViewSet(ConditionalGetMixin, CachedResponseMixin, AsyncReadOnlyMixin, viewsets.ModelViewSet):
     """
     ViewSet for the Condition model.
 
     Provides read-only access to all surf condition records.
     Only GET requests are allowed.
+    The list is cursor-paginated (page_size / cursor), or unpaginated with all=true.
     """
     queryset = Condition.objects.all()
     serializer_class = ConditionSerializer
+    pagination_class = IdCursorPagination
     http_method_names = ['get']   # Restrict to read-only access
+
+
+# ============================
+# Matrix
+# ============================
+class ConditionMatrixAPIView(APIView):
+    """
+    Conditions of every zone for every month, as dense arrays.
+
+    Query params (see ConditionMatrixQuerySerializer):
+    - metrics: e.g. water_temp_c,sunny_days (default: every metric)
+
+    Response: `zones` (zone IDs, the row order), `months` (the column order)
+    and, for each metric, `metrics[name][zone][month]` (null when missing).
+    `crowd` values index `crowd_levels`; `surf_level` values are bitmasks of
+    `surf_level_bits`.
+
+    Encoded once per catalogue version and metric set from the in-memory
+    matrix (see conditions/matrix.py), and served with an ETag.
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ["get"]
+
+    def get(self, request, *args, **kwargs):
+        query = ConditionMatrixQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        metrics = query.validated_data.get("metrics") or EXPORT_METRICS
+
+        body, etag = condition_matrix.get().export.body(metrics)
+        return precomputed_response(request, body, etag, "application/json")
+
+
+# ============================
+# Best months
+# ============================
+class BestMonthsAPIView(APIView):
+    """
+    Computed best months (see conditions/best_months.py).
+
+    Query params (see BestMonthsQuerySerializer):
+    - surfzone_id or surfzone_slug: every scored month of the zone, best first
+    - month: the zones scoring best that month (limit, default 20, capped
+      at settings.API_MAX_PAGE_SIZE)
+
+    Scores (0..1) and ranks are read from the precomputed ZoneMonthScore
+    table: no scoring happens per request.
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ["get"]
+
+    def get(self, request, *args, **kwargs):
+        query = BestMonthsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        if "month" in params:
+            limit = min(params["limit"], settings.API_MAX_PAGE_SIZE)
+            scores = (
+                ZoneMonthScore.objects
+                .filter(month=params["month"])
+                .select_related("surfzone")
+                .order_by("-score", "surfzone__name")[:limit]
+            )
+            results = [self.zone_entry(score.surfzone, [score]) for score in scores]
+            return Response({"month": params["month"], "count": len(results), "results": results})
+
+        lookup = {"id": params["surfzone_id"]} if "surfzone_id" in params else {"slug": params["surfzone_slug"]}
+        zone = get_object_or_404(SurfZone.objects.only("id", "name", "slug"), **lookup)
+        return Response(self.zone_entry(zone, zone.month_scores.order_by("rank")))
+
+    @staticmethod
+    def zone_entry(zone, scores):
+        return {
+            "surfzone": zone.id,
+            "surfzone_name": zone.name,
+            "surfzone_slug": zone.slug,
+            "months": [{"month": s.month, "score": s.score, "rank": s.rank} for s in scores],
+        }
@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures for the SurfQuest backend test suite.
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+
+# ============================
+# Django Imports
+# ============================
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache (the local-memory cache outlives test transactions)."""
+    cache.clear()
+    yield
+    cache.clear()
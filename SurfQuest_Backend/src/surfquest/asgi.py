@@ -1,17 +1,39 @@
 """
-ASGI config for surfquest project.
+ASGI configuration for the `surfquest` project.
+
+Used in ASGI serving mode (SERVER_MODE=asgi): gunicorn runs uvicorn workers
+on this application and the read-only API views are dispatched
+asynchronously (see surfquest/async_views.py).
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
-For more information on this file, see
+For more information, see:
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
 
-import os
-from django.core.asgi import get_asgi_application
+import os   # Provides functions to interact with the operating system
+from django.core.asgi import get_asgi_application   # Imports the function to get the ASGI application
+
+# ============================
+# Environment-Specific Settings
+# ============================
+
+# Same settings module resolution as wsgi.py: 'surfquest.settings.<DJANGO_ENV>'
+environment = os.getenv('DJANGO_ENV', 'dev')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', f'surfquest.settings.{environment}')
 
-# Set the default Django settings module for ASGI applications.
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'surfquest.settings')
+# ASGI mode also when started directly (e.g. `uvicorn surfquest.asgi:application`)
+os.environ.setdefault('SERVER_MODE', 'asgi')
 
-# Get the default ASGI application callable.
+# ============================
+# ASGI Application
+# ============================
+
+# Create the ASGI application object for the server to use
 application = get_asgi_application()
+
+# Build the in-memory typeahead index and marker clusters before the first request
+from surfzones.autocomplete import autocomplete_index   # noqa: E402 (needs the app registry)
+from surfzones.clusters import cluster_index   # noqa: E402
+autocomplete_index.warm()
+cluster_index.warm()
@@ -0,0 +1,133 @@
+"""
+Asynchronous dispatch of the read-only API views (ASGI serving mode).
+
+With SERVER_MODE=asgi (see Dockerfile.prod.backend), gunicorn runs uvicorn
+workers on `surfquest.asgi` and the views using `AsyncReadOnlyMixin` answer
+GET / HEAD requests from a coroutine:
+
+- version stamps and retrieve lookups use the async ORM (`aaggregate`,
+  `aget`, `async for`), and the response cache its async API;
+- authentication / permissions, cursor pagination and serializers are
+  synchronous DRF code that may query the database: they run through
+  `sync_to_async`, in the per-request thread the async ORM uses as well.
+
+The event loop is never blocked on the database or on a slow client, so a
+few workers hold many concurrent connections, where each sync worker is tied
+up by one request until its response is fully sent.
+
+Other methods (OPTIONS, 405s...) and SERVER_MODE=wsgi keep DRF's regular
+synchronous dispatch. `ConditionalGetMixin` and `CachedResponseMixin`
+provide the async counterparts (`alist` / `aretrieve`) of their hooks,
+so ETags and cached payloads are identical in both modes.
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+from asgiref.sync import markcoroutinefunction, sync_to_async   # Coroutine views / sync DRF code
+
+# ============================
+# Django Imports
+# ============================
+from django.conf import settings   # ASYNC_API_VIEWS
+from django.core.exceptions import ValidationError   # Malformed lookup value (e.g. bad UUID)
+from django.http import Http404   # Unknown object
+
+# ============================
+# Django REST Framework Imports
+# ============================
+from rest_framework.mixins import RetrieveModelMixin   # Detect detail views
+from rest_framework.response import Response   # Serialized payloads
+
+
+ASYNC_METHODS = ("GET", "HEAD")
+
+
+class AsyncReadOnlyMixin:
+    """
+    Serve `list` / `retrieve` asynchronously when `async_mode` is on.
+
+    `async_mode` defaults to settings.ASYNC_API_VIEWS and can be forced per
+    route with `View.as_view(async_mode=True)`. Place this mixin after
+    ConditionalGetMixin / CachedResponseMixin and before the DRF base class.
+    """
+    async_mode = False
+
+    @classmethod
+    def as_view(cls, *args, **initkwargs):
+        initkwargs.setdefault("async_mode", settings.ASYNC_API_VIEWS)
+        view = super().as_view(*args, **initkwargs)
+        if initkwargs["async_mode"]:
+            markcoroutinefunction(view)   # `dispatch` returns a coroutine: let Django await it
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.async_mode:
+            return self.adispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        """`APIView.dispatch` for read requests, awaiting the `a<action>` handler."""
+        if request.method not in ASYNC_METHODS or request.method.lower() not in self.http_method_names:
+            return await sync_to_async(super().dispatch)(request, *args, **kwargs)
+
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            # Authentication (JWT user lookup), permissions and throttling may query the database
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            response = await self.get_async_handler()(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    def get_async_handler(self):
+        """Coroutine handling the current action (synchronous handler run in a thread as a fallback)."""
+        action = getattr(self, "action", None)   # ViewSets: set from the router's action map
+        if action is None:   # Generic views implement a single read action
+            action = "retrieve" if isinstance(self, RetrieveModelMixin) else "list"
+        handler = getattr(self, f"a{action}", None)
+        return handler or sync_to_async(getattr(self, action))
+
+    # ----------------------------
+    # Async ORM helpers
+    # ----------------------------
+    async def aget_filtered_queryset(self):
+        """`filter_queryset(get_queryset())`, built in a thread: filters may read lazily built indexes."""
+        return await sync_to_async(lambda: self.filter_queryset(self.get_queryset()))()
+
+    async def aget_object(self):
+        """Async `get_object()`: 404 on unknown or malformed lookup values."""
+        queryset = await self.aget_filtered_queryset()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            instance = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+        await sync_to_async(self.check_object_permissions)(self.request, instance)
+        return instance
+
+    async def aserialize(self, instance, many=False):
+        """Serialized data, built in a thread: serializers may lazily load related rows."""
+        return await sync_to_async(lambda: self.get_serializer(instance, many=many).data)()
+
+    # ----------------------------
+    # Actions
+    # ----------------------------
+    async def alist(self, request, *args, **kwargs):
+        queryset = await self.aget_filtered_queryset()
+        page = await sync_to_async(self.paginate_queryset)(queryset)
+        if page is not None:
+            return self.get_paginated_response(await self.aserialize(page, many=True))
+        instances = [instance async for instance in queryset]   # "fetch all" mode
+        return Response(await self.aserialize(instances, many=True))
+
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        return Response(await self.aserialize(instance))
@@ -0,0 +1,162 @@
+"""
+Response cache for the public, read-only catalogue API.
+
+Surf zones, surf spots and conditions only change through the admin, so the
+serialized payloads of their GET endpoints can be reused between requests.
+
+- Cache keys are built from the absolute URL path plus the normalized
+  (sorted) query parameters, so `?a=1&b=2` and `?b=2&a=1` share an entry.
+- Every key embeds a catalogue "version". Saving or deleting a catalogue row
+  bumps that version (see the `signals.py` modules of surfzones/conditions),
+  which orphans every cached response of the processes sharing the cache.
+- Every key also embeds the response's ETag, computed from the database by
+  ConditionalGetMixin (which runs first). A body is therefore only served
+  under the validators it was built with: a worker that missed a version
+  bump (per-process cache) misses the entry instead of pairing a stale body
+  with a fresh ETag.
+- The backend is the Django `default` cache: local memory out of the box,
+  or any shared backend (Redis, Memcached...) configured via CACHE_BACKEND /
+  CACHE_LOCATION so that all workers see the same entries and invalidations.
+  Production settings require a shared backend with several workers.
+
+Note: bulk `QuerySet.update()` / `bulk_create()` bypass model signals; code
+doing so must call `invalidate_catalogue_cache()` itself.
+"""
+
+# ============================
+# Standard Library
+# ============================
+import hashlib   # Short, fixed-length cache keys
+import time   # Seed value for the catalogue version
+from urllib.parse import urlencode   # Normalized query string
+
+# ============================
+# Django Imports
+# ============================
+from django.conf import settings   # API_CACHE_TIMEOUT
+from django.core.cache import cache   # Default cache backend
+from django.db import transaction   # Bump again once changes are committed
+
+# ============================
+# Django REST Framework Imports
+# ============================
+from rest_framework import status   # HTTP status codes
+from rest_framework.response import Response   # Response built from cached data
+
+
+CATALOGUE_VERSION_KEY = "api:catalogue:version"
+
+
+# ============================
+# Versioning & Keys
+# ============================
+def get_catalogue_version():
+    """Return the current catalogue version, initializing it if needed."""
+    version = cache.get(CATALOGUE_VERSION_KEY)
+    if version is None:
+        # Seed with a timestamp: if the key was evicted, old entries can't be revived.
+        cache.add(CATALOGUE_VERSION_KEY, time.time_ns(), None)
+        version = cache.get(CATALOGUE_VERSION_KEY)
+    return version
+
+
+def bump_catalogue_version():
+    """Increment the catalogue version (re-seed it if missing)."""
+    try:
+        cache.incr(CATALOGUE_VERSION_KEY)
+    except ValueError:   # Key missing (never set or evicted)
+        cache.add(CATALOGUE_VERSION_KEY, time.time_ns(), None)
+
+
+def invalidate_catalogue_cache(**kwargs):
+    """
+    Bump the catalogue version so that every cached response becomes unreachable.
+
+    The version is bumped right away and once more when the surrounding
+    transaction commits: a request running between the two could otherwise
+    cache (or index) pre-commit data under the new version.
+    Accepts (and ignores) signal keyword arguments so it can be used as a receiver.
+    """
+    bump_catalogue_version()
+    transaction.on_commit(bump_catalogue_version)
+
+
+def normalize_query_params(query_params):
+    """Return a canonical query string: keys sorted, repeated values sorted."""
+    items = []
+    for key in sorted(query_params.keys()):
+        for value in sorted(query_params.getlist(key)):
+            items.append((key, value))
+    return urlencode(items)
+
+
+def build_cache_key(request, namespace="catalogue", etag=None):
+    """
+    Build the cache key of a request.
+
+    The absolute path (scheme + host) is part of the key because payloads
+    embed absolute image URLs and pagination links. `etag` is the ETag the
+    response will carry, when known.
+    """
+    url = f"{request.build_absolute_uri(request.path)}?{normalize_query_params(request.query_params)}|{etag or ''}"
+    digest = hashlib.md5(url.encode("utf-8")).hexdigest()
+    return f"api:{namespace}:{get_catalogue_version()}:{digest}"
+
+
+# ============================
+# View Mixin
+# ============================
+class CachedResponseMixin:
+    """
+    Cache the data of successful `list` / `retrieve` responses.
+
+    Only meant for public (AllowAny) GET endpoints whose payload does not
+    depend on the authenticated user. Responses carry an `X-Cache` header
+    (`HIT` or `MISS`). Entries are keyed on `response_etag`, set by
+    ConditionalGetMixin before the handler runs.
+    """
+    cache_namespace = "catalogue"
+    response_etag = None
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    # Async counterparts (ASGI serving mode, see surfquest/async_views.py)
+    async def alist(self, request, *args, **kwargs):
+        return await self.acached_response(super().alist, request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await self.acached_response(super().aretrieve, request, *args, **kwargs)
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        """Serve from the cache, or run `handler` and store its data."""
+        key = build_cache_key(request, self.cache_namespace, self.response_etag)
+        data = cache.get(key)
+        if data is not None:
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, settings.API_CACHE_TIMEOUT)
+        response["X-Cache"] = "MISS"
+        return response
+
+    async def acached_response(self, handler, request, *args, **kwargs):
+        """`cached_response` awaiting an async `handler`, through the cache's async API."""
+        key = build_cache_key(request, self.cache_namespace, self.response_etag)
+        data = await cache.aget(key)
+        if data is not None:
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+            return response
+
+        response = await handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            await cache.aset(key, response.data, settings.API_CACHE_TIMEOUT)
+        response["X-Cache"] = "MISS"
+        return response
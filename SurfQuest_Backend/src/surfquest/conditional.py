@@ -0,0 +1,153 @@
+"""
+Conditional GET support (ETag / Last-Modified) for the catalogue API.
+
+Validators are computed from per-entity version stamps (`updated_at`,
+`SurfZone.content_updated_at`) with a single aggregate query, never from the
+serialized body. A request carrying a matching `If-None-Match` (or, on detail
+endpoints, `If-Modified-Since`) gets a 304 before any serializer runs, and
+before the response cache is consulted.
+
+- List ETag: hash of URL + normalized query + (max stamp, row count) of the
+  filtered queryset. The row count catches deletions, which leave no stamp.
+- Detail ETag: hash of URL + the object's stamp; `Last-Modified` is the stamp.
+  Lists send no `Last-Modified`: a deleted row does not move the max stamp,
+  so a date alone could not detect it.
+"""
+
+# ============================
+# Standard Library
+# ============================
+import hashlib   # ETag digest
+
+# ============================
+# Third-Party Imports
+# ============================
+from asgiref.sync import sync_to_async   # Build querysets outside the event loop
+
+# ============================
+# Django Imports
+# ============================
+from django.db.models import Count, Max   # Aggregate version stamps
+from django.http import HttpResponse   # Precomputed bodies
+from django.utils.cache import get_conditional_response, patch_cache_control   # RFC 7232 precondition evaluation
+from django.utils.http import http_date, quote_etag   # Header formatting
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import normalize_query_params   # Canonical query string
+
+
+# ============================
+# Precomputed bodies
+# ============================
+def precomputed_response(request, body, etag, content_type):
+    """
+    Response of a body encoded ahead of time (in-memory indexes), with its
+    ETag: a 304 when the client copy is current, else the bytes as is.
+    """
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(body, content_type=content_type)
+    response["ETag"] = etag
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+# ============================
+# View Mixin
+# ============================
+class ConditionalGetMixin:
+    """
+    Add ETag (and Last-Modified on detail) to `list` / `retrieve` responses.
+
+    `version_field` is the field or expression whose maximum versions a row,
+    e.g. "updated_at" or Greatest("updated_at", "surfzone__content_updated_at").
+    Place this mixin before CachedResponseMixin so that 304s skip the cache too.
+    """
+    version_field = "updated_at"
+
+    def list(self, request, *args, **kwargs):
+        stamps = self.filter_queryset(self.get_queryset()).aggregate(
+            last_changed=Max(self.version_field), count=Count("pk"),
+        )
+        return self.conditional_response(
+            super().list, request, *args,
+            validators=(stamps["last_changed"], stamps["count"]), last_modified=None, **kwargs,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        stamps = self.get_queryset().filter(**{self.lookup_field: kwargs[lookup_url_kwarg]}).aggregate(
+            last_changed=Max(self.version_field),
+        )
+        last_changed = stamps["last_changed"]
+        if last_changed is None:   # Unknown object: let the view answer 404
+            return super().retrieve(request, *args, **kwargs)
+        return self.conditional_response(
+            super().retrieve, request, *args,
+            validators=(last_changed,), last_modified=last_changed, **kwargs,
+        )
+
+    # Async counterparts (ASGI serving mode, see surfquest/async_views.py)
+    async def alist(self, request, *args, **kwargs):
+        queryset = await self.aget_filtered_queryset()
+        stamps = await queryset.aaggregate(last_changed=Max(self.version_field), count=Count("pk"))
+        return await self.aconditional_response(
+            super().alist, request, *args,
+            validators=(stamps["last_changed"], stamps["count"]), last_modified=None, **kwargs,
+        )
+
+    async def aretrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = await sync_to_async(self.get_queryset)()
+        stamps = await queryset.filter(**{self.lookup_field: kwargs[lookup_url_kwarg]}).aaggregate(
+            last_changed=Max(self.version_field),
+        )
+        last_changed = stamps["last_changed"]
+        if last_changed is None:   # Unknown object: let the view answer 404
+            return await super().aretrieve(request, *args, **kwargs)
+        return await self.aconditional_response(
+            super().aretrieve, request, *args,
+            validators=(last_changed,), last_modified=last_changed, **kwargs,
+        )
+
+    def build_etag(self, request, validators):
+        """Strong ETag: identical validators (and URL / format) yield an identical body."""
+        parts = [
+            request.build_absolute_uri(request.path),
+            normalize_query_params(request.query_params),
+            request.META.get("HTTP_ACCEPT", ""),
+            *(v.isoformat() if hasattr(v, "isoformat") else str(v) for v in validators),
+        ]
+        return quote_etag(hashlib.md5("|".join(parts).encode("utf-8")).hexdigest())
+
+    def conditional_response(self, handler, request, *args, validators, last_modified, **kwargs):
+        """Answer 304 when the client copy is current, otherwise run `handler` and tag the response."""
+        etag, timestamp, not_modified = self.evaluate_preconditions(request, validators, last_modified)
+        if not_modified is not None:
+            return not_modified
+        return self.tag_response(handler(request, *args, **kwargs), etag, timestamp)
+
+    async def aconditional_response(self, handler, request, *args, validators, last_modified, **kwargs):
+        """`conditional_response` awaiting an async `handler`."""
+        etag, timestamp, not_modified = self.evaluate_preconditions(request, validators, last_modified)
+        if not_modified is not None:
+            return not_modified
+        return self.tag_response(await handler(request, *args, **kwargs), etag, timestamp)
+
+    def evaluate_preconditions(self, request, validators, last_modified):
+        """Return (etag, Last-Modified timestamp, 304 response or None); the ETag also keys the response cache."""
+        etag = self.build_etag(request, validators)
+        self.response_etag = etag
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        return etag, timestamp, get_conditional_response(request, etag=etag, last_modified=timestamp)
+
+    def tag_response(self, response, etag, timestamp):
+        """Add the validators to a 200 response."""
+        if response.status_code == 200:
+            response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+            patch_cache_control(response, no_cache=True)   # Always revalidate, 304s keep it cheap
+        return response
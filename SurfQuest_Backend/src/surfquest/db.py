@@ -0,0 +1,126 @@
+"""
+Database connection management.
+
+Opening a (TLS) connection to a remote PostgreSQL host costs several round
+trips, often more than the query itself on small endpoints. Two strategies
+are available, selected per environment through environment variables:
+
+- Persistent connections (default): each worker thread keeps its connection
+  for DB_CONN_MAX_AGE seconds, and Django checks it is still alive before
+  reusing it (DB_CONN_HEALTH_CHECKS).
+- Connection pool (DB_POOL=True): a psycopg 3 `psycopg_pool.ConnectionPool`
+  per worker process, sized with DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE.
+  Requests borrow a connection and give it back at the end. This requires
+  the `psycopg` and `psycopg-pool` packages. When they are missing, a warning
+  is emitted and persistent connections are used instead.
+
+In ASGI serving mode (SERVER_MODE=asgi) requests don't reuse a worker
+thread, so persistent connections would pile up: DB_CONN_MAX_AGE defaults to
+0 there, and the pool is the recommended way to reuse connections.
+
+Environment variables:
+    DB_CONN_MAX_AGE          seconds, or "None" for unlimited (default per settings module, 0 under ASGI)
+    DB_CONN_HEALTH_CHECKS    "True" / "False" (default True)
+    DB_CONNECT_TIMEOUT       seconds to establish a connection (default 5)
+    DB_POOL                  "True" / "False" (default False)
+    DB_POOL_MIN_SIZE         connections kept open per process (default 2)
+    DB_POOL_MAX_SIZE         maximum connections per process (default 10)
+    DB_POOL_TIMEOUT          seconds a request waits for a free connection (default 10)
+    DB_POOL_MAX_IDLE         seconds before an idle extra connection is closed (default 300)
+
+Settings modules call `connection_settings()` and merge the result into
+`DATABASES["default"]`; `connection_stats()` reports what is in use.
+"""
+
+# ============================
+# Standard Library
+# ============================
+import importlib.util   # Detect optional pool dependencies without importing them
+import os   # Environment variables
+import warnings   # Report a pool requested without its dependencies
+
+
+TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+def _env_bool(name, default):
+    return os.getenv(name, str(default)).strip().lower() in TRUE_VALUES
+
+
+def _env_int(name, default):
+    return int(os.getenv(name, default))
+
+
+def pool_available():
+    """True when the psycopg 3 driver and psycopg_pool are installed."""
+    return all(importlib.util.find_spec(module) for module in ("psycopg", "psycopg_pool"))
+
+
+# ============================
+# Settings
+# ============================
+def connection_settings(default_conn_max_age=0):
+    """
+    Connection keys to merge into a PostgreSQL `DATABASES` entry.
+
+    `default_conn_max_age` is the environment's default for DB_CONN_MAX_AGE
+    (e.g. 0 in development, 60 in production).
+    """
+    if os.getenv("SERVER_MODE", "wsgi").strip().lower() == "asgi":
+        default_conn_max_age = 0   # Each request runs in a new thread: persistent connections would leak
+    conn_max_age = os.getenv("DB_CONN_MAX_AGE", str(default_conn_max_age))
+    conn_max_age = None if conn_max_age.strip().lower() == "none" else int(conn_max_age)
+
+    options = {"connect_timeout": _env_int("DB_CONNECT_TIMEOUT", 5)}
+
+    if _env_bool("DB_POOL", False):
+        if pool_available():
+            options["pool"] = {
+                "min_size": _env_int("DB_POOL_MIN_SIZE", 2),
+                "max_size": _env_int("DB_POOL_MAX_SIZE", 10),
+                "timeout": _env_int("DB_POOL_TIMEOUT", 10),
+                "max_idle": _env_int("DB_POOL_MAX_IDLE", 300),
+            }
+            conn_max_age = 0   # Django refuses persistent connections on top of a pool
+        else:
+            warnings.warn(
+                "DB_POOL is enabled but psycopg 3 / psycopg_pool is not installed: "
+                "falling back to persistent connections.",
+                RuntimeWarning,
+            )
+
+    return {
+        "CONN_MAX_AGE": conn_max_age,
+        "CONN_HEALTH_CHECKS": _env_bool("DB_CONN_HEALTH_CHECKS", True),
+        "OPTIONS": options,
+    }
+
+
+# ============================
+# Metrics
+# ============================
+def connection_stats(alias="default"):
+    """
+    Describe the connection strategy of a database alias.
+
+    With a pool, includes the psycopg_pool counters of this process
+    (`pool_size`, `pool_available`, `requests_waiting`, `requests_num`,
+    `connections_num`, `connections_errors`...).
+    """
+    from django.db import connections   # Imported lazily: this module is used by settings
+
+    connection = connections[alias]
+    settings_dict = connection.settings_dict
+    pool = getattr(connection, "pool", None)   # PostgreSQL backend with OPTIONS["pool"] only
+
+    stats = {
+        "alias": alias,
+        "vendor": connection.vendor,
+        "strategy": "pool" if pool is not None else ("persistent" if settings_dict["CONN_MAX_AGE"] != 0 else "per-request"),
+        "conn_max_age": settings_dict["CONN_MAX_AGE"],
+        "conn_health_checks": settings_dict["CONN_HEALTH_CHECKS"],
+        "connected": connection.connection is not None,
+    }
+    if pool is not None:
+        stats["pool"] = pool.get_stats()
+    return stats
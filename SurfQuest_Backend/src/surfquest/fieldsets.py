@@ -0,0 +1,185 @@
+"""
+Sparse fieldsets: `?fields=` / `?omit=` on API views.
+
+Clients pick the fields they need (`?fields=id,name,latitude,longitude` for
+the map) or drop the heavy ones (`?omit=description,surroundings`). The
+selection trims both the payload and the query behind it:
+
+- the serializer (`SparseFieldsetMixin`) drops the unselected fields;
+- the view (`SparseFieldsetViewMixin.sparse_queryset`) only loads the columns
+  of the selected fields with `.only()`, and only keeps the `select_related`
+  joins and prefetches they read.
+
+What a field reads is derived from its `source` (a column, a forward
+relation traversed by a dotted source or a nested serializer, a reverse
+relation that needs a prefetch). Fields whose source doesn't tell
+(`SerializerMethodField`, properties) declare their ORM paths in
+`Meta.field_sources`, e.g. `{"images": ("zone_images",)}`.
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.db.models import Prefetch   # Lookup name of a prefetch
+
+# ============================
+# Django REST Framework Imports
+# ============================
+from rest_framework import serializers   # Nested serializer detection
+from rest_framework.exceptions import ValidationError   # Unknown field names
+
+
+FIELDS_QUERY_PARAM = "fields"
+OMIT_QUERY_PARAM = "omit"
+
+_requirements = {}   # Serializer class -> {field name: (columns, select_related, prefetch_related)}
+
+
+# ============================
+# Field requirements
+# ============================
+def _source_paths(field):
+    """ORM paths read by a serializer field, from its source."""
+    if field.source == "*":
+        return ()
+    path = field.source.replace(".", "__")
+    child = getattr(field, "child", field)
+    if isinstance(child, serializers.ModelSerializer) and "__" not in path:
+        sub_paths = [
+            f"{path}__{sub_field.source}" for sub_field in child.fields.values()
+            if sub_field.source != "*" and "." not in sub_field.source
+        ]
+        return tuple(sub_paths) or (path,)
+    return (path,)
+
+
+def _classify(model, paths):
+    """Split ORM paths into (columns, select_related, prefetch_related) of `model`."""
+    columns, selects, prefetches = set(), set(), set()
+    for path in paths:
+        head, _, rest = path.partition("__")
+        model_field = model._meta.get_field(head)
+        if model_field.one_to_many or model_field.many_to_many:
+            prefetches.add(head)
+        elif model_field.is_relation and rest:
+            selects.add(head)
+            columns.add(path)
+        else:
+            columns.add(path)
+    return columns, selects, prefetches
+
+
+def field_requirements(serializer_class):
+    """{field name: (columns, select_related, prefetch_related)} of a ModelSerializer, cached per class."""
+    if serializer_class not in _requirements:
+        model = serializer_class.Meta.model
+        declared = getattr(serializer_class.Meta, "field_sources", {})
+        _requirements[serializer_class] = {
+            name: _classify(model, declared.get(name, _source_paths(field)))
+            for name, field in serializer_class().fields.items()
+        }
+    return _requirements[serializer_class]
+
+
+def fieldset_requirements(serializer_class, fieldset):
+    """Union of the (columns, select_related, prefetch_related) of the `fieldset` fields."""
+    columns, selects, prefetches = set(), set(), set()
+    requirements = field_requirements(serializer_class)
+    for name in fieldset:
+        field_columns, field_selects, field_prefetches = requirements[name]
+        columns |= field_columns
+        selects |= field_selects
+        prefetches |= field_prefetches
+    return columns, selects, prefetches
+
+
+def parse_fieldset(query_params, available):
+    """
+    Names of the `available` fields selected by `?fields=` and `?omit=`
+    (comma-separated, kept in `available` order), or None without either.
+    """
+    requested = {
+        param: [name.strip() for raw in query_params.getlist(param) for name in raw.split(",") if name.strip()]
+        for param in (FIELDS_QUERY_PARAM, OMIT_QUERY_PARAM)
+        if param in query_params
+    }
+    if not requested:
+        return None
+    errors = {
+        param: [f"Unknown field(s): {', '.join(unknown)}."]
+        for param, names in requested.items()
+        if (unknown := [name for name in names if name not in available])
+    }
+    if errors:
+        raise ValidationError(errors)
+
+    selected = requested.get(FIELDS_QUERY_PARAM) or available
+    omitted = requested.get(OMIT_QUERY_PARAM, ())
+    return tuple(name for name in available if name in selected and name not in omitted)
+
+
+# ============================
+# Serializer
+# ============================
+class SparseFieldsetMixin:
+    """ModelSerializer mixin keeping only the `fields` passed at init (all of them by default)."""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in [name for name in self.fields if name not in fields]:
+                self.fields.pop(name)
+
+
+# ============================
+# View
+# ============================
+class SparseFieldsetViewMixin:
+    """
+    View mixin reading `?fields=` / `?omit=` and handing the selection to the
+    serializer (a `SparseFieldsetMixin` one) and to `sparse_queryset()`.
+
+    `fieldset_serializer_class` is the serializer whose fields are selectable
+    (the view's serializer class by default).
+    """
+    fieldset_serializer_class = None
+
+    def get_fieldset_serializer_class(self):
+        return self.fieldset_serializer_class or self.serializer_class
+
+    def get_fieldset(self):
+        """Selected field names, or None when every field is wanted."""
+        if not hasattr(self, "_fieldset"):
+            available = tuple(field_requirements(self.get_fieldset_serializer_class()))
+            self._fieldset = parse_fieldset(self.request.query_params, available)
+        return self._fieldset
+
+    def get_serializer(self, *args, **kwargs):
+        fieldset = self.get_fieldset()
+        if fieldset is not None:
+            kwargs.setdefault("fields", fieldset)
+        return super().get_serializer(*args, **kwargs)
+
+    def sparse_queryset(self, queryset, select_related=(), prefetch_related=(), keep=()):
+        """
+        Apply the joins and prefetches the selected fields read.
+
+        Without a selection, every `select_related` / `prefetch_related`
+        lookup is applied and all columns are loaded. With one, only the
+        lookups the selected fields need are kept, and `.only()` loads their
+        columns, plus the primary key and the `keep` columns (ordering,
+        cursor positions).
+        """
+        fieldset = self.get_fieldset()
+        if fieldset is None:
+            selects, prefetches = set(select_related), None
+        else:
+            columns, selects, prefetches = fieldset_requirements(self.get_fieldset_serializer_class(), fieldset)
+            queryset = queryset.only(queryset.model._meta.pk.name, *keep, *columns)
+
+        if selects:   # select_related() without arguments would follow every foreign key
+            queryset = queryset.select_related(*selects)
+        return queryset.prefetch_related(*(
+            lookup for lookup in prefetch_related
+            if prefetches is None or (lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup) in prefetches
+        ))
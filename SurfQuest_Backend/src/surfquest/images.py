@@ -0,0 +1,140 @@
+"""
+Responsive image derivatives (thumbnails + modern formats) built with Pillow.
+
+For every uploaded image we store fixed-width copies next to the original:
+
+    surfzones/surf_zones_images/derivatives/<stem>_<width>w.<ext>
+
+in JPEG (always) and in each format of settings.IMAGE_DERIVATIVE_FORMATS
+(WebP by default, AVIF when enabled and supported by Pillow). Widths larger
+than the original are skipped; a small original gets a single copy at its own
+width. The stored names are kept on the model in a JSON "variants" field:
+
+    {"source": "<original name>", "jpeg": {"320": "<name>", ...}, "webp": {...}}
+
+Models call `prepare_variants()` from `save()` so derivatives are generated
+at upload time; `manage.py generate_image_derivatives` backfills existing
+media with a process pool. Serializers expose `srcset_map()`:
+
+    {"webp": {"320w": "<url>", "640w": "<url>"}, "jpeg": {...}}
+"""
+
+# ============================
+# Standard Library
+# ============================
+import io   # In-memory encoding buffers
+import logging   # Report unreadable images without failing the save
+import posixpath   # Storage names always use "/"
+
+# ============================
+# Third-Party Imports
+# ============================
+from PIL import Image, ImageOps, features   # Pillow
+
+# ============================
+# Django Imports
+# ============================
+from django.conf import settings   # IMAGE_DERIVATIVE_* settings
+from django.core.files.base import ContentFile   # Wrap encoded bytes for storage
+from django.core.files.storage import default_storage   # Storage used by the backfill workers
+
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_FORMAT = "jpeg"
+EXTENSIONS = {"jpeg": "jpg", "webp": "webp", "avif": "avif"}
+PIL_FORMATS = {"jpeg": "JPEG", "webp": "WEBP", "avif": "AVIF"}
+
+
+# ============================
+# Generation
+# ============================
+def enabled_formats():
+    """JPEG + the configured modern formats this Pillow build can encode."""
+    formats = [FALLBACK_FORMAT]
+    for fmt in settings.IMAGE_DERIVATIVE_FORMATS:
+        fmt = fmt.strip().lower()
+        if fmt in PIL_FORMATS and fmt not in formats and features.check(fmt):
+            formats.append(fmt)
+    return formats
+
+
+def derivative_name(name, width, fmt):
+    """Storage name of the `width` px `fmt` copy of the image `name`."""
+    directory, filename = posixpath.split(name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(directory, "derivatives", f"{stem}_{width}w.{EXTENSIONS[fmt]}")
+
+
+def generate_derivatives(name, storage=None):
+    """
+    Build and store the derivatives of the image `name`.
+
+    Returns the variants dict, or {} when the original can't be read
+    (missing file, not an image...), so that a later save or backfill retries.
+    """
+    storage = storage or default_storage
+    try:
+        with storage.open(name, "rb") as source:
+            original = ImageOps.exif_transpose(Image.open(source))
+            original.load()
+    except (OSError, ValueError) as error:   # Missing file, truncated or unknown image
+        logger.warning("Cannot build derivatives of %s: %s", name, error)
+        return {}
+
+    widths = sorted({w for w in settings.IMAGE_DERIVATIVE_WIDTHS if w < original.width}) or [original.width]
+    variants = {"source": name}
+    for fmt in enabled_formats():
+        image = original.convert("RGB") if fmt == FALLBACK_FORMAT else original.convert("RGBA")
+        variants[fmt] = {}
+        for width in widths:
+            height = max(1, round(original.height * width / original.width))
+            resized = image.resize((width, height), Image.LANCZOS) if width != original.width else image
+            buffer = io.BytesIO()
+            resized.save(buffer, PIL_FORMATS[fmt], quality=settings.IMAGE_DERIVATIVE_QUALITY)
+
+            target = derivative_name(name, width, fmt)
+            if storage.exists(target):
+                storage.delete(target)   # Keep the deterministic name
+            variants[fmt][str(width)] = storage.save(target, ContentFile(buffer.getvalue()))
+    return variants
+
+
+def prepare_variants(fieldfile, variants):
+    """
+    Return up-to-date variants for an image field, to be called from `Model.save()`.
+
+    A new upload is written to storage first (as `FileField.pre_save` would)
+    so its final name is known; derivatives are (re)built whenever the
+    original changed since they were generated.
+    """
+    if not fieldfile:
+        return {}
+    if not fieldfile._committed:
+        fieldfile.save(fieldfile.name, fieldfile.file, save=False)
+    if (variants or {}).get("source") == fieldfile.name:
+        return variants
+    return generate_derivatives(fieldfile.name, fieldfile.storage)
+
+
+# ============================
+# URLs
+# ============================
+def srcset_map(fieldfile, variants, request=None):
+    """
+    `{format: {"<width>w": url}}` for an image, or {} without derivatives.
+
+    URLs are absolute when a request is given, like `build_image_urls`.
+    """
+    if not fieldfile or (variants or {}).get("source") != fieldfile.name:
+        return {}
+    storage = fieldfile.storage
+    result = {}
+    for fmt, names in variants.items():
+        if fmt == "source":
+            continue
+        result[fmt] = {}
+        for width, name in sorted(names.items(), key=lambda item: int(item[0])):
+            url = storage.url(name)
+            result[fmt][f"{width}w"] = request.build_absolute_uri(url) if request else url
+    return result
@@ -0,0 +1,116 @@
+"""
+Base class for process-local, in-memory indexes over the catalogue.
+
+An index is built from the database on first use and kept in memory. It is
+rebuilt on the next lookup when either:
+
+- the catalogue version (see surfquest/cache.py) moved: saves and deletes
+  made by this process, or by any process sharing the cache backend;
+- the database version moved: the newest zone / spot stamps and the zone,
+  spot and country counts (`get_database_version`). It is read at most every
+  settings.INDEX_CHECK_INTERVAL seconds, so changes the cache never reported
+  (another worker with a per-process cache, bulk updates) reach every
+  process within that delay.
+"""
+
+# ============================
+# Standard Library
+# ============================
+import logging   # Report indexes that can't be built at startup
+import threading   # Guard concurrent rebuilds in threaded workers
+import time   # Interval between database version checks
+
+# ============================
+# Django Imports
+# ============================
+from django.apps import apps   # Catalogue models, without importing the apps at module load
+from django.conf import settings   # INDEX_CHECK_INTERVAL
+from django.db import DatabaseError   # Database not reachable / not migrated yet
+from django.db.models import Count, Max   # Database version
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import get_catalogue_version   # Current catalogue version
+
+
+logger = logging.getLogger(__name__)
+
+
+# ============================
+# Database version
+# ============================
+def get_database_version():
+    """
+    Version of the catalogue as stored: (newest zone stamp, zone count, newest
+    spot stamp, spot count, country count). `SurfZone.content_updated_at`
+    rolls up spots, conditions, images, countries and reviews; the counts
+    catch deletions, which leave no stamp.
+    """
+    SurfZone = apps.get_model("surfzones", "SurfZone")
+    SurfSpot = apps.get_model("surfzones", "SurfSpot")
+    Country = apps.get_model("surfzones", "Country")
+    zones = SurfZone.objects.aggregate(last=Max("content_updated_at"), count=Count("pk"))
+    spots = SurfSpot.objects.aggregate(last=Max("updated_at"), count=Count("pk"))
+    return (zones["last"], zones["count"], spots["last"], spots["count"], Country.objects.count())
+
+
+# ============================
+# Base Index
+# ============================
+class CatalogueIndex:
+    """
+    Lazily (re)built in-memory index.
+
+    Subclasses implement `build()` and return any object; callers use `get()`.
+    `database_version` is the database version the data was built from.
+    """
+
+    def __init__(self):
+        self._data = None
+        self._version = None
+        self.database_version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def build(self):
+        """Load rows from the database and return the index data."""
+        raise NotImplementedError
+
+    def get(self):
+        """Return up-to-date index data, rebuilding it if the catalogue changed."""
+        version = get_catalogue_version()
+        data = self._data
+        if data is not None and self._version == version and not self._database_moved():
+            return data
+        with self._lock:
+            if self._data is data:   # Not rebuilt by another thread meanwhile
+                database_version = get_database_version()   # Before loading: a change during the build triggers another
+                self._data = self.build()
+                self._version = version
+                self.mark_checked(database_version)
+        return self._data
+
+    def mark_checked(self, database_version):
+        """Record the database version the data reflects (after a build or an in-place update)."""
+        self.database_version = database_version
+        self._checked_at = time.monotonic()
+
+    def _database_moved(self):
+        """True when the database version changed since the build; read every INDEX_CHECK_INTERVAL seconds."""
+        if time.monotonic() - self._checked_at < settings.INDEX_CHECK_INTERVAL:
+            return False
+        database_version = get_database_version()
+        self._checked_at = time.monotonic()
+        return database_version != self.database_version
+
+    def invalidate(self):
+        """Force a rebuild on next use (e.g. after a bulk import)."""
+        self._data = None
+
+    def warm(self):
+        """Build the index now (worker startup) rather than on the first request; never raises."""
+        try:
+            self.get()
+        except DatabaseError as error:
+            logger.warning("Cannot build %s at startup: %s", type(self).__name__, error)
@@ -0,0 +1,32 @@
+"""
+Per-response memo of nested serializer payloads.
+
+List responses often nest the same parent many times: the zone of every
+spot, the author of every review. A serializer using `MemoizedSerializerMixin`
+renders each instance once per serializer tree: the payload is stored in the
+root serializer's context under (serializer class, pk) and returned as is
+for the next occurrence.
+
+The context lives as long as the root serializer, i.e. one response, so a
+memoized payload is never stale across requests. Use the mixin on nested
+(read-only) declarations only, and do not mutate the returned dicts: they
+are shared by every parent of the instance.
+"""
+
+MEMO_CONTEXT_KEY = "serializer_memo"
+
+
+def get_memo(context):
+    """The {(serializer class, pk): payload} memo of a serializer context."""
+    return context.setdefault(MEMO_CONTEXT_KEY, {})
+
+
+class MemoizedSerializerMixin:
+    """Serializer mixin rendering each instance once per serializer tree."""
+
+    def to_representation(self, instance):
+        memo = get_memo(self.context)
+        key = (type(self), instance.pk)
+        if key not in memo:
+            memo[key] = super().to_representation(instance)
+        return memo[key]
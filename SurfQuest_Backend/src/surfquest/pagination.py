@@ -0,0 +1,100 @@
+"""
+Pagination classes shared by the SurfQuest API.
+
+Uses keyset (cursor) pagination so that the cost of fetching a page stays
+constant as tables grow, instead of scanning an ever-growing OFFSET.
+Each paginator pins a stable ordering (unique tie-breaker last) so cursors
+never skip or repeat rows.
+
+Clients may:
+- tune the page size with `?page_size=<n>` (capped by `API_MAX_PAGE_SIZE`)
+- opt out of pagination with `?all=true` (e.g. the map view, which needs every
+  marker at once); the response is then the plain list, as before pagination.
+- pick another stable ordering with `?ordering=<name>` where the paginator
+  offers some (`orderings`); views apply `get_ordering()` to their queryset
+  so that the unpaginated list follows it too.
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.conf import settings   # Page size settings (API_PAGE_SIZE / API_MAX_PAGE_SIZE)
+
+# ============================
+# Django REST Framework Imports
+# ============================
+from rest_framework.exceptions import ValidationError   # Unknown ?ordering=
+from rest_framework.pagination import CursorPagination   # Keyset pagination based on an opaque cursor
+
+
+# ============================
+# Base Paginator
+# ============================
+class SurfQuestCursorPagination(CursorPagination):
+    """
+    Cursor paginator with configurable page size and an opt-in "fetch all" mode.
+
+    Subclasses only need to define a stable `ordering`, and may offer
+    alternatives in `orderings` (name -> stable ordering).
+    """
+    page_size_query_param = "page_size"
+    fetch_all_query_param = "all"
+    ordering_query_param = "ordering"
+    ordering = ("id",)
+    orderings = {}
+
+    def __init__(self):
+        self.page_size = settings.API_PAGE_SIZE
+        self.max_page_size = settings.API_MAX_PAGE_SIZE
+
+    def wants_all(self, request):
+        """Return True when the client explicitly asked for the unpaginated list."""
+        value = request.query_params.get(self.fetch_all_query_param, "")
+        return value.lower() in ("1", "true", "yes")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Skip pagination entirely in "fetch all" mode (returns the plain list)."""
+        if self.wants_all(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset=None, view=None):
+        """The ordering picked with `?ordering=<name>` among `orderings`, else the default one."""
+        name = request.query_params.get(self.ordering_query_param)
+        if not name:
+            return self.ordering
+        if name not in self.orderings:
+            raise ValidationError({self.ordering_query_param: [f"Choose one of: {', '.join(self.orderings)}."]})
+        return self.orderings[name]
+
+
+# ============================
+# Per-resource Paginators
+# ============================
+class NameCursorPagination(SurfQuestCursorPagination):
+    """Alphabetical pages (surf zones, surf spots), `id` breaks ties on duplicate names."""
+    ordering = ("name", "id")
+
+
+class CatalogueCursorPagination(NameCursorPagination):
+    """
+    Alphabetical pages of the lite catalogue lists, or sorted by the review
+    aggregates with `?ordering=rating|-rating|review_count|-review_count`.
+    """
+    orderings = {
+        "name": ("name", "id"),
+        "rating": ("rating_avg", "review_count", "id"),
+        "-rating": ("-rating_avg", "-review_count", "id"),
+        "review_count": ("review_count", "rating_avg", "id"),
+        "-review_count": ("-review_count", "-rating_avg", "id"),
+    }
+
+
+class IdCursorPagination(SurfQuestCursorPagination):
+    """Pages ordered by primary key (conditions)."""
+    ordering = ("id",)
+
+
+class CreatedAtCursorPagination(SurfQuestCursorPagination):
+    """Newest first (reviews), `id` breaks ties on identical timestamps."""
+    ordering = ("-created_at", "-id")
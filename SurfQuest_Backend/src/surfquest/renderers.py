@@ -0,0 +1,99 @@
+"""
+orjson-based JSON renderer and parser for the API.
+
+DRF's default `JSONRenderer` / `JSONParser` use the stdlib `json` module,
+whose pure-Python encoder walks large payloads (every zone card, nested
+conditions of the legacy list) object by object. `orjson` encodes and
+decodes in native code, several times faster, and handles UUID, datetime
+and date natively.
+
+The output matches `JSONRenderer` with DRF's default settings (compact,
+unescaped unicode, U+2028 / U+2029 escaped, "Z" for UTC datetimes). Values
+orjson does not know (Decimal such as `User.budget` when not coerced to
+strings, lazy translations, timedelta, querysets...) go through DRF's own
+`JSONEncoder.default`, so they render exactly as before.
+
+Selected in settings with API_JSON_BACKEND=orjson (default). When orjson is
+not installed, both classes behave exactly like their DRF parents and a
+warning is emitted once at import.
+
+Benchmark: `manage.py benchmark_json_renderers`.
+"""
+
+# ============================
+# Standard Library
+# ============================
+import codecs   # Non UTF-8 request bodies
+import warnings   # Report the fallback to the stdlib json module
+
+# ============================
+# Django REST Framework Imports
+# ============================
+from rest_framework.exceptions import ParseError   # Invalid JSON body
+from rest_framework.parsers import JSONParser   # Fallback parser
+from rest_framework.renderers import JSONRenderer   # Fallback renderer
+from rest_framework.utils.encoders import JSONEncoder   # Types orjson does not handle natively
+
+try:
+    import orjson   # Optional, see requirements.txt
+except ImportError:
+    orjson = None
+    warnings.warn(
+        "orjson is not installed: the API renders and parses JSON with the stdlib json module.",
+        RuntimeWarning,
+    )
+
+
+_fallback_encoder = JSONEncoder()
+
+RENDER_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z) if orjson else 0   # int / UUID keys like json; "Z" suffix like DRF
+
+
+def orjson_available():
+    return orjson is not None
+
+
+# ============================
+# Renderer
+# ============================
+class ORJSONRenderer(JSONRenderer):
+    """`JSONRenderer` encoding with orjson (indented output uses 2 spaces)."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.ensure_ascii:   # UNICODE_JSON=False needs json's ASCII escaping
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        options = RENDER_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        try:
+            ret = orjson.dumps(data, default=_fallback_encoder.default, option=options)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits: let the stdlib encoder deal with it
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same as JSONRenderer: keep the output valid JavaScript
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+# ============================
+# Parser
+# ============================
+class ORJSONParser(JSONParser):
+    """`JSONParser` decoding with orjson (NaN / Infinity are rejected, as in DRF's strict mode)."""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        try:
+            body = stream.read()
+            if codecs.lookup(encoding).name != "utf-8":
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except (ValueError, UnicodeDecodeError) as exc:   # orjson.JSONDecodeError is a ValueError
+            raise ParseError(f"JSON parse error - {exc}")
@@ -13,6 +13,7 @@ import os
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
+from django.core.exceptions import ImproperlyConfigured
 
 # ============================
 # Environment Variables & Base Directory
@@ -68,13 +69,92 @@ INSTALLED_APPS = [
 # REST Framework Configuration
 # ============================
 
+# JSON encoding / decoding: "orjson" (native, see surfquest/renderers.py; falls back to the
+# stdlib json module when orjson is not installed) or "json" (DRF's own classes).
+API_JSON_BACKEND = os.getenv("API_JSON_BACKEND", "orjson").strip().lower()
+JSON_BACKENDS = {
+    "orjson": ("surfquest.renderers.ORJSONRenderer", "surfquest.renderers.ORJSONParser"),
+    "json": ("rest_framework.renderers.JSONRenderer", "rest_framework.parsers.JSONParser"),
+}
+if API_JSON_BACKEND not in JSON_BACKENDS:
+    raise ImproperlyConfigured(f"API_JSON_BACKEND must be one of {', '.join(JSON_BACKENDS)}, got {API_JSON_BACKEND!r}.")
+JSON_RENDERER_CLASS, JSON_PARSER_CLASS = JSON_BACKENDS[API_JSON_BACKEND]
+
 # Define default authentication methods
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        JSON_RENDERER_CLASS,
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        JSON_PARSER_CLASS,
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
 }
 
+# ============================
+# Pagination Configuration
+# ============================
+
+# Cursor pagination page sizes (see surfquest/pagination.py)
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "50"))             # Default number of items per page
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "500"))    # Upper bound for ?page_size=
+
+# ============================
+# Cache Configuration
+# ============================
+
+# Local in-memory cache by default. Point CACHE_BACKEND / CACHE_LOCATION to a shared
+# backend (e.g. django.core.cache.backends.redis.RedisCache + redis://host:6379/0)
+# so that every worker shares cached responses and invalidations (required by prod.py
+# with several workers).
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        'LOCATION': os.getenv("CACHE_LOCATION", "surfquest"),
+    }
+}
+
+# Lifetime (seconds) of cached catalogue API responses (see surfquest/cache.py)
+API_CACHE_TIMEOUT = int(os.getenv("API_CACHE_TIMEOUT", "300"))
+
+# Seconds between two database version checks of the in-memory indexes (see surfquest/indexes.py):
+# the longest a worker serves an index that missed a change
+INDEX_CHECK_INTERVAL = float(os.getenv("INDEX_CHECK_INTERVAL", "5"))
+
+# ============================
+# Search Configuration
+# ============================
+
+# Full-text search backend (see surfzones/search.py): "postgres" (tsvector + GIN),
+# "memory" (in-process inverted index) or "auto" (postgres on PostgreSQL, memory otherwise)
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "auto")
+
+# ============================
+# Best Months Configuration
+# ============================
+
+# Weights of the computed best-month score components (see conditions/best_months.py),
+# e.g. "surf_rating:3,crowd:0"; unlisted components keep their default weight.
+# Run `manage.py compute_best_months` after changing them.
+BEST_MONTH_WEIGHTS = {
+    name.strip(): float(weight)
+    for name, weight in (item.split(":") for item in os.getenv("BEST_MONTH_WEIGHTS", "").split(",") if item.strip())
+}
+
+# ============================
+# Serving Mode
+# ============================
+
+# "wsgi" (gunicorn sync workers) or "asgi" (gunicorn + uvicorn workers), see Dockerfile.prod.backend.
+# In ASGI mode the read-only API views are dispatched asynchronously (see surfquest/async_views.py).
+SERVER_MODE = os.getenv("SERVER_MODE", "wsgi").strip().lower()
+ASYNC_API_VIEWS = SERVER_MODE == "asgi"
+
 # ============================
 # JWT Configuration
 # ============================
@@ -145,6 +225,11 @@ STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Responsive image derivatives (see surfquest/images.py)
+IMAGE_DERIVATIVE_WIDTHS = [int(w) for w in os.getenv("IMAGE_DERIVATIVE_WIDTHS", "320,640,1280").split(",")]   # Thumbnail widths in px
+IMAGE_DERIVATIVE_FORMATS = os.getenv("IMAGE_DERIVATIVE_FORMATS", "webp").split(",")   # Modern formats on top of JPEG (e.g. "webp,avif")
+IMAGE_DERIVATIVE_QUALITY = int(os.getenv("IMAGE_DERIVATIVE_QUALITY", 80))
+
 # ============================
 # Templates Configuration
 # ============================
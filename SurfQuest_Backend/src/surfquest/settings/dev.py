@@ -11,6 +11,7 @@ optimized for local development and debugging.
 
 import os
 from .base import *
+from surfquest.db import connection_settings   # Connection reuse / pooling
 
 # ============================
 # Debugging & Host Settings
@@ -94,4 +95,7 @@ DATABASES = {
         'HOST': os.getenv('DATABASE_HOST', 'db'),           # Database host
         'PORT': os.getenv('DATABASE_PORT', '5432'),         # Database port
     }
-}
\ No newline at end of file
+}
+
+# Persistent / health-checked connections or psycopg 3 pool (see surfquest/db.py)
+DATABASES['default'].update(connection_settings(default_conn_max_age=0))   # New connection per request unless DB_CONN_MAX_AGE / DB_POOL are set
@@ -10,6 +10,8 @@ optimized for deployment, performance, and security.
 # ============================
 
 from .base import *
+from surfquest.db import connection_settings   # Connection reuse / pooling
+from django.core.exceptions import ImproperlyConfigured   # Refuse per-process caches with several workers
 import os
 
 # ============================
@@ -122,6 +124,23 @@ DATABASES = {
     }
 }
 
+# Persistent / health-checked connections or psycopg 3 pool (see surfquest/db.py)
+DATABASES['default'].update(connection_settings(default_conn_max_age=60))   # Reuse connections to the remote host for 60 s by default
+
+# ============================
+# Cache Configuration
+# ============================
+
+# Cached responses, catalogue versions and in-memory index versions must be shared by
+# every gunicorn worker (see surfquest/cache.py): a per-process cache would let workers
+# miss each other's invalidations. docker-compose.prod.yml runs a Redis service.
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+if WEB_CONCURRENCY > 1 and CACHES['default']['BACKEND'] == "django.core.cache.backends.locmem.LocMemCache":
+    raise ImproperlyConfigured(
+        f"WEB_CONCURRENCY={WEB_CONCURRENCY} requires a shared cache: set CACHE_BACKEND / CACHE_LOCATION "
+        "(e.g. django.core.cache.backends.redis.RedisCache + redis://redis:6379/0) or run a single worker."
+    )
+
 # ============================
 # Static and Media Files Configuration
 # ============================
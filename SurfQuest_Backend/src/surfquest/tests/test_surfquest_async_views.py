@@ -0,0 +1,158 @@
+"""
+Tests for the async dispatch of the read-only API views (ASGI serving mode).
+
+The routes below are the production views built with `async_mode=True` and
+are requested through Django's ASGI handler (AsyncClient).
+
+These tests verify that:
+- async views return the same payloads as the sync ones (lists, pages, details)
+- ETags and the response cache behave the same (304, X-Cache)
+- unknown objects answer 404, and non-read methods keep the sync dispatch
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Django Imports
+# ============================
+from django.test import AsyncClient
+from django.urls import path
+
+# ============================
+# Local Application Imports
+# ============================
+from conditions.models import Condition
+from conditions.views import ConditionViewSet
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+from surfzones.views import SurfZoneLiteListAPIView, SurfZoneDetailAPIView, SurfSpotLiteListAPIView
+from users.models import User, Review
+from users.views import ReviewViewSet
+
+
+# ============================
+# Async routes (used through pytest.mark.urls)
+# ============================
+urlpatterns = [
+    path("surfzones-lite/", SurfZoneLiteListAPIView.as_view(async_mode=True)),
+    path("surfzones-detail/<uuid:id>/", SurfZoneDetailAPIView.as_view(async_mode=True)),
+    path("surfspots-lite/", SurfSpotLiteListAPIView.as_view(async_mode=True)),
+    path("conditions/", ConditionViewSet.as_view({"get": "list"}, async_mode=True)),
+    path("reviews/", ReviewViewSet.as_view({"get": "list"}, async_mode=True)),
+    path("reviews/<uuid:pk>/", ReviewViewSet.as_view({"get": "retrieve"}, async_mode=True)),
+    path("sync/surfzones-lite/", SurfZoneLiteListAPIView.as_view(async_mode=False)),
+]
+
+pytestmark = pytest.mark.urls("surfquest.tests.test_surfquest_async_views")
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def async_get():
+    """Synchronous helper around AsyncClient.get (no async test runner needed)."""
+    client = AsyncClient()
+    return lambda url, data=None, **extra: async_to_sync(client.get)(url, data, **extra)
+
+@pytest.fixture
+def catalogue(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    country = Country.objects.create(name="Portugal", code="PRT", continent=continent)
+    peniche = SurfZone.objects.create(name="Peniche", country=country)
+    ericeira = SurfZone.objects.create(name="Ericeira", country=country)
+    SurfSpot.objects.create(name="Supertubos", surfzone=peniche)
+    Condition.objects.create(surfzone=peniche, month="July", water_temp_c=19)
+    user = User.objects.create_user(username="surfer", email="surfer@example.com", password="password123")
+    review = Review.objects.create(user=user, surf_zone=peniche, rating=5, comment="Great")
+    return {"peniche": peniche, "ericeira": ericeira, "review": review}
+
+
+# ============================
+# Test Cases
+# ============================
+def test_async_mode_views_are_coroutines(settings):
+    """Test that only async_mode views are awaited by Django's handlers."""
+    settings.ASYNC_API_VIEWS = False
+    assert iscoroutinefunction(SurfZoneLiteListAPIView.as_view(async_mode=True))
+    assert not iscoroutinefunction(SurfZoneLiteListAPIView.as_view())
+
+    settings.ASYNC_API_VIEWS = True
+    assert iscoroutinefunction(ReviewViewSet.as_view({"get": "list"}))
+
+
+@pytest.mark.django_db
+def test_async_list_matches_sync_payload(async_get, catalogue):
+    """Test that the async zone list returns the sync payload, with validators."""
+    response = async_get("/surfzones-lite/", {"all": "true"})
+    sync_response = APIClient().get("/sync/surfzones-lite/", {"all": "true"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [zone["name"] for zone in response.json()] == ["Ericeira", "Peniche"]
+    assert response.json() == sync_response.json()
+    assert response["ETag"].startswith('"')
+    assert response["X-Cache"] == "MISS"
+
+
+@pytest.mark.django_db
+def test_async_list_is_cached_and_revalidated(async_get, catalogue):
+    """Test that a repeated request hits the cache and a matching ETag answers 304."""
+    first = async_get("/surfspots-lite/")
+    second = async_get("/surfspots-lite/")
+    assert second["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+
+    not_modified = async_get("/surfspots-lite/", headers={"If-None-Match": first["ETag"]})
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_async_pagination(async_get, catalogue):
+    """Test that cursor pagination works in async mode."""
+    first = async_get("/surfzones-lite/", {"page_size": 1}).json()
+    assert [zone["name"] for zone in first["results"]] == ["Ericeira"]
+
+    second = async_get(first["next"]).json()
+    assert [zone["name"] for zone in second["results"]] == ["Peniche"]
+    assert second["next"] is None
+
+
+@pytest.mark.django_db
+def test_async_detail_and_404(async_get, catalogue):
+    """Test that the async detail view returns prefetched relations, and 404 on unknown ids."""
+    peniche = catalogue["peniche"]
+    response = async_get(f"/surfzones-detail/{peniche.id}/")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["name"] == "Peniche"
+    assert [spot["name"] for spot in data["surf_spots"]] == ["Supertubos"]
+    assert "Last-Modified" in response
+
+    missing = async_get("/surfzones-detail/00000000-0000-0000-0000-000000000000/")
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_async_viewsets(async_get, catalogue):
+    """Test the async list / retrieve of the conditions and reviews viewsets."""
+    conditions = async_get("/conditions/").json()
+    assert [c["month"] for c in conditions["results"]] == ["July"]
+
+    reviews = async_get("/reviews/", {"surf_zone_id": str(catalogue["peniche"].id)}).json()
+    assert [r["comment"] for r in reviews["results"]] == ["Great"]
+
+    review = async_get(f"/reviews/{catalogue['review'].id}/")
+    assert review.status_code == status.HTTP_200_OK
+    assert review.json()["rating"] == 5
+
+
+@pytest.mark.django_db
+def test_async_view_rejects_writes(catalogue):
+    """Test that non-read methods go through the regular dispatch (405)."""
+    response = async_to_sync(AsyncClient().post)("/surfzones-lite/", {})
+    assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
@@ -0,0 +1,82 @@
+"""
+Tests for the database connection management helpers (surfquest/db.py).
+
+These tests verify that:
+- persistent connection settings are read from the environment
+- the pool is configured only when its dependencies are installed
+- the metrics endpoint is restricted to staff users
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfquest import db
+from users.models import User
+
+
+# ============================
+# Settings
+# ============================
+def test_persistent_connection_defaults(monkeypatch):
+    """Test the per-environment default and environment overrides."""
+    for name in ("DB_CONN_MAX_AGE", "DB_CONN_HEALTH_CHECKS", "DB_POOL"):
+        monkeypatch.delenv(name, raising=False)
+
+    config = db.connection_settings(default_conn_max_age=60)
+    assert config["CONN_MAX_AGE"] == 60
+    assert config["CONN_HEALTH_CHECKS"] is True
+    assert "pool" not in config["OPTIONS"]
+
+    monkeypatch.setenv("DB_CONN_MAX_AGE", "None")
+    monkeypatch.setenv("DB_CONN_HEALTH_CHECKS", "False")
+    config = db.connection_settings()
+    assert config["CONN_MAX_AGE"] is None
+    assert config["CONN_HEALTH_CHECKS"] is False
+
+
+def test_pool_settings(monkeypatch):
+    """Test that the pool disables persistent connections and reads its sizes."""
+    monkeypatch.setattr(db, "pool_available", lambda: True)
+    monkeypatch.setenv("DB_POOL", "True")
+    monkeypatch.setenv("DB_POOL_MAX_SIZE", "4")
+
+    config = db.connection_settings(default_conn_max_age=60)
+    assert config["CONN_MAX_AGE"] == 0
+    assert config["OPTIONS"]["pool"]["max_size"] == 4
+    assert config["OPTIONS"]["pool"]["min_size"] == 2
+
+
+def test_pool_falls_back_without_dependencies(monkeypatch):
+    """Test the warning + persistent connections fallback."""
+    monkeypatch.setattr(db, "pool_available", lambda: False)
+    monkeypatch.setenv("DB_POOL", "True")
+
+    with pytest.warns(RuntimeWarning, match="psycopg_pool"):
+        config = db.connection_settings(default_conn_max_age=60)
+    assert "pool" not in config["OPTIONS"]
+    assert config["CONN_MAX_AGE"] == 60
+
+
+# ============================
+# Metrics
+# ============================
+@pytest.mark.django_db
+def test_metrics_endpoint_is_staff_only():
+    """Test connection metrics access and payload."""
+    client = APIClient()
+    assert client.get("/api/v1/metrics/db/").status_code == 401
+
+    client.force_authenticate(User.objects.create_user(username="user", email="u@example.com", password="pw"))
+    assert client.get("/api/v1/metrics/db/").status_code == 403
+
+    client.force_authenticate(User.objects.create_user(username="admin", email="a@example.com", password="pw", is_staff=True))
+    response = client.get("/api/v1/metrics/db/")
+    assert response.status_code == 200
+    assert response.json()["vendor"] == "postgresql"
+    assert response.json()["strategy"] in ("per-request", "persistent", "pool")
@@ -0,0 +1,59 @@
+"""
+Tests for the in-memory catalogue indexes (surfquest/indexes.py).
+
+These tests verify that:
+- an index is reused while neither the catalogue nor the database version moves
+- changes the catalogue version never reported (another worker with a
+  per-process cache, bulk updates) are picked up by the database version check
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from django.utils import timezone
+
+# ============================
+# Local Application Imports
+# ============================
+from conditions.matrix import condition_matrix
+from conditions.models import Condition
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+
+
+@pytest.fixture
+def zone(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    country = Country.objects.create(name="Portugal", code="PRT", continent=continent)
+    zone = SurfZone.objects.create(name="Ericeira", country=country)
+    Condition.objects.create(surfzone=zone, month="July", water_temp_c=20)
+    return zone
+
+
+@pytest.mark.django_db
+def test_unreported_change_is_picked_up(zone, settings, django_assert_num_queries):
+    """Test that a change without a version bump is seen after INDEX_CHECK_INTERVAL."""
+    settings.INDEX_CHECK_INTERVAL = 3600
+    matrix = condition_matrix.get()
+    with django_assert_num_queries(0):
+        assert condition_matrix.get() is matrix
+
+    # As written by another worker: the local catalogue version does not move
+    Condition.objects.filter(surfzone=zone).update(water_temp_c=25)
+    SurfZone.objects.filter(pk=zone.pk).update(content_updated_at=timezone.now())
+    assert condition_matrix.get() is matrix   # Within the interval
+
+    settings.INDEX_CHECK_INTERVAL = 0
+    assert condition_matrix.get().value("water_temp_c", zone.id, "July") == 25
+
+
+@pytest.mark.django_db
+def test_unreported_deletion_is_picked_up(zone, settings):
+    """Test that a deletion, which leaves no stamp, moves the database version."""
+    settings.INDEX_CHECK_INTERVAL = 0
+    spot = SurfSpot.objects.create(name="Ribeira d'Ilhas", surfzone=zone)
+    matrix = condition_matrix.get()
+    assert condition_matrix.get() is matrix   # Database version unchanged: no rebuild
+
+    SurfSpot.objects.filter(pk=spot.pk)._raw_delete(SurfSpot.objects.db)   # No signal
+    assert condition_matrix.get() is not matrix
@@ -0,0 +1,86 @@
+"""
+Tests for the orjson renderer and parser (surfquest/renderers.py).
+
+These tests verify that:
+- the output is the same document as DRF's JSONRenderer, UUID / datetime /
+  Decimal included, with the same escaping of U+2028 / U+2029
+- invalid bodies raise ParseError
+- both classes fall back to the stdlib json module without orjson
+- the API uses them by default
+"""
+
+# ============================
+# Standard Library
+# ============================
+import datetime
+import io
+import json
+import uuid
+from decimal import Decimal
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfquest import renderers
+from surfquest.renderers import ORJSONParser, ORJSONRenderer
+
+
+PAYLOAD = {
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "updated_at": datetime.datetime(2025, 1, 16, 12, 3, 4, 500, tzinfo=datetime.timezone.utc),
+    "day": datetime.date(2025, 1, 16),
+    "budget": Decimal("1500.50"),
+    "name": "La Gravière\u2028",
+    "spots": ({"rating": 4.5}, None),
+    1: "int key",
+}
+
+
+# ============================
+# Test Cases
+# ============================
+def test_renders_like_json_renderer():
+    """Test that orjson renders the same bytes as DRF's JSONRenderer."""
+    assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+
+def test_indented_output():
+    """Test that a requested indent (browsable API, ?indent) is honoured."""
+    rendered = ORJSONRenderer().render({"a": [1]}, "application/json; indent=4")
+    assert rendered == b'{\n  "a": [\n    1\n  ]\n}'
+
+
+def test_parser_round_trip_and_errors():
+    """Test parsing of valid, non UTF-8 and invalid bodies."""
+    parser = ORJSONParser()
+    assert parser.parse(io.BytesIO(b'{"rating": 5, "comment": "\xc3\xa9"}')) == {"rating": 5, "comment": "é"}
+    assert parser.parse(io.BytesIO('{"comment": "é"}'.encode("latin-1")), parser_context={"encoding": "latin-1"}) == {"comment": "é"}
+    with pytest.raises(ParseError):
+        parser.parse(io.BytesIO(b'{"rating": NaN}'))
+
+
+def test_fallback_without_orjson(monkeypatch):
+    """Test that both classes use the stdlib json module when orjson is missing."""
+    monkeypatch.setattr(renderers, "orjson", None)
+    assert json.loads(ORJSONRenderer().render(PAYLOAD))["budget"] == 1500.5
+    assert ORJSONParser().parse(io.BytesIO(b'{"a": 1}')) == {"a": 1}
+
+
+@pytest.mark.django_db
+def test_api_uses_orjson_by_default():
+    """Test that API responses and JSON request bodies go through the orjson classes."""
+    client = APIClient()
+    response = client.get("/api/v1/surfzones-lite/")
+    assert isinstance(response.accepted_renderer, ORJSONRenderer)
+
+    response = client.post("/api/v1/users/", "{not json", content_type="application/json")
+    assert response.status_code == 400
+    assert "JSON parse error" in response.json()["detail"]
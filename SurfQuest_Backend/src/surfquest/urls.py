@@ -17,6 +17,11 @@ from django.urls import path, include   # URL routing utilities
 #===========================================
 from rest_framework_simplejwt.views import TokenRefreshView, TokenObtainPairView   # JWT token views from Django REST Framework SimpleJWT
 
+#===========================================
+# Project Imports
+#===========================================
+from surfquest.views import DatabaseMetricsView   # Connection / pool metrics
+
 # ============================
 # Main URL Patterns
 # ============================
@@ -31,6 +36,9 @@ urlpatterns = [
     path('api/v1/', include('users.urls')),         # Routes for user operations
     path('api/v1/', include('surfzones.urls')),     # Routes for surf zones
     path('api/v1/', include('conditions.urls')),    # Routes for surf conditions
+
+    # Operations
+    path('api/v1/metrics/db/', DatabaseMetricsView.as_view(), name='metrics-db'),   # Connection / pool metrics (staff only)
 ]
 
 # ============================
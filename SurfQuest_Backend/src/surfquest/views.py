@@ -0,0 +1,33 @@
+"""
+Project-level operational endpoints.
+
+- metrics/db/: database connection strategy and pool counters of the
+  worker process that answers (see surfquest/db.py). Staff only.
+"""
+
+# ============================
+# Django REST Framework Imports
+# ============================
+from rest_framework.permissions import IsAdminUser   # Staff users only
+from rest_framework.response import Response   # JSON response
+from rest_framework.views import APIView   # Plain API view
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.db import connection_stats   # Connection / pool metrics
+
+
+class DatabaseMetricsView(APIView):
+    """
+    Connection metrics of the `default` database for this worker process.
+
+    With the psycopg pool enabled, exposes psycopg_pool counters (pool size,
+    available connections, waiting requests, errors...). Each gunicorn
+    worker has its own pool: successive calls may reach different workers.
+    """
+    permission_classes = [IsAdminUser]
+    http_method_names = ["get"]
+
+    def get(self, request, *args, **kwargs):
+        return Response(connection_stats())
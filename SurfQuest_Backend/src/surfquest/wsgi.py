@@ -29,4 +29,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', f'surfquest.settings.{environmen
 # ============================
 
 # Create the WSGI application object for the server to use
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+# Build the in-memory typeahead index and marker clusters before the first request
+from surfzones.autocomplete import autocomplete_index   # noqa: E402 (needs the app registry)
+from surfzones.clusters import cluster_index   # noqa: E402
+autocomplete_index.warm()
+cluster_index.warm()
@@ -17,3 +17,7 @@ class SurfzonesConfig(AppConfig):
     """Configuration class for the surfzones app."""
     default_auto_field = 'django.db.models.BigAutoField'  # Default field type for auto-created primary keys
     name = 'surfzones'  # Name of the app used in INSTALLED_APPS and Django registry
+
+    def ready(self):
+        """Connect signal handlers (cache invalidation, version stamps)."""
+        from . import signals  # noqa: F401
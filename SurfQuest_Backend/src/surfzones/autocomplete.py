@@ -0,0 +1,200 @@
+"""
+Typeahead suggestions for the search box, answered from memory.
+
+Suggestions cover surf zones, surf spots, countries and the nearest city of
+each zone. Names are accent- and case-folded ("La Gravière" -> "la graviere")
+and stored under every word-start suffix ("la graviere", "graviere") in one
+sorted array: the keys starting with a prefix form a contiguous range found
+with `bisect`, so a lookup costs O(log n + matches), well under a millisecond
+for the whole catalogue.
+
+Ranking: exact name match, then a match at the start of the name (before a
+later word), then zones / countries / cities / spots, then shorter names.
+
+The index is built when a worker starts (see surfquest/wsgi.py / asgi.py)
+and updated in place by the surfzones signals once a change is committed.
+If another process changed the catalogue meanwhile, the catalogue version
+moved by more than this change, and the next lookup rebuilds the index from
+scratch instead; changes the cache never reported are caught by the
+periodic database version check (see surfquest/indexes.py).
+"""
+
+# ============================
+# Standard Library
+# ============================
+import bisect   # Sorted keys
+
+# ============================
+# Django Imports
+# ============================
+from django.db import transaction   # Apply changes once committed
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import get_catalogue_version   # Detect changes made by other processes
+from surfquest.indexes import CatalogueIndex, get_database_version   # Lazily rebuilt in-memory index
+
+# ============================
+# Local Application Imports
+# ============================
+from .models import Country, SurfZone, SurfSpot
+from .search import tokenize   # Same accent / case folding as full-text search
+
+
+SUGGESTION_TYPES = ("zone", "country", "city", "spot")   # Ranking order on ties
+TYPE_PRIORITY = {entity_type: priority for priority, entity_type in enumerate(SUGGESTION_TYPES)}
+
+
+# ============================
+# Loading
+# ============================
+def zone_suggestions(**filters):
+    """Zone suggestions, plus one for the nearest city of each zone (pointing to the zone)."""
+    suggestions = []
+    rows = SurfZone.objects.filter(**filters).values_list("id", "name", "slug", "nearest_city", "country__name")
+    for pk, name, slug, city, country in rows:
+        suggestions.append({"type": "zone", "id": str(pk), "name": name, "slug": slug, "subtitle": country})
+        if city:
+            suggestions.append({"type": "city", "id": str(pk), "name": city, "slug": slug, "subtitle": name})
+    return suggestions
+
+
+def spot_suggestions(**filters):
+    rows = SurfSpot.objects.filter(**filters).values_list("id", "name", "slug", "surfzone__name")
+    return [
+        {"type": "spot", "id": str(pk), "name": name, "slug": slug, "subtitle": zone}
+        for pk, name, slug, zone in rows
+    ]
+
+
+def country_suggestions(**filters):
+    rows = Country.objects.filter(**filters).values_list("id", "name", "slug", "continent__name")
+    return [
+        {"type": "country", "id": str(pk), "name": name, "slug": slug, "subtitle": continent}
+        for pk, name, slug, continent in rows
+    ]
+
+
+SUGGESTION_LOADERS = {"zone": zone_suggestions, "spot": spot_suggestions, "country": country_suggestions}
+
+
+# ============================
+# Index
+# ============================
+class Autocompleter:
+    """
+    Suggestions indexed by folded word-start suffixes in a sorted array.
+
+    `keys` holds (folded suffix, word position, type, object id) tuples;
+    `suggestions` maps (type, object id) to the suggestion payload.
+    """
+
+    def __init__(self, suggestions=()):
+        self.suggestions = {}
+        self.keys = []
+        for suggestion in suggestions:
+            self.suggestions[(suggestion["type"], suggestion["id"])] = suggestion
+            self.keys.extend(self._keys(suggestion))
+        self.keys.sort()
+
+    @staticmethod
+    def _keys(suggestion):
+        words = tokenize(suggestion["name"])
+        return [
+            (" ".join(words[position:]), position, suggestion["type"], suggestion["id"])
+            for position in range(len(words))
+        ]
+
+    def add(self, suggestion):
+        self.remove(suggestion["type"], suggestion["id"])
+        self.suggestions[(suggestion["type"], suggestion["id"])] = suggestion
+        for key in self._keys(suggestion):
+            bisect.insort(self.keys, key)
+
+    def remove(self, suggestion_type, object_id):
+        suggestion = self.suggestions.pop((suggestion_type, object_id), None)
+        if suggestion is None:
+            return
+        for key in self._keys(suggestion):
+            i = bisect.bisect_left(self.keys, key)
+            if i < len(self.keys) and self.keys[i] == key:
+                del self.keys[i]
+
+    def remove_object(self, object_id):
+        """Remove every suggestion of an object (a zone and its city share the zone id)."""
+        for suggestion_type in SUGGESTION_TYPES:
+            self.remove(suggestion_type, object_id)
+
+    def complete(self, query, types=SUGGESTION_TYPES, limit=10):
+        """Best suggestions whose name (or one of its words) starts with `query`."""
+        prefix = " ".join(tokenize(query))
+        if not prefix:
+            return []
+        best = {}   # (type, id) -> rank
+        for key, position, suggestion_type, object_id in self.keys[bisect.bisect_left(self.keys, (prefix,)):]:
+            if not key.startswith(prefix):
+                break
+            if suggestion_type not in types:
+                continue
+            suggestion = self.suggestions[(suggestion_type, object_id)]
+            rank = (
+                key != prefix or position > 0,   # Exact name first
+                position > 0,   # Then matches at the start of the name
+                TYPE_PRIORITY[suggestion_type],
+                len(suggestion["name"]),
+                suggestion["name"],
+            )
+            best_rank = best.get((suggestion_type, object_id))
+            if best_rank is None or rank < best_rank:
+                best[(suggestion_type, object_id)] = rank
+        ranked = sorted(best, key=best.get)[:limit]
+        return [self.suggestions[item] for item in ranked]
+
+
+class AutocompleteIndex(CatalogueIndex):
+    """Typeahead index of every zone, spot, country and nearest city name."""
+
+    def build(self):
+        return Autocompleter(
+            suggestion
+            for entity_type in SUGGESTION_LOADERS
+            for suggestion in SUGGESTION_LOADERS[entity_type]()
+        )
+
+    def schedule_update(self, refresh=(), remove=()):
+        """
+        Update the index in place once the current transaction commits.
+
+        `refresh` holds (entity type, filters) pairs of rows to reload,
+        `remove` the ids of deleted objects. Meant for post_save / post_delete
+        receivers running after `invalidate_catalogue_cache`, which bumps the
+        catalogue version once right away and once on commit. When the index
+        was current before this change and the version moved by exactly those
+        two bumps, it is patched and marked current; otherwise another change
+        landed meanwhile and the next lookup rebuilds it.
+        """
+        bumps_done = 1 if transaction.get_connection().in_atomic_block else 2   # Autocommit: on_commit runs at once
+        start = get_catalogue_version() - bumps_done
+        was_current = self._data is not None and self._version == start
+
+        def apply():
+            if not was_current or get_catalogue_version() != start + 2:
+                return
+            database_version = get_database_version()   # Read before the rows: later changes still trigger a rebuild
+            with self._lock:
+                for object_id in remove:
+                    self._data.remove_object(str(object_id))
+                for entity_type, filters in refresh:
+                    suggestions = SUGGESTION_LOADERS[entity_type](**filters)
+                    for object_id in {suggestion["id"] for suggestion in suggestions}:
+                        self._data.remove_object(object_id)
+                    for suggestion in suggestions:
+                        self._data.add(suggestion)
+                self._version = start + 2
+                self.mark_checked(database_version)
+
+        transaction.on_commit(apply)
+
+
+autocomplete_index = AutocompleteIndex()
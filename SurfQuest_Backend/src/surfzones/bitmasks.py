@@ -0,0 +1,167 @@
+"""
+Integer bitmask encoding of the multi-choice ArrayFields.
+
+`traveler_type`, `surf_level`, `best_months` and `best_tide` only hold values
+of closed enums (see choices.py). Each one has an integer companion column
+(`<field>_mask`) where bit `i` is set when the i-th choice is in the array.
+Models refresh their masks in `save()`; rows written without `save()`
+(`loaddata`, `QuerySet.update()`, `bulk_create()`) are fixed by the
+`sync_bitmasks` management command.
+
+Filtering a mask column:
+- small enums (up to BITMASK_IN_MAX_BITS choices) enumerate every matching
+  mask value and use `IN (...)`, which the B-tree index on the column serves;
+- larger enums (months) use the `hasallbits` / `hasanybits` lookups, a
+  bitwise test on a narrow integer column instead of array containment.
+
+Bits follow the declaration order of the choices: append new choices at the
+end of an enum, or re-run `sync_bitmasks` after reordering it.
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.db import models   # IntegerField, Lookup, Q
+
+# ============================
+# Local Application Imports
+# ============================
+from .choices import (
+    TRAVELER_TYPE_CHOICES,
+    SURF_LEVEL_CHOICES,
+    MONTHS_CHOICES,
+    BEST_TIDE_CHOICES,
+)
+
+
+BITMASK_IN_MAX_BITS = 6   # Up to 64 candidate values in an IN (...) list
+
+# Array field name -> choices enum (shared by every model using that field)
+BITMASK_CHOICES = {
+    "traveler_type": TRAVELER_TYPE_CHOICES,
+    "surf_level": SURF_LEVEL_CHOICES,
+    "best_months": MONTHS_CHOICES,
+    "best_tide": BEST_TIDE_CHOICES,
+}
+
+
+# ============================
+# Field & Lookups
+# ============================
+class BitmaskField(models.PositiveIntegerField):
+    """Integer companion column of a multi-choice ArrayField."""
+
+
+@BitmaskField.register_lookup
+class HasAllBits(models.Lookup):
+    """`field__hasallbits=mask`: every bit of `mask` is set."""
+    lookup_name = "hasallbits"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"({lhs} & {rhs}) = {rhs}", [*lhs_params, *rhs_params, *rhs_params]
+
+
+@BitmaskField.register_lookup
+class HasAnyBits(models.Lookup):
+    """`field__hasanybits=mask`: at least one bit of `mask` is set."""
+    lookup_name = "hasanybits"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"({lhs} & {rhs}) <> 0", [*lhs_params, *rhs_params]
+
+
+# ============================
+# Encoding
+# ============================
+def choice_bits(choices):
+    """Map each value of a choices enum to its bit."""
+    return {value: 1 << i for i, value in enumerate(choices.values)}
+
+
+def encode(field_name, values):
+    """Encode a list of choice values of `field_name` (unknown values are ignored)."""
+    bits = choice_bits(BITMASK_CHOICES[field_name])
+    mask = 0
+    for value in values or ():
+        mask |= bits.get(value, 0)
+    return mask
+
+
+def decode(field_name, mask):
+    """Return the choice values whose bit is set in `mask`, in declaration order."""
+    return [value for value, bit in choice_bits(BITMASK_CHOICES[field_name]).items() if mask & bit]
+
+
+def sync_bitmasks(instance, fields, update_fields=None):
+    """
+    Refresh the `<field>_mask` attributes of `instance` from its arrays.
+
+    Returns `update_fields` extended with the masks of the updated arrays,
+    to be passed on to `Model.save()`.
+    """
+    for name in fields:
+        setattr(instance, f"{name}_mask", encode(name, getattr(instance, name)))
+    if update_fields is None:
+        return None
+    update_fields = set(update_fields)
+    return update_fields | {f"{name}_mask" for name in fields if name in update_fields}
+
+
+def backfill_bitmasks(model, fields, batch_size=500):
+    """
+    Recompute the masks of every `model` row from its arrays, without `save()`.
+
+    Works with historical models (data migrations). Returns the number of
+    rows whose masks changed.
+    """
+    mask_fields = [f"{name}_mask" for name in fields]
+    changed = []
+    for row in model.objects.only("pk", *fields, *mask_fields).iterator(chunk_size=batch_size):
+        masks = {f"{name}_mask": encode(name, getattr(row, name)) for name in fields}
+        if any(getattr(row, field) != mask for field, mask in masks.items()):
+            for field, mask in masks.items():
+                setattr(row, field, mask)
+            changed.append(row)
+    model.objects.bulk_update(changed, mask_fields, batch_size=batch_size)
+    return len(changed)
+
+
+# ============================
+# Filtering
+# ============================
+def bitmask_q(field_name, values, match="any", prefix=""):
+    """
+    Build a Q object filtering `<prefix><field_name>_mask` on choice `values`.
+
+    - match="any": at least one of the values is in the array
+    - match="all": every value is in the array
+    Unknown values match nothing (any) or make the filter impossible (all).
+    """
+    choices = BITMASK_CHOICES[field_name]
+    bits = choice_bits(choices)
+    column = f"{prefix}{field_name}_mask"
+
+    mask = 0
+    for value in values:
+        if value not in bits:
+            if match == "all":
+                return models.Q(pk__in=[])
+            continue
+        mask |= bits[value]
+    if not mask:
+        return models.Q(pk__in=[])
+
+    width = len(bits)
+    if width <= BITMASK_IN_MAX_BITS:
+        if match == "all":
+            candidates = [m for m in range(1 << width) if m & mask == mask]
+        else:
+            candidates = [m for m in range(1 << width) if m & mask]
+        return models.Q(**{f"{column}__in": candidates})
+
+    lookup = "hasallbits" if match == "all" else "hasanybits"
+    return models.Q(**{f"{column}__{lookup}": mask})
@@ -0,0 +1,101 @@
+"""
+Maintenance of the `SurfZoneCard` read model (pre-rendered surfzones-lite cards).
+
+A card is the SurfZoneLiteSerializer output of a zone, rendered without a
+request (relative image URLs). Cards are refreshed incrementally by the
+surfzones signals, backfilled by `manage.py refresh_zone_cards`, and built on
+the fly by `SurfZoneCardSerializer` for any zone that has none yet.
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.db.models import Prefetch   # Ordered image prefetch
+
+# ============================
+# Django REST Framework Imports
+# ============================
+from rest_framework import serializers   # BaseSerializer for stored payloads
+
+# ============================
+# Local Application Imports
+# ============================
+from .models import SurfZone, SurfZoneImage, SurfZoneCard
+from .serializers import SurfZoneLiteSerializer
+
+
+# ============================
+# Card rendering
+# ============================
+def render_card(zone):
+    """Render the card payload of a zone (country and ordered images should be prefetched)."""
+    return SurfZoneLiteSerializer(zone).data
+
+
+def refresh_zone_cards(**filters):
+    """
+    Re-render and store the cards of the surf zones matching `filters`.
+
+    Returns the number of refreshed cards.
+    """
+    zone_images_qs = (
+        SurfZoneImage.objects
+        .only("id", "image", "variants", "created_at", "surfzone_id")
+        .order_by("created_at")
+    )
+    zones = (
+        SurfZone.objects
+        .filter(**filters)
+        .select_related("country")
+        .prefetch_related(Prefetch("zone_images", queryset=zone_images_qs))
+    )
+
+    count = 0
+    for zone in zones:
+        SurfZoneCard.objects.update_or_create(surfzone=zone, defaults={"payload": render_card(zone)})
+        count += 1
+    return count
+
+
+# ============================
+# Serializer
+# ============================
+class SurfZoneCardSerializer(serializers.BaseSerializer):
+    """
+    Read-only serializer returning the stored card of a zone.
+
+    The zone queryset should `select_related("card")`. Zones without a card
+    (created by bulk operations, or before the backfill) get one on the fly.
+    `fields` keeps only these keys of the card (sparse fieldsets).
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fieldset = fields
+
+    def to_representation(self, instance):
+        try:
+            payload = instance.card.payload
+        except SurfZoneCard.DoesNotExist:
+            refresh_zone_cards(pk=instance.pk)
+            payload = SurfZoneCard.objects.get(pk=instance.pk).payload
+        if self.fieldset is not None:
+            payload = {name: payload[name] for name in self.fieldset if name in payload}
+
+        request = self.context.get("request")
+        if request is None:
+            return payload
+        if "images" in payload:
+            payload = {**payload, "images": [request.build_absolute_uri(url) for url in payload["images"]]}
+        if "image_srcsets" in payload:
+            payload = {
+                **payload,
+                "image_srcsets": [
+                    {
+                        fmt: {width: request.build_absolute_uri(url) for width, url in urls.items()}
+                        for fmt, urls in srcsets.items()
+                    }
+                    for srcsets in payload["image_srcsets"]
+                ],
+            }
+        return payload
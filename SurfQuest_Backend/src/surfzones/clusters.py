@@ -0,0 +1,206 @@
+"""
+Server-side marker clustering of surf zones and surf spots by map zoom level.
+
+Points are projected to Web Mercator (x, y in [0, 1), the tile space of the
+map) and binned in a hierarchical grid: at zoom z a cell is a 1/2**CELL_BITS
+fraction of a 256 px tile (64 px), so the world is 2**(z + CELL_BITS) cells
+wide. The cells of zoom z are the cells of zoom z + 1 merged by pairs
+(indices >> 1), so every level is built from the one below it, in
+O(n * levels) in total.
+
+Each cell holds its point count, per-type counts, centroid and the zoom at
+which it splits (`expansion_zoom`, where a click on the cluster should zoom
+to). A query for a bounding box at a zoom returns the cells of that level
+overlapping the box: cells of one point are returned as that point, the
+others as clusters. Beyond CLUSTER_MAX_ZOOM, every point is returned
+individually.
+
+Cells of a level are sorted by column, so a query bisects the column range
+of the box and costs O(log cells + cells in the columns), whatever the size
+of the catalogue. The grids are built from the geo index entries when a
+worker starts (see surfquest/wsgi.py / asgi.py) and rebuilt with it when the
+catalogue changes (see surfquest/indexes.py).
+"""
+
+# ============================
+# Standard Library
+# ============================
+import bisect   # Column ranges of sorted cells
+import math   # Mercator projection
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.indexes import CatalogueIndex   # Lazily rebuilt in-memory index
+
+# ============================
+# Local Application Imports
+# ============================
+from .geo import geo_index   # Located zone / spot entries
+
+
+CELL_BITS = 2   # 4 x 4 cells of 64 px per 256 px tile
+CLUSTER_MAX_ZOOM = 14   # Above this zoom, points are never clustered
+MAX_ZOOM = 22
+MERCATOR_MAX_LATITUDE = 85.0511287798   # Latitude of the square Web Mercator world's edges
+POINT_FIELDS = ("type", "id", "name", "slug", "latitude", "longitude")
+
+
+# ============================
+# Projection
+# ============================
+def mercator_x(longitude):
+    """Web Mercator x in [0, 1] of a longitude."""
+    return (longitude + 180.0) / 360.0
+
+
+def mercator_y(latitude):
+    """Web Mercator y in [0, 1] (north to south) of a latitude, clamped to the map."""
+    lat = math.radians(max(-MERCATOR_MAX_LATITUDE, min(MERCATOR_MAX_LATITUDE, latitude)))
+    return (1.0 - math.log(math.tan(lat) + 1.0 / math.cos(lat)) / math.pi) / 2.0
+
+
+def cell_index(coordinate, size):
+    """Index of the cell holding a Mercator coordinate, on an axis of `size` cells."""
+    return min(int(coordinate * size), size - 1)
+
+
+# ============================
+# Grid
+# ============================
+class Cell:
+    """Points of one grid cell: counts, coordinate sums and, for a single point, that point."""
+    __slots__ = ("count", "zones", "lat_sum", "lon_sum", "point", "expansion_zoom")
+
+    def __init__(self, point=None):
+        self.count = 1 if point else 0
+        self.zones = int(bool(point) and point["type"] == "zone")
+        self.lat_sum = point["latitude"] if point else 0.0
+        self.lon_sum = point["longitude"] if point else 0.0
+        self.point = point
+        self.expansion_zoom = CLUSTER_MAX_ZOOM + 1
+
+    def merge(self, other):
+        self.count += other.count
+        self.zones += other.zones
+        self.lat_sum += other.lat_sum
+        self.lon_sum += other.lon_sum
+        self.point = None
+
+    def as_cluster(self):
+        return {
+            "count": self.count,
+            "zones": self.zones,
+            "spots": self.count - self.zones,
+            "latitude": round(self.lat_sum / self.count, 6),
+            "longitude": round(self.lon_sum / self.count, 6),
+            "expansion_zoom": self.expansion_zoom,
+        }
+
+
+class Level:
+    """Cells of one zoom level by (column, row) key, sorted."""
+
+    def __init__(self, cells):
+        self.keys = sorted(cells)
+        self.cells = [cells[key] for key in self.keys]
+
+    def within(self, column_ranges, row_min, row_max):
+        """Cells in the column ranges (inclusive) and between the rows."""
+        for column_min, column_max in column_ranges:
+            start = bisect.bisect_left(self.keys, (column_min, -1))
+            end = bisect.bisect_left(self.keys, (column_max + 1, -1))
+            for i in range(start, end):
+                if row_min <= self.keys[i][1] <= row_max:
+                    yield self.cells[i]
+
+
+class ClusterGrid:
+    """Cluster levels 0..CLUSTER_MAX_ZOOM over `entries` (geo index dicts), and the points above."""
+
+    def __init__(self, entries):
+        self.points = [{field: entry[field] for field in POINT_FIELDS} for entry in entries]
+        projected = [(mercator_x(p["longitude"]), mercator_y(p["latitude"])) for p in self.points]
+
+        # Finest cluster level, then each coarser one by merging cells by pairs.
+        # A cell with a single child is that child: the Cell object is shared,
+        # so the isolated points (most of them at high zoom) cost no allocation.
+        size = 2 ** (CLUSTER_MAX_ZOOM + CELL_BITS)
+        cells = {}
+        for point, (x, y) in zip(self.points, projected):
+            key = (cell_index(x, size), cell_index(y, size))
+            if key in cells:
+                cells[key].merge(Cell(point))
+            else:
+                cells[key] = Cell(point)
+
+        levels = [None] * (CLUSTER_MAX_ZOOM + 1)
+        levels[CLUSTER_MAX_ZOOM] = Level(cells)
+        for zoom in range(CLUSTER_MAX_ZOOM - 1, -1, -1):
+            parents, merged = {}, set()
+            for (column, row), child in cells.items():
+                key = (column >> 1, row >> 1)
+                parent = parents.get(key)
+                if parent is None:
+                    parents[key] = child
+                    continue
+                if key not in merged:   # Second child: a cell of its own, splitting at zoom + 1
+                    parents[key] = Cell()
+                    parents[key].merge(parent)
+                    parent = parents[key]
+                    parent.expansion_zoom = zoom + 1
+                    merged.add(key)
+                parent.merge(child)
+            levels[zoom] = Level(parents)
+            cells = parents
+        self.levels = levels
+
+        order = sorted(range(len(self.points)), key=lambda i: projected[i][0])
+        self.points = [self.points[i] for i in order]
+        self.point_xs = [projected[i][0] for i in order]
+        self.point_ys = [projected[i][1] for i in order]
+
+    def query(self, bbox, zoom):
+        """
+        Clusters and single points inside `bbox` ((min lon, min lat, max lon,
+        max lat); min lon > max lon crosses the antimeridian) at `zoom`.
+        """
+        min_lon, min_lat, max_lon, max_lat = bbox
+        x_ranges = (
+            [(mercator_x(min_lon), mercator_x(max_lon))] if min_lon <= max_lon
+            else [(mercator_x(min_lon), 1.0), (0.0, mercator_x(max_lon))]
+        )
+        y_min, y_max = mercator_y(max_lat), mercator_y(min_lat)   # y grows southwards
+
+        if zoom > CLUSTER_MAX_ZOOM:
+            points = []
+            for x_min, x_max in x_ranges:
+                start = bisect.bisect_left(self.point_xs, x_min)
+                end = bisect.bisect_right(self.point_xs, x_max)
+                points += [
+                    self.points[i] for i in range(start, end)
+                    if y_min <= self.point_ys[i] <= y_max
+                ]
+            return [], points
+
+        size = 2 ** (zoom + CELL_BITS)
+        column_ranges = [(cell_index(x_min, size), cell_index(x_max, size)) for x_min, x_max in x_ranges]
+        clusters, points = [], []
+        for cell in self.levels[zoom].within(column_ranges, cell_index(y_min, size), cell_index(y_max, size)):
+            if cell.count == 1:
+                points.append(cell.point)
+            else:
+                clusters.append(cell.as_cluster())
+        return clusters, points
+
+
+class ClusterIndex(CatalogueIndex):
+    """Cluster grids of the located zones, spots, and both ("zone", "spot", "all")."""
+
+    def build(self):
+        points = geo_index.get()
+        zones, spots = points["zone"].entries, points["spot"].entries
+        return {"zone": ClusterGrid(zones), "spot": ClusterGrid(spots), "all": ClusterGrid(zones + spots)}
+
+
+cluster_index = ClusterIndex()
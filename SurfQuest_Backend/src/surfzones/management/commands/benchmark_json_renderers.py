@@ -0,0 +1,101 @@
+"""
+Management command comparing DRF's stdlib JSON renderer / parser with the
+orjson ones (surfquest/renderers.py).
+
+The payloads are the serialized data of the heaviest list endpoints on the
+current database (load the fixtures first), so only the encoding / decoding
+step is timed, not the queries nor the serializers.
+
+Usage:
+    python manage.py loaddata <fixtures...>
+    python manage.py benchmark_json_renderers
+    python manage.py benchmark_json_renderers --repeat 200
+"""
+
+# ============================
+# Standard Library
+# ============================
+import io   # Request body streams for the parsers
+import json   # Check both renderers produce the same document
+import time   # Timing
+
+# ============================
+# Django Imports
+# ============================
+from django.core.management.base import BaseCommand, CommandError
+
+# ============================
+# Django REST Framework Imports
+# ============================
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.renderers import ORJSONParser, ORJSONRenderer, orjson_available
+from conditions.models import Condition
+from conditions.serializers import ConditionSerializer
+from users.models import User
+from users.serializers import UserSerializer
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.cards import SurfZoneCardSerializer
+from surfzones.models import SurfZone
+from surfzones.serializers import SurfZoneSerializer
+
+
+def payloads():
+    """(name, data) of the serialized list endpoints."""
+    zones = SurfZone.objects.select_related("country", "card").prefetch_related("zone_images", "conditions")
+    return [
+        ("surfzones-lite?all=true", SurfZoneCardSerializer(zones, many=True).data),
+        ("surfzones/ (legacy)", SurfZoneSerializer(zones, many=True).data),
+        ("conditions/", ConditionSerializer(Condition.objects.all(), many=True).data),
+        ("users/", UserSerializer(User.objects.all(), many=True).data),
+    ]
+
+
+def best_of(repeat, func):
+    """Best time of `repeat` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+class Command(BaseCommand):
+    help = "Benchmark JSON rendering and parsing of the API payloads with json vs orjson."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=50, help="Timed runs per payload (best one is kept).")
+
+    def handle(self, *args, **options):
+        if not orjson_available():
+            raise CommandError("orjson is not installed (see requirements.txt).")
+        repeat = options["repeat"]
+        json_renderer, orjson_renderer = JSONRenderer(), ORJSONRenderer()
+        json_parser, orjson_parser = JSONParser(), ORJSONParser()
+
+        self.stdout.write(
+            f"{'payload':<26}{'items':>7}{'KiB':>8}"
+            f"{'json ms':>10}{'orjson ms':>11}{'x':>6}{'parse json':>12}{'orjson':>8}{'x':>6}"
+        )
+        for name, data in payloads():
+            body = json_renderer.render(data)
+            if json.loads(orjson_renderer.render(data)) != json.loads(body):
+                raise CommandError(f"{name}: renderers disagree")
+
+            render_json = best_of(repeat, lambda: json_renderer.render(data))
+            render_orjson = best_of(repeat, lambda: orjson_renderer.render(data))
+            parse_json = best_of(repeat, lambda: json_parser.parse(io.BytesIO(body)))
+            parse_orjson = best_of(repeat, lambda: orjson_parser.parse(io.BytesIO(body)))
+            self.stdout.write(
+                f"{name:<26}{len(data):>7}{len(body) / 1024:>8.1f}"
+                f"{render_json:>10.2f}{render_orjson:>11.2f}{render_json / render_orjson:>6.1f}"
+                f"{parse_json:>12.2f}{parse_orjson:>8.2f}{parse_json / parse_orjson:>6.1f}"
+            )
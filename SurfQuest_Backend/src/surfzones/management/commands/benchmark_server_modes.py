@@ -0,0 +1,166 @@
+"""
+Management command comparing the WSGI and ASGI serving modes.
+
+Both modes are started with gunicorn on the current database (load the same
+fixtures first), with the same number of workers, then hit with the same
+request mix from concurrent clients. Optional slow clients hold connections
+open by trickling their request headers, as mobile clients on poor networks
+do: sync workers are tied up by each of them, uvicorn workers are not.
+
+Usage:
+    python manage.py loaddata <fixtures...>
+    python manage.py benchmark_server_modes
+    python manage.py benchmark_server_modes --concurrency 64 --slow-clients 16 --no-cache
+    python manage.py benchmark_server_modes --modes asgi --path /api/v1/reviews/
+
+Requires gunicorn, uvicorn and uvicorn-worker (see requirements.txt).
+"""
+
+# ============================
+# Standard Library
+# ============================
+import importlib.util   # Check the server packages are installed
+import os   # Child process environment
+import socket   # Slow clients
+import statistics   # Latency percentiles
+import subprocess   # Server processes
+import sys   # Current interpreter
+import threading   # Slow client threads
+import time   # Timing
+import urllib.error   # Failed requests
+import urllib.request   # HTTP client
+from concurrent.futures import ThreadPoolExecutor   # Concurrent clients
+
+# ============================
+# Django Imports
+# ============================
+from django.core.management.base import BaseCommand, CommandError
+
+
+DEFAULT_PATHS = (
+    "/api/v1/surfzones-lite/",
+    "/api/v1/surfzones-lite/?all=true",
+    "/api/v1/surfspots-lite/",
+    "/api/v1/conditions/",
+    "/api/v1/reviews/",
+)
+
+SERVER_COMMANDS = {
+    "wsgi": ["surfquest.wsgi:application"],
+    "asgi": ["--worker-class=uvicorn_worker.UvicornWorker", "surfquest.asgi:application"],
+}
+SERVER_PACKAGES = {"wsgi": ("gunicorn",), "asgi": ("gunicorn", "uvicorn", "uvicorn_worker")}
+
+
+class Command(BaseCommand):
+    help = "Benchmark the read-only API under gunicorn sync workers (WSGI) and uvicorn workers (ASGI)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--modes", nargs="+", choices=sorted(SERVER_COMMANDS), default=["wsgi", "asgi"])
+        parser.add_argument("--workers", type=int, default=4, help="Server worker processes.")
+        parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients.")
+        parser.add_argument("--requests", type=int, default=2000, help="Requests per mode.")
+        parser.add_argument("--slow-clients", type=int, default=0, help="Connections trickling their headers during the run.")
+        parser.add_argument("--path", action="append", dest="paths", help="Path to request (repeatable).")
+        parser.add_argument("--no-cache", action="store_true", help="Add a unique query param to bypass the response cache.")
+        parser.add_argument("--port", type=int, default=8765)
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or DEFAULT_PATHS
+        results = {}
+        for mode in options["modes"]:
+            missing = [name for name in SERVER_PACKAGES[mode] if importlib.util.find_spec(name) is None]
+            if missing:
+                raise CommandError(f"{mode}: missing package(s) {', '.join(missing)}")
+
+            server = self.start_server(mode, options["workers"], options["port"])
+            try:
+                base_url = f"http://127.0.0.1:{options['port']}"
+                self.wait_until_ready(base_url + paths[0], server)
+                results[mode] = self.run_load(base_url, paths, options)
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+
+        self.stdout.write(f"{'mode':<6}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+        for mode, r in results.items():
+            self.stdout.write(
+                f"{mode:<6}{r['rps']:>10.1f}{r['p50']:>10.1f}{r['p95']:>10.1f}{r['p99']:>10.1f}{r['errors']:>8}"
+            )
+
+    # ----------------------------
+    # Server
+    # ----------------------------
+    def start_server(self, mode, workers, port):
+        env = {**os.environ, "SERVER_MODE": mode}
+        command = [
+            sys.executable, "-m", "gunicorn", f"--workers={workers}", f"--bind=127.0.0.1:{port}",
+            "--log-level=warning", *SERVER_COMMANDS[mode],
+        ]
+        return subprocess.Popen(command, env=env)
+
+    def wait_until_ready(self, url, server, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError("The server exited during startup.")
+            try:
+                urllib.request.urlopen(url, timeout=2).read()
+                return
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.2)
+        raise CommandError("The server did not answer in time.")
+
+    # ----------------------------
+    # Load
+    # ----------------------------
+    def run_load(self, base_url, paths, options):
+        stop = threading.Event()
+        slow = [
+            threading.Thread(target=slow_client, args=(base_url, paths[0], stop), daemon=True)
+            for _ in range(options["slow_clients"])
+        ]
+        for thread in slow:
+            thread.start()
+        time.sleep(0.5 if slow else 0)   # Let slow clients grab their connections first
+
+        def fetch(i):
+            url = base_url + paths[i % len(paths)]
+            if options["no_cache"]:
+                url += ("&" if "?" in url else "?") + f"_bench={i}"
+            started = time.perf_counter()
+            try:
+                urllib.request.urlopen(url, timeout=60).read()
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                return None
+            return (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+            latencies = list(pool.map(fetch, range(options["requests"])))
+        elapsed = time.perf_counter() - started
+        stop.set()
+
+        ok = sorted(latency for latency in latencies if latency is not None)
+        if len(ok) < 2:
+            raise CommandError("Too few successful requests to report.")
+        percentiles = statistics.quantiles(ok, n=100)
+        return {
+            "rps": len(ok) / elapsed,
+            "p50": percentiles[49],
+            "p95": percentiles[94],
+            "p99": percentiles[98],
+            "errors": len(latencies) - len(ok),
+        }
+
+
+def slow_client(base_url, path, stop):
+    """Hold a connection by sending one header line per second until `stop` is set."""
+    host, port = base_url.removeprefix("http://").split(":")
+    try:
+        with socket.create_connection((host, int(port)), timeout=5) as sock:
+            sock.sendall(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n".encode())
+            while not stop.wait(1):
+                sock.sendall(b"X-Slow: 1\r\n")
+    except OSError:   # Closed by the server (e.g. request timeout)
+        pass
@@ -0,0 +1,96 @@
+"""
+Management command to build the responsive derivatives of existing images.
+
+New uploads get their derivatives on save; this backfills the media uploaded
+before, or rebuilds everything after changing IMAGE_DERIVATIVE_* settings.
+Images are decoded and encoded in a process pool (Pillow work is CPU bound);
+the database is only written from the main process.
+
+Usage:
+    python manage.py generate_image_derivatives              # missing / outdated only
+    python manage.py generate_image_derivatives --force      # rebuild everything
+    python manage.py generate_image_derivatives --workers 4
+"""
+
+# ============================
+# Standard Library
+# ============================
+import os   # cpu_count
+from concurrent.futures import ProcessPoolExecutor   # Parallel image processing
+
+# ============================
+# Django Imports
+# ============================
+import django   # Worker initialization (spawn start method)
+from django.core.management.base import BaseCommand
+from django.utils import timezone   # Version stamps
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import invalidate_catalogue_cache   # Payloads embed the srcsets
+from surfquest.images import generate_derivatives
+from users.models import User
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.cards import refresh_zone_cards
+from surfzones.models import SurfZone, SurfSpot, SurfZoneImage, SurfSpotImage
+
+
+# (model, image field, variants field)
+IMAGE_FIELDS = (
+    (SurfZoneImage, "image", "variants"),
+    (SurfSpotImage, "image", "variants"),
+    (User, "avatar", "avatar_variants"),
+)
+
+
+class Command(BaseCommand):
+    help = "Generate thumbnails and WebP/AVIF variants of zone, spot and avatar images."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild derivatives even when they are up to date.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes (1 = run in this process).",
+        )
+
+    def handle(self, *args, **options):
+        jobs = []   # (model, variants field, pk, image name)
+        for model, field, variants_field in IMAGE_FIELDS:
+            rows = model.objects.exclude(**{field: ""}).exclude(**{f"{field}__isnull": True})
+            for pk, name, variants in rows.values_list("pk", field, variants_field):
+                if options["force"] or (variants or {}).get("source") != name:
+                    jobs.append((model, variants_field, pk, name))
+
+        names = [name for *_, name in jobs]
+        if options["workers"] > 1 and len(names) > 1:
+            with ProcessPoolExecutor(max_workers=options["workers"], initializer=django.setup) as pool:
+                results = list(pool.map(generate_derivatives, names, chunksize=8))
+        else:
+            results = [generate_derivatives(name) for name in names]
+
+        built = 0
+        for (model, variants_field, pk, _), variants in zip(jobs, results):
+            if variants:
+                model.objects.filter(pk=pk).update(**{variants_field: variants})   # No signals / stamps
+                built += 1
+
+        if built:
+            # Zone and spot payloads embed the srcsets: move their ETags
+            now = timezone.now()
+            SurfSpot.objects.update(updated_at=now)
+            SurfZone.objects.update(content_updated_at=now)
+            refresh_zone_cards()
+            invalidate_catalogue_cache()
+        self.stdout.write(self.style.SUCCESS(
+            f"Built derivatives for {built} image(s), {len(jobs) - built} unreadable."
+        ))
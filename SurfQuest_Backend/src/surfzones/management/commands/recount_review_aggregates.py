@@ -0,0 +1,42 @@
+"""
+Management command to recompute the review aggregates of surf zones and spots.
+
+Needed after bulk operations that bypass the review signals (bulk_create,
+raw SQL imports).
+
+Usage:
+    python manage.py recount_review_aggregates
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.core.management.base import BaseCommand
+from django.utils import timezone   # Version stamps
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import invalidate_catalogue_cache   # Cached responses embed the aggregates
+from users.models import Review
+from users.ratings import recount_review_aggregates
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.cards import refresh_zone_cards
+from surfzones.models import SurfZone, SurfSpot
+
+
+class Command(BaseCommand):
+    help = "Recompute review_count, rating_sum, rating_avg and the rating histogram of every surf zone and spot."
+
+    def handle(self, *args, **options):
+        zones = recount_review_aggregates(SurfZone, Review, "surf_zone")
+        spots = recount_review_aggregates(SurfSpot, Review, "surf_spot")
+        now = timezone.now()
+        SurfZone.objects.update(updated_at=now, content_updated_at=now)
+        SurfSpot.objects.update(updated_at=now)
+        refresh_zone_cards()
+        invalidate_catalogue_cache()
+        self.stdout.write(self.style.SUCCESS(f"Recounted {zones} surf zone(s) and {spots} surf spot(s)."))
@@ -0,0 +1,33 @@
+"""
+Management command to rebuild the full-text search index (SearchDocument rows).
+
+Documents are refreshed by signals on save; this backfills them after the
+migration, a fixture load or a bulk update.
+
+Usage:
+    python manage.py refresh_search_index
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.core.management.base import BaseCommand
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import invalidate_catalogue_cache   # Rebuilds the in-memory search index
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search documents of every surf zone, surf spot and country."
+
+    def handle(self, *args, **options):
+        count = rebuild_search_index()
+        invalidate_catalogue_cache()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} search document(s)."))
@@ -0,0 +1,39 @@
+"""
+Management command to (re)build the pre-rendered surfzones-lite cards.
+
+Usage:
+    python manage.py refresh_zone_cards            # every surf zone
+    python manage.py refresh_zone_cards --missing  # only zones without a card
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.core.management.base import BaseCommand
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import invalidate_catalogue_cache   # Cached responses embed the cards
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.cards import refresh_zone_cards
+
+
+class Command(BaseCommand):
+    help = "Rebuild the SurfZoneCard read model used by /api/v1/surfzones-lite/."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="Only build cards for surf zones that have none.",
+        )
+
+    def handle(self, *args, **options):
+        filters = {"card__isnull": True} if options["missing"] else {}
+        count = refresh_zone_cards(**filters)
+        invalidate_catalogue_cache()
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {count} surf zone card(s)."))
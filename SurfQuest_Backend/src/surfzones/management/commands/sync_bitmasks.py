@@ -0,0 +1,44 @@
+"""
+Management command to recompute the choice bitmask columns from the arrays.
+
+Needed after writing rows without `save()` (`loaddata`, `QuerySet.update()`,
+`bulk_create()`) or after reordering a choices enum.
+
+Usage:
+    python manage.py sync_bitmasks
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.core.management.base import BaseCommand
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import invalidate_catalogue_cache   # Filters and indexes read the masks
+from conditions.models import Condition
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.bitmasks import backfill_bitmasks
+from surfzones.models import SurfZone, SurfSpot
+
+
+BITMASK_MODELS = (
+    (SurfZone, ("traveler_type", "best_months")),
+    (SurfSpot, ("best_tide", "surf_level", "best_months")),
+    (Condition, ("surf_level",)),
+)
+
+
+class Command(BaseCommand):
+    help = "Recompute the *_mask columns of surf zones, surf spots and conditions."
+
+    def handle(self, *args, **options):
+        for model, fields in BITMASK_MODELS:
+            count = backfill_bitmasks(model, fields)
+            self.stdout.write(f"{model.__name__}: {count} row(s) updated.")
+        invalidate_catalogue_cache()
+        self.stdout.write(self.style.SUCCESS("Bitmasks are in sync."))
@@ -0,0 +1,162 @@
+"""
+Map markers of every located surf zone and surf spot, precomputed.
+
+The map needs id, slug, type and coordinates of every point at once, and
+nothing else. The marker set is built once per catalogue version (see
+surfquest/indexes.py) and kept in memory as ready-to-send bodies, with the
+ETag of each, so a request costs one cache lookup and no query nor encoding.
+
+Two encodings of the same rows (zones first, then spots, each by name):
+
+- JSON, columnar (parallel arrays, coordinates rounded to 1e-5 degree):
+
+      {"count": 3, "types": ["zone", "spot"], "type": [0, 1, 1],
+       "id": [...], "slug": [...], "lat": [...], "lon": [...]}
+
+- binary (`application/octet-stream`), little-endian:
+
+      offset 0    b"SQMK", uint16 format version (1), uint16 reserved,
+                  uint32 zone count, uint32 spot count
+      offset 16   float32 lat[count], float32 lon[count]   (Float32Array-ready)
+      then        16-byte UUIDs id[count]
+      then        uint32 byte length + UTF-8 slugs joined with "\\n"
+"""
+
+# ============================
+# Standard Library
+# ============================
+import hashlib   # ETags
+import json   # Fallback encoder
+import struct   # Binary packing
+
+# ============================
+# Django Imports
+# ============================
+from django.utils.http import quote_etag   # ETag header formatting
+
+# ============================
+# Django REST Framework Imports
+# ============================
+from rest_framework.renderers import BaseRenderer   # ?format=bin / Accept: application/octet-stream
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.indexes import CatalogueIndex   # Lazily rebuilt in-memory index
+from surfquest.renderers import orjson   # Optional native JSON encoder (None when missing)
+
+# ============================
+# Local Application Imports
+# ============================
+from .models import SurfZone, SurfSpot
+
+
+MARKER_TYPES = ("zone", "spot")
+BINARY_MAGIC = b"SQMK"
+BINARY_VERSION = 1
+COORDINATE_DIGITS = 5   # ~1 m
+
+
+# ============================
+# Encoding
+# ============================
+def marker_rows():
+    """(type, id, slug, latitude, longitude) of every located zone, then spot, by name."""
+    rows = []
+    for marker_type, model in zip(MARKER_TYPES, (SurfZone, SurfSpot)):
+        rows += [
+            (marker_type, *row)
+            for row in (
+                model.objects
+                .filter(latitude__isnull=False, longitude__isnull=False)
+                .order_by("name", "id")
+                .values_list("id", "slug", "latitude", "longitude")
+            )
+        ]
+    return rows
+
+
+def encode_columnar(rows):
+    columns = {
+        "count": len(rows),
+        "types": list(MARKER_TYPES),
+        "type": [MARKER_TYPES.index(row[0]) for row in rows],
+        "id": [str(row[1]) for row in rows],
+        "slug": [row[2] for row in rows],
+        "lat": [round(row[3], COORDINATE_DIGITS) for row in rows],
+        "lon": [round(row[4], COORDINATE_DIGITS) for row in rows],
+    }
+    if orjson is not None:
+        return orjson.dumps(columns)
+    return json.dumps(columns, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def encode_binary(rows):
+    count = len(rows)
+    zone_count = sum(1 for row in rows if row[0] == "zone")
+    slugs = "\n".join(row[2] for row in rows).encode("utf-8")
+    return b"".join((
+        struct.pack("<4sHHII", BINARY_MAGIC, BINARY_VERSION, 0, zone_count, count - zone_count),
+        struct.pack(f"<{count}f", *(row[3] for row in rows)),
+        struct.pack(f"<{count}f", *(row[4] for row in rows)),
+        b"".join(row[1].bytes for row in rows),
+        struct.pack("<I", len(slugs)),
+        slugs,
+    ))
+
+
+def decode_binary(body):
+    """Rows of a binary body as (type, id hex, slug, latitude, longitude) (clients, tests)."""
+    magic, version, _, zone_count, spot_count = struct.unpack_from("<4sHHII", body)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError("Not a version 1 marker set.")
+    count = zone_count + spot_count
+    offset = 16
+    lats = struct.unpack_from(f"<{count}f", body, offset)
+    lons = struct.unpack_from(f"<{count}f", body, offset + 4 * count)
+    offset += 8 * count
+    ids = [body[offset + 16 * i:offset + 16 * (i + 1)].hex() for i in range(count)]
+    offset += 16 * count
+    (length,) = struct.unpack_from("<I", body, offset)
+    slugs = body[offset + 4:offset + 4 + length].decode("utf-8").split("\n") if count else []
+    types = ["zone"] * zone_count + ["spot"] * spot_count
+    return list(zip(types, ids, slugs, lats, lons))
+
+
+# ============================
+# Index
+# ============================
+class MarkerSet:
+    """Encoded marker bodies and their ETags, by format ("json" / "bin")."""
+
+    def __init__(self, rows):
+        self.count = len(rows)
+        self.bodies = {"json": encode_columnar(rows), "bin": encode_binary(rows)}
+        self.etags = {
+            fmt: quote_etag(hashlib.md5(body).hexdigest())
+            for fmt, body in self.bodies.items()
+        }
+
+
+class MarkerIndex(CatalogueIndex):
+    """Marker set of the current catalogue version."""
+
+    def build(self):
+        return MarkerSet(marker_rows())
+
+
+marker_index = MarkerIndex()
+
+
+# ============================
+# Renderer
+# ============================
+class MarkersBinaryRenderer(BaseRenderer):
+    """Negotiates the binary marker set; the body is already encoded."""
+    media_type = "application/octet-stream"
+    format = "bin"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return data
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.4 on 2026-10-18 16:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surfzones', '0023_surfzone_surfspot_version_stamps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SurfZoneCard',
+            fields=[
+                ('surfzone', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to='surfzones.surfzone')),
+                ('payload', models.JSONField(default=dict)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
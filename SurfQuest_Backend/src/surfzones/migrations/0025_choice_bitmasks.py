@@ -0,0 +1,45 @@
+# Generated by Django 5.1.4 on 2026-10-18 16:15
+
+import surfzones.bitmasks
+from django.db import migrations
+
+
+def backfill(apps, schema_editor):
+    surfzones.bitmasks.backfill_bitmasks(apps.get_model('surfzones', 'SurfZone'), ("traveler_type", "best_months"))
+    surfzones.bitmasks.backfill_bitmasks(apps.get_model('surfzones', 'SurfSpot'), ("best_tide", "surf_level", "best_months"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surfzones', '0024_surfzonecard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='surfspot',
+            name='best_months_mask',
+            field=surfzones.bitmasks.BitmaskField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfspot',
+            name='best_tide_mask',
+            field=surfzones.bitmasks.BitmaskField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfspot',
+            name='surf_level_mask',
+            field=surfzones.bitmasks.BitmaskField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='best_months_mask',
+            field=surfzones.bitmasks.BitmaskField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='traveler_type_mask',
+            field=surfzones.bitmasks.BitmaskField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-18 16:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surfzones', '0025_choice_bitmasks'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='surfspotimage',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfzoneimage',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
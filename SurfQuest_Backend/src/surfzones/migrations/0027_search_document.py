@@ -0,0 +1,34 @@
+# Generated by Django 5.1.4 on 2026-10-18 16:38
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surfzones', '0026_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(choices=[('zone', 'Surf zone'), ('spot', 'Surf spot'), ('country', 'Country')], max_length=10)),
+                ('object_id', models.UUIDField()),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.SlugField(blank=True, max_length=150)),
+                ('subtitle', models.CharField(blank=True, max_length=255)),
+                ('name_terms', models.TextField(blank=True)),
+                ('context_terms', models.TextField(blank=True)),
+                ('body_terms', models.TextField(blank=True)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+            ],
+            options={
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='search_document_vector_gin')],
+                'constraints': [models.UniqueConstraint(fields=('entity_type', 'object_id'), name='unique_search_document_per_entity')],
+            },
+        ),
+    ]
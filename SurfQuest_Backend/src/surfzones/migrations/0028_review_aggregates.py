@@ -0,0 +1,104 @@
+# Generated by Django 5.1.4 on 2026-10-18 16:45
+
+import users.ratings
+from django.db import migrations, models
+
+
+def backfill(apps, schema_editor):
+    Review = apps.get_model('users', 'Review')
+    users.ratings.recount_review_aggregates(apps.get_model('surfzones', 'SurfZone'), Review, 'surf_zone')
+    users.ratings.recount_review_aggregates(apps.get_model('surfzones', 'SurfSpot'), Review, 'surf_spot')
+    # Stored cards lack the aggregates: they are rebuilt on the fly (or with `refresh_zone_cards`)
+    apps.get_model('surfzones', 'SurfZoneCard').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surfzones', '0027_search_document'),
+        ('users', '0010_user_avatar_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='surfspot',
+            name='rating_1_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfspot',
+            name='rating_2_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfspot',
+            name='rating_3_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfspot',
+            name='rating_4_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfspot',
+            name='rating_5_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfspot',
+            name='rating_avg',
+            field=models.FloatField(db_index=True, default=0.0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfspot',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfspot',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='rating_1_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='rating_2_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='rating_3_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='rating_4_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='rating_5_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='rating_avg',
+            field=models.FloatField(db_index=True, default=0.0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
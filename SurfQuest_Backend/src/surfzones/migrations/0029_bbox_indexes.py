@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surfzones', '0028_review_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='surfspot',
+            index=models.Index(fields=['latitude', 'longitude'], name='surfspot_lat_lon_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surfzone',
+            index=models.Index(fields=['latitude', 'longitude'], name='surfzone_lat_lon_idx'),
+        ),
+    ]
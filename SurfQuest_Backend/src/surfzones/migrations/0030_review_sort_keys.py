@@ -0,0 +1,37 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:36
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+import django.db.models.functions.math
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surfzones', '0029_bbox_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='surfspot',
+            name='rating_sort_key',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.text.Concat(django.db.models.functions.text.LPad(django.db.models.functions.comparison.Cast(django.db.models.functions.comparison.Cast(django.db.models.functions.math.Round(django.db.models.expressions.CombinedExpression(models.F('rating_avg'), '*', models.Value(1000000))), models.BigIntegerField()), models.TextField()), 7, models.Value('0')), django.db.models.functions.text.LPad(django.db.models.functions.comparison.Cast(models.F('review_count'), models.TextField()), 10, models.Value('0')), django.db.models.functions.comparison.Cast('id', models.TextField()), output_field=models.TextField()), output_field=models.CharField(max_length=60)),
+        ),
+        migrations.AddField(
+            model_name='surfspot',
+            name='review_count_sort_key',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.text.Concat(django.db.models.functions.text.LPad(django.db.models.functions.comparison.Cast(models.F('review_count'), models.TextField()), 10, models.Value('0')), django.db.models.functions.text.LPad(django.db.models.functions.comparison.Cast(django.db.models.functions.comparison.Cast(django.db.models.functions.math.Round(django.db.models.expressions.CombinedExpression(models.F('rating_avg'), '*', models.Value(1000000))), models.BigIntegerField()), models.TextField()), 7, models.Value('0')), django.db.models.functions.comparison.Cast('id', models.TextField()), output_field=models.TextField()), output_field=models.CharField(max_length=60)),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='rating_sort_key',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.text.Concat(django.db.models.functions.text.LPad(django.db.models.functions.comparison.Cast(django.db.models.functions.comparison.Cast(django.db.models.functions.math.Round(django.db.models.expressions.CombinedExpression(models.F('rating_avg'), '*', models.Value(1000000))), models.BigIntegerField()), models.TextField()), 7, models.Value('0')), django.db.models.functions.text.LPad(django.db.models.functions.comparison.Cast(models.F('review_count'), models.TextField()), 10, models.Value('0')), django.db.models.functions.comparison.Cast('id', models.TextField()), output_field=models.TextField()), output_field=models.CharField(max_length=60)),
+        ),
+        migrations.AddField(
+            model_name='surfzone',
+            name='review_count_sort_key',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.text.Concat(django.db.models.functions.text.LPad(django.db.models.functions.comparison.Cast(models.F('review_count'), models.TextField()), 10, models.Value('0')), django.db.models.functions.text.LPad(django.db.models.functions.comparison.Cast(django.db.models.functions.comparison.Cast(django.db.models.functions.math.Round(django.db.models.expressions.CombinedExpression(models.F('rating_avg'), '*', models.Value(1000000))), models.BigIntegerField()), models.TextField()), 7, models.Value('0')), django.db.models.functions.comparison.Cast('id', models.TextField()), output_field=models.TextField()), output_field=models.CharField(max_length=60)),
+        ),
+    ]
@@ -14,9 +14,13 @@ import uuid # For generating unique UUIDs for each model instance
 # Django Core Models Utilities
 # ============================
 from django.db import models   # Provides base classes for defining Django models
+from django.db.models.functions import Cast, Concat, LPad, Round   # Unique sort keys of the review orderings
 from django.utils.text import slugify   # Converts text to URL-friendly slugs
 from django.core.validators import MinValueValidator, MaxValueValidator   # Ensures field values are within specified ranges
 from django.contrib.postgres.fields import ArrayField   # Enables array-like fields in PostgreSQL
+from django.contrib.postgres.indexes import GinIndex   # Full-text index on the search vectors
+from django.contrib.postgres.search import SearchVectorField   # Precomputed tsvector
+from django.utils import timezone   # Timestamps for content version stamps
 from datetime import datetime   # For generating unique slugs based on timestamps
 
 # ============================
@@ -34,6 +38,12 @@ from .choices import (   # Choices for various fields in the models
     SAFETY_CHOICES,
     MONTHS_CHOICES,
 )
+from .bitmasks import BitmaskField, sync_bitmasks   # Integer companions of the multi-choice arrays
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.images import prepare_variants   # Responsive image derivatives
 
 # ============================
 # External app import
@@ -93,7 +103,54 @@ class Country(models.Model):
         ordering = ['name']
 
 
-class SurfZone(models.Model):
+def sort_key(*parts):
+    """
+    Unique, lexicographically ordered text key: each (expression, width) part
+    zero-padded to `width` digits, then the id. Cursor pagination only
+    records the first ordering column, so it must never tie.
+    """
+    padded = [LPad(Cast(expression, models.TextField()), width, models.Value("0")) for expression, width in parts]
+    return Concat(*padded, Cast("id", models.TextField()), output_field=models.TextField())
+
+
+RATING_KEY = (Cast(Round(models.F("rating_avg") * 1000000), models.BigIntegerField()), 7)   # 0 .. 5000000
+REVIEW_COUNT_KEY = (models.F("review_count"), 10)   # PositiveIntegerField: up to 10 digits
+SORT_KEY_FIELDS = ("rating_sort_key", "review_count_sort_key")
+
+
+class ReviewAggregates(models.Model):
+    """
+    Review statistics of a surf zone or surf spot, maintained on each review
+    create / update / delete (see users/ratings.py) so that serializers and
+    list filters read them from the row itself.
+    """
+    review_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_sum = models.PositiveIntegerField(default=0, editable=False)
+    rating_avg = models.FloatField(default=0.0, editable=False, db_index=True)   # rating_sum / review_count, 0 without reviews (sorting, filtering)
+    rating_1_count = models.PositiveIntegerField(default=0, editable=False)   # Histogram of the 1 to 5 ratings
+    rating_2_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_3_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_4_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_5_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_sort_key = models.GeneratedField(   # ?ordering=rating: rating_avg, review_count, id
+        expression=sort_key(RATING_KEY, REVIEW_COUNT_KEY),
+        output_field=models.CharField(max_length=60), db_persist=True, db_index=True,
+    )
+    review_count_sort_key = models.GeneratedField(   # ?ordering=review_count: review_count, rating_avg, id
+        expression=sort_key(REVIEW_COUNT_KEY, RATING_KEY),
+        output_field=models.CharField(max_length=60), db_persist=True, db_index=True,
+    )
+
+    @property
+    def rating_histogram(self):
+        """Number of 1, 2, 3, 4 and 5 star ratings."""
+        return [getattr(self, f"rating_{rating}_count") for rating in range(1, 6)]
+
+    class Meta:
+        abstract = True
+
+
+class SurfZone(ReviewAggregates):
     """Defines a surf zone, its location, conditions, and descriptive details."""
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, unique=True)
     name = models.CharField(max_length=100)
@@ -122,11 +179,19 @@ class SurfZone(models.Model):
     description = models.TextField(null=True, blank=True)
     main_wave_direction = models.CharField(max_length=20, choices=WAVE_DIRECTION_CHOICES.choices, blank=True)   # Main wave direction for the surf zone (most spots with left or right waves or both)
     slug = models.SlugField(max_length=150, blank=True, unique=True)
+    updated_at = models.DateTimeField(default=timezone.now, editable=False)   # Last change of the zone row itself
+    content_updated_at = models.DateTimeField(default=timezone.now, editable=False)   # Last change of the zone or anything it embeds (country, spots, conditions, images)
+    traveler_type_mask = BitmaskField(default=0, editable=False, db_index=True)   # Bitmask of traveler_type (see bitmasks.py)
+    best_months_mask = BitmaskField(default=0, editable=False)   # Bitmask of best_months
 
     def save(self, *args, **kwargs):
-        """Auto-generate a slug from the name if not set."""
+        """Auto-generate a slug from the name if not set, refresh the bitmasks and version stamps."""
         if not self.slug:
             self.slug = slugify(self.name)
+        kwargs["update_fields"] = sync_bitmasks(self, ("traveler_type", "best_months"), kwargs.get("update_fields"))
+        self.updated_at = self.content_updated_at = timezone.now()
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "updated_at", "content_updated_at"}
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -137,10 +202,11 @@ class SurfZone(models.Model):
         constraints = [
             models.UniqueConstraint(fields=['name', 'country'], name='unique_surf_zone_for_country')
         ]
+        indexes = [models.Index(fields=['latitude', 'longitude'], name='surfzone_lat_lon_idx')]   # bbox viewport queries
         ordering = ['name']
 
 
-class SurfSpot(models.Model):
+class SurfSpot(ReviewAggregates):
     """Represents an individual surf spot within a surf zone."""
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, unique=True)
     name = models.CharField(max_length=100)
@@ -159,11 +225,19 @@ class SurfSpot(models.Model):
     best_months = ArrayField(base_field=models.CharField(max_length=100, choices=MONTHS_CHOICES.choices), blank=True, default=list)
     description = models.TextField(max_length=500, blank=True)
     slug = models.SlugField(max_length=150, blank=True, unique=True)
+    updated_at = models.DateTimeField(default=timezone.now, editable=False)   # Last change of the spot or its images
+    best_tide_mask = BitmaskField(default=0, editable=False, db_index=True)   # Bitmask of best_tide (see bitmasks.py)
+    surf_level_mask = BitmaskField(default=0, editable=False, db_index=True)   # Bitmask of surf_level
+    best_months_mask = BitmaskField(default=0, editable=False)   # Bitmask of best_months
 
     def save(self, *args, **kwargs):
-        """Auto-generate a slug from the name if not set."""
+        """Auto-generate a slug from the name if not set, refresh the bitmasks and version stamp."""
         if not self.slug:
             self.slug = slugify(self.name)
+        kwargs["update_fields"] = sync_bitmasks(self, ("best_tide", "surf_level", "best_months"), kwargs.get("update_fields"))
+        self.updated_at = timezone.now()
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "updated_at"}
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -171,6 +245,7 @@ class SurfSpot(models.Model):
         return self.name
     
     class Meta:
+        indexes = [models.Index(fields=['latitude', 'longitude'], name='surfspot_lat_lon_idx')]   # bbox viewport queries
         ordering = ['name']
 
 
@@ -182,12 +257,16 @@ class SurfZoneImage(models.Model):
     description = models.TextField(blank=True)
     slug = models.SlugField(max_length=150, blank=True, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    variants = models.JSONField(default=dict, blank=True, editable=False)   # Thumbnail / WebP derivatives (see surfquest/images.py)
 
     def save(self, *args, **kwargs):
-        """Auto-generate a unique slug using zone name and timestamp."""
+        """Auto-generate a unique slug using zone name and timestamp, build the image derivatives."""
         if not self.slug:
             current_time = datetime.now().strftime('%Y%m%d%H%M%S%f')
             self.slug = slugify(f"{self.surfzone.name}-{current_time}")
+        self.variants = prepare_variants(self.image, self.variants)
+        if kwargs.get("update_fields") is not None and "image" in kwargs["update_fields"]:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "variants"}
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -205,12 +284,16 @@ class SurfSpotImage(models.Model):
     description = models.TextField(blank=True)
     slug = models.SlugField(max_length=150, blank=True, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    variants = models.JSONField(default=dict, blank=True, editable=False)   # Thumbnail / WebP derivatives (see surfquest/images.py)
 
     def save(self, *args, **kwargs):
-        """Auto-generate a unique slug using spot name and timestamp."""
+        """Auto-generate a unique slug using spot name and timestamp, build the image derivatives."""
         if not self.slug:
             current_time = datetime.now().strftime('%Y%m%d%H%M%S%f')
             self.slug = slugify(f"{self.surfspot.name}-{current_time}")
+        self.variants = prepare_variants(self.image, self.variants)
+        if kwargs.get("update_fields") is not None and "image" in kwargs["update_fields"]:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "variants"}
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -219,3 +302,55 @@ class SurfSpotImage(models.Model):
     
     class Meta:
         ordering = ['surfspot']
+
+
+class SurfZoneCard(models.Model):
+    """
+    Denormalized read model: the rendered `surfzones-lite` card of a surf zone.
+
+    Stores the SurfZoneLiteSerializer output (country + first image included)
+    so that list requests return stored JSON instead of re-serializing each zone.
+    Image URLs are stored relative and made absolute per request.
+    Refreshed by signals when the zone, its country or its images change
+    (see `surfzones/cards.py`).
+    """
+    surfzone = models.OneToOneField(SurfZone, on_delete=models.CASCADE, primary_key=True, related_name='card')
+    payload = models.JSONField(default=dict)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """Readable representation of a surf zone card in admin and logs."""
+        return f"Card for {self.surfzone_id}"
+
+
+class SearchDocument(models.Model):
+    """
+    Denormalized search index entry of a surf zone, surf spot or country.
+
+    `name_terms`, `context_terms` and `body_terms` hold the accent- and
+    case-folded text of the entity, from the most to the least relevant
+    (weights A, B, C). On PostgreSQL, `search_vector` is their weighted
+    tsvector, behind a GIN index. Refreshed by signals when the entity (or
+    the zone / country it mentions) changes (see `surfzones/search.py`).
+    """
+    ENTITY_TYPES = [('zone', 'Surf zone'), ('spot', 'Surf spot'), ('country', 'Country')]
+
+    entity_type = models.CharField(max_length=10, choices=ENTITY_TYPES)
+    object_id = models.UUIDField()
+    name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=150, blank=True)
+    subtitle = models.CharField(max_length=255, blank=True)   # Where it is, e.g. "Peniche, Portugal" for a spot
+    name_terms = models.TextField(blank=True)
+    context_terms = models.TextField(blank=True)
+    body_terms = models.TextField(blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    def __str__(self):
+        """Readable representation of a search document in admin and logs."""
+        return f"{self.entity_type}: {self.name}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['entity_type', 'object_id'], name='unique_search_document_per_entity')
+        ]
+        indexes = [GinIndex(fields=['search_vector'], name='search_document_vector_gin')]
@@ -0,0 +1,331 @@
+"""
+Trip recommendation engine: ranks every surf zone for a user and a month.
+
+`User.preferences` is free-form JSON. The keys read here (all optional,
+invalid values are ignored):
+
+    {
+        "surf_level": "Intermediate",        # or a list of levels
+        "traveler_type": "Couple",
+        "confort": "Comfortable",
+        "safety": "Moderate",                # minimum acceptable safety
+        "cost": "Moderate",                  # maximum acceptable cost (default: from User.budget)
+        "water_temp_c_min": 20,
+        "swell_size_meter_min": 1.0,
+        "swell_size_meter_max": 2.5,
+        "max_distance_km": 8000,             # hard limit from the user's latitude / longitude
+        "weights": {"conditions": 3, ...}    # override DEFAULT_WEIGHTS
+    }
+
+Each component scores a zone between 0 (bad) and 1 (perfect match); the
+zone score is their weighted average. Unknown zone attributes score 0.5.
+
+Scoring does not touch the ORM: zone attributes and per-month condition
+metrics live in a precomputed columnar feature matrix (a CatalogueIndex,
+rebuilt on catalogue changes), and each component is computed column-wise
+over all zones. Ranked results are cached per (normalized preferences,
+origin, month) and catalogue version.
+"""
+
+# ============================
+# Standard Library
+# ============================
+import hashlib   # Cache key of the normalized preferences
+import heapq   # Top-N selection
+import json   # Canonical form of the preferences
+import math   # NaN / distances
+from array import array   # Compact typed columns
+
+# ============================
+# Django Imports
+# ============================
+from django.conf import settings   # API_CACHE_TIMEOUT
+from django.core.cache import cache   # Ranked results cache
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import get_catalogue_version   # Version embedded in cache keys
+from surfquest.indexes import CatalogueIndex   # Lazily rebuilt in-memory index
+from conditions.matrix import condition_matrix, MONTHS, MONTH_INDEX   # Per-month condition metrics
+
+# ============================
+# Local Application Imports
+# ============================
+from .bitmasks import choice_bits
+from .choices import (
+    COST_CHOICES,
+    CONFORT_CHOICES,
+    SAFETY_CHOICES,
+    SURF_LEVEL_CHOICES,
+    TRAVELER_TYPE_CHOICES,
+)
+from .geo import to_unit_vector, chord_to_km
+from .models import SurfZone
+
+
+DEFAULT_WEIGHTS = {
+    "conditions": 3.0,   # World surf rating of the month
+    "surf_level": 2.0,   # The month's waves suit the user's level
+    "water_temp": 1.0,
+    "swell": 1.0,
+    "cost": 1.0,
+    "confort": 1.0,
+    "safety": 1.0,
+    "traveler_type": 1.0,
+    "distance": 1.0,
+}
+
+# User.budget (upper bound, excluded) -> maximum cost level, when preferences don't set "cost"
+BUDGET_COST_LEVELS = (
+    (1000, COST_CHOICES.CHEAP),
+    (2500, COST_CHOICES.MODERATE),
+)
+
+DISTANCE_SCALE_KM = 2000   # Distance score halves at this distance
+MAX_RESULTS = 50   # Ranked results kept in cache (and max `limit`)
+
+COST_CODE = {value: i for i, value in enumerate(COST_CHOICES.values)}
+CONFORT_CODE = {value: i for i, value in enumerate(CONFORT_CHOICES.values)}
+SAFETY_CODE = {value: i for i, value in enumerate(SAFETY_CHOICES.values)}
+TRAVELER_TYPE_BIT = choice_bits(TRAVELER_TYPE_CHOICES)
+SURF_LEVEL_BIT = choice_bits(SURF_LEVEL_CHOICES)
+
+
+# ============================
+# Preferences
+# ============================
+def _number(value):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _choice(value, choices):
+    return value if value in choices.values else None
+
+
+def normalize_preferences(preferences, budget=None):
+    """Return the canonical preferences used for scoring (and cache keys)."""
+    preferences = preferences if isinstance(preferences, dict) else {}
+
+    levels = preferences.get("surf_level") or []
+    if isinstance(levels, str):
+        levels = [levels]
+    levels = sorted({level for level in levels if isinstance(level, str) and level in SURF_LEVEL_BIT})
+
+    cost = _choice(preferences.get("cost"), COST_CHOICES)
+    if cost is None and budget is not None:
+        cost = COST_CHOICES.EXPENSIVE
+        for upper_bound, level in BUDGET_COST_LEVELS:
+            if budget < upper_bound:
+                cost = level
+                break
+
+    weights = dict(DEFAULT_WEIGHTS)
+    custom_weights = preferences.get("weights")
+    if isinstance(custom_weights, dict):
+        for name, weight in custom_weights.items():
+            weight = _number(weight)
+            if name in weights and weight is not None and weight >= 0:
+                weights[name] = weight
+
+    return {
+        "surf_level": levels,
+        "traveler_type": _choice(preferences.get("traveler_type"), TRAVELER_TYPE_CHOICES),
+        "confort": _choice(preferences.get("confort"), CONFORT_CHOICES),
+        "safety": _choice(preferences.get("safety"), SAFETY_CHOICES),
+        "cost": str(cost) if cost else None,
+        "water_temp_c_min": _number(preferences.get("water_temp_c_min")),
+        "swell_size_meter_min": _number(preferences.get("swell_size_meter_min")),
+        "swell_size_meter_max": _number(preferences.get("swell_size_meter_max")),
+        "max_distance_km": _number(preferences.get("max_distance_km")),
+        "weights": weights,
+    }
+
+
+# ============================
+# Feature matrix
+# ============================
+class ZoneFeatures:
+    """Columnar zone attributes + per-month condition metrics, one slot per zone."""
+
+    def __init__(self, zone_rows, conditions):
+        self.zones = []
+        self.cost = array("b")
+        self.confort = array("b")
+        self.safety = array("b")
+        self.traveler_type = array("I")
+        self.points = []   # Unit vectors (None when the zone has no coordinates)
+        pks = []
+
+        for pk, name, slug, country, lat, lon, cost, confort, safety, traveler_mask in zone_rows:
+            pks.append(pk)
+            self.zones.append({
+                "id": str(pk), "name": name, "slug": slug, "country": country,
+                "latitude": lat, "longitude": lon,
+            })
+            self.cost.append(COST_CODE.get(cost, -1))
+            self.confort.append(CONFORT_CODE.get(confort, -1))
+            self.safety.append(SAFETY_CODE.get(safety, -1))
+            self.traveler_type.append(traveler_mask)
+            self.points.append(to_unit_vector(lat, lon) if lat is not None and lon is not None else None)
+
+        # Per-month columns aligned on self.zones (NaN / 0 when no condition row)
+        self.rating, self.water_temp, self.swell, self.surf_level = [], [], [], []
+        slots = [conditions.zone_index.get(pk) for pk in pks]
+        for month in MONTHS:
+            self.rating.append(self._column(conditions, "world_surf_rating", month, slots))
+            self.water_temp.append(self._column(conditions, "water_temp_c", month, slots))
+            self.swell.append(self._column(conditions, "swell_size_meter", month, slots))
+            offset = MONTH_INDEX[month] * conditions.zone_count
+            self.surf_level.append(array("B", (
+                0 if slot is None else conditions.surf_level[offset + slot] for slot in slots
+            )))
+
+    @staticmethod
+    def _column(conditions, metric, month, slots):
+        values = conditions.metrics[metric]
+        offset = MONTH_INDEX[month] * conditions.zone_count
+        return array("d", (math.nan if slot is None else values[offset + slot] for slot in slots))
+
+    # ----------------------------
+    # Component scores (one value per zone)
+    # ----------------------------
+    def score_components(self, prefs, month, origin=None):
+        """Return {component: [score per zone]} and the distances in km (or None)."""
+        m = MONTH_INDEX[month]
+        components = {}
+
+        components["conditions"] = [0.0 if math.isnan(r) else r / 5 for r in self.rating[m]]
+
+        wanted_levels = 0
+        for level in prefs["surf_level"]:
+            wanted_levels |= SURF_LEVEL_BIT[level]
+        components["surf_level"] = (
+            [1.0 if mask & wanted_levels else 0.0 for mask in self.surf_level[m]]
+            if wanted_levels else [0.5] * len(self.zones)
+        )
+
+        water_min = prefs["water_temp_c_min"]
+        components["water_temp"] = (
+            [0.0 if math.isnan(t) else min(1.0, max(0.0, 1 - (water_min - t) / 10)) for t in self.water_temp[m]]
+            if water_min is not None else [0.5] * len(self.zones)
+        )
+
+        low = prefs["swell_size_meter_min"]
+        high = prefs["swell_size_meter_max"]
+        if low is None and high is None:
+            components["swell"] = [0.5] * len(self.zones)
+        else:
+            low = -math.inf if low is None else low
+            high = math.inf if high is None else high
+            components["swell"] = [
+                0.0 if math.isnan(s) else max(0.0, 1 - max(low - s, s - high, 0.0))
+                for s in self.swell[m]
+            ]
+
+        cost_max = COST_CODE.get(prefs["cost"])
+        components["cost"] = [
+            0.5 if cost_max is None or c < 0 else max(0.0, 1 - 0.5 * max(0, c - cost_max))
+            for c in self.cost
+        ]
+
+        confort = CONFORT_CODE.get(prefs["confort"])
+        components["confort"] = [
+            0.5 if confort is None or c < 0 else max(0.0, 1 - 0.5 * abs(c - confort))
+            for c in self.confort
+        ]
+
+        safety_min = SAFETY_CODE.get(prefs["safety"])
+        components["safety"] = [
+            0.5 if safety_min is None or s < 0 else 0.5 ** max(0, safety_min - s)
+            for s in self.safety
+        ]
+
+        traveler_bit = TRAVELER_TYPE_BIT.get(prefs["traveler_type"], 0)
+        components["traveler_type"] = [
+            0.5 if not traveler_bit or not mask else float(bool(mask & traveler_bit))
+            for mask in self.traveler_type
+        ]
+
+        distances = None
+        if origin is not None:
+            origin_point = to_unit_vector(*origin)
+            distances = [None if p is None else chord_to_km(math.dist(origin_point, p)) for p in self.points]
+            components["distance"] = [0.0 if d is None else 1 / (1 + d / DISTANCE_SCALE_KM) for d in distances]
+        else:
+            components["distance"] = [0.5] * len(self.zones)
+
+        return components, distances
+
+    def rank(self, prefs, month, origin=None, limit=MAX_RESULTS):
+        """Return the `limit` best zones with their score, distance and breakdown."""
+        components, distances = self.score_components(prefs, month, origin)
+        weights = prefs["weights"]
+        total_weight = sum(weights.values()) or 1.0
+
+        scores = [0.0] * len(self.zones)
+        for name, column in components.items():
+            weight = weights[name]
+            if weight:
+                scores = [score + weight * value for score, value in zip(scores, column)]
+
+        max_distance = prefs["max_distance_km"]
+        candidates = range(len(self.zones))
+        if distances is not None and max_distance is not None:
+            candidates = [z for z in candidates if distances[z] is not None and distances[z] <= max_distance]
+
+        best = heapq.nlargest(limit, candidates, key=lambda z: (scores[z], self.zones[z]["name"]))
+        return [
+            {
+                "zone": self.zones[z],
+                "score": round(scores[z] / total_weight, 4),
+                "distance_km": None if distances is None or distances[z] is None else round(distances[z], 1),
+                "breakdown": {name: round(column[z], 3) for name, column in components.items()},
+            }
+            for z in best
+        ]
+
+
+class ZoneFeaturesIndex(CatalogueIndex):
+    """Feature matrix of every surf zone, rebuilt when the catalogue changes."""
+
+    def build(self):
+        zone_rows = (
+            SurfZone.objects.order_by("name")
+            .values_list(
+                "id", "name", "slug", "country__name", "latitude", "longitude",
+                "cost", "confort", "safety", "traveler_type_mask",
+            )
+        )
+        return ZoneFeatures(zone_rows, condition_matrix.get())
+
+
+zone_features = ZoneFeaturesIndex()
+
+
+# ============================
+# Entry point
+# ============================
+def recommend(preferences, budget=None, month=None, origin=None, limit=10):
+    """
+    Rank surf zones for raw `User.preferences` / `User.budget`, a month name and
+    an optional (latitude, longitude) origin. Results are cached.
+    """
+    prefs = normalize_preferences(preferences, budget)
+    origin = None if origin is None else (round(origin[0], 2), round(origin[1], 2))   # ~1 km buckets
+
+    payload = json.dumps({"prefs": prefs, "origin": origin, "month": month}, sort_keys=True)
+    digest = hashlib.md5(payload.encode("utf-8")).hexdigest()
+    features = zone_features.get()
+    database_version = hashlib.md5(repr(zone_features.database_version).encode("utf-8")).hexdigest()
+    key = f"api:recommendations:{get_catalogue_version()}:{database_version}:{digest}"   # Never outlives the index
+
+    ranked = cache.get(key)
+    if ranked is None:
+        ranked = features.rank(prefs, month, origin, MAX_RESULTS)
+        cache.set(key, ranked, settings.API_CACHE_TIMEOUT)
+    return ranked[:limit]
@@ -0,0 +1,274 @@
+"""
+Full-text search over surf zones, surf spots and countries.
+
+Each entity has a `SearchDocument` row (the precomputed search index) with
+its accent- and case-folded text split by relevance:
+
+    entity    A: name_terms   B: context_terms              C: body_terms
+    zone      name            nearest city, country         surroundings, description
+    spot      name            zone, nearest city, country   description
+    country   name            code, continent               -
+
+Two backends answer `search()` (settings.SEARCH_BACKEND):
+
+- "postgres": weighted `tsvector` column + GIN index, `ts_rank` ranking.
+- "memory": in-process inverted index over the same documents (tests,
+  SQLite), with the ts_rank default weights. Ranks are comparable within a
+  backend, not across backends.
+- "auto" (default): "postgres" on PostgreSQL, "memory" otherwise.
+
+Every query term must match (AND). With `prefix`, the last term also
+matches longer words ("peni" -> "peniche"), for typeahead.
+Documents are refreshed by the surfzones signals, and rebuilt with
+`manage.py refresh_search_index`.
+"""
+
+# ============================
+# Standard Library
+# ============================
+import bisect   # Prefix ranges in the sorted vocabulary
+import re   # Word tokenizer
+import unicodedata   # Accent folding
+
+# ============================
+# Django Imports
+# ============================
+from django.conf import settings   # SEARCH_BACKEND
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector   # tsvector / tsquery
+from django.db import connection   # Database vendor
+from django.db.models import F   # Rank over the stored vector
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.indexes import CatalogueIndex   # Lazily rebuilt in-memory index
+
+# ============================
+# Local Application Imports
+# ============================
+from .models import Country, SurfZone, SurfSpot, SearchDocument
+
+
+ENTITY_TYPES = ("zone", "spot", "country")
+SEARCH_CONFIG = "simple"   # Folded text is indexed as is: no stemming, prefix matching stays predictable
+TERM_FIELDS = (("name_terms", "A"), ("context_terms", "B"), ("body_terms", "C"))
+WEIGHTS = {"A": 1.0, "B": 0.4, "C": 0.2}   # ts_rank defaults
+WORD_RE = re.compile(r"[^\W_]+")
+
+SEARCH_VECTOR = (
+    SearchVector("name_terms", weight="A", config=SEARCH_CONFIG)
+    + SearchVector("context_terms", weight="B", config=SEARCH_CONFIG)
+    + SearchVector("body_terms", weight="C", config=SEARCH_CONFIG)
+)
+
+
+# ============================
+# Text folding
+# ============================
+def fold(text):
+    """Lowercase `text` and strip its accents ("Pénîche" -> "peniche")."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(*texts):
+    """Folded words of `texts`."""
+    return [word for text in texts for word in WORD_RE.findall(fold(text))]
+
+
+def terms_text(*texts):
+    return " ".join(tokenize(*texts))
+
+
+# ============================
+# Documents
+# ============================
+def zone_documents(**filters):
+    rows = SurfZone.objects.filter(**filters).values_list(
+        "id", "name", "slug", "nearest_city", "surroundings", "description", "country__name",
+    )
+    return [
+        SearchDocument(
+            entity_type="zone", object_id=pk, name=name, slug=slug or "", subtitle=country or "",
+            name_terms=terms_text(name),
+            context_terms=terms_text(city, country),
+            body_terms=terms_text(surroundings, description),
+        )
+        for pk, name, slug, city, surroundings, description, country in rows
+    ]
+
+
+def spot_documents(**filters):
+    rows = SurfSpot.objects.filter(**filters).values_list(
+        "id", "name", "slug", "description", "surfzone__name", "surfzone__nearest_city", "surfzone__country__name",
+    )
+    return [
+        SearchDocument(
+            entity_type="spot", object_id=pk, name=name, slug=slug or "", subtitle=f"{zone}, {country}",
+            name_terms=terms_text(name),
+            context_terms=terms_text(zone, city, country),
+            body_terms=terms_text(description),
+        )
+        for pk, name, slug, description, zone, city, country in rows
+    ]
+
+
+def country_documents(**filters):
+    rows = Country.objects.filter(**filters).values_list("id", "name", "slug", "code", "continent__name")
+    return [
+        SearchDocument(
+            entity_type="country", object_id=pk, name=name, slug=slug or "", subtitle=continent or "",
+            name_terms=terms_text(name),
+            context_terms=terms_text(code, continent),
+        )
+        for pk, name, slug, code, continent in rows
+    ]
+
+
+DOCUMENT_BUILDERS = {"zone": zone_documents, "spot": spot_documents, "country": country_documents}
+
+
+def refresh_search_documents(entity_type, **filters):
+    """
+    (Re)build the search documents of the `entity_type` rows matching `filters`.
+
+    Upserts the documents in one query, then computes their tsvectors in one
+    UPDATE on PostgreSQL. Returns the number of refreshed documents.
+    """
+    documents = DOCUMENT_BUILDERS[entity_type](**filters)
+    if not documents:
+        return 0
+    SearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=["entity_type", "object_id"],
+        update_fields=["name", "slug", "subtitle", "name_terms", "context_terms", "body_terms"],
+    )
+    if connection.vendor == "postgresql":
+        SearchDocument.objects.filter(
+            entity_type=entity_type, object_id__in=[doc.object_id for doc in documents],
+        ).update(search_vector=SEARCH_VECTOR)
+    return len(documents)
+
+
+def remove_search_document(entity_type, object_id):
+    SearchDocument.objects.filter(entity_type=entity_type, object_id=object_id).delete()
+
+
+def rebuild_search_index():
+    """Rebuild every search document. Returns the number of documents."""
+    SearchDocument.objects.all().delete()
+    return sum(refresh_search_documents(entity_type) for entity_type in ENTITY_TYPES)
+
+
+# ============================
+# In-memory inverted index
+# ============================
+class InvertedIndex:
+    """
+    Term -> {document: weight} postings over the search documents.
+
+    The vocabulary is kept sorted so that the words starting with a prefix
+    form a contiguous range, found with two bisections.
+    """
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.postings = {}
+        for i, document in enumerate(documents):
+            for field, weight in TERM_FIELDS:
+                for term in document[field].split():
+                    postings = self.postings.setdefault(term, {})
+                    postings[i] = max(postings.get(i, 0.0), WEIGHTS[weight])
+        self.vocabulary = sorted(self.postings)
+
+    def matching(self, term, prefix=False):
+        """{document: weight} of the documents containing `term` (or a word starting with it)."""
+        if not prefix:
+            return self.postings.get(term, {})
+        lo = bisect.bisect_left(self.vocabulary, term)
+        hi = bisect.bisect_left(self.vocabulary, term + "\uffff")   # Past every word starting with `term`
+        matches = {}
+        for word in self.vocabulary[lo:hi]:
+            for i, weight in self.postings[word].items():
+                matches[i] = max(matches.get(i, 0.0), weight)
+        return matches
+
+    def search(self, terms, types=ENTITY_TYPES, limit=20, prefix=True):
+        scores = None
+        for position, term in enumerate(terms):
+            matches = self.matching(term, prefix and position == len(terms) - 1)
+            if scores is None:
+                scores = dict(matches)
+            else:
+                scores = {i: score + matches[i] for i, score in scores.items() if i in matches}
+            if not scores:
+                return []
+        ranked = sorted(
+            (i for i in scores if self.documents[i]["entity_type"] in types),
+            key=lambda i: (-scores[i], self.documents[i]["name"]),
+        )
+        return [document_result(self.documents[i], scores[i]) for i in ranked[:limit]]
+
+
+class SearchIndex(CatalogueIndex):
+    """In-memory inverted index of every search document."""
+
+    def build(self):
+        fields = ("entity_type", "object_id", "name", "slug", "subtitle", *(field for field, _ in TERM_FIELDS))
+        return InvertedIndex(list(SearchDocument.objects.order_by().values(*fields)))
+
+
+search_index = SearchIndex()
+
+
+# ============================
+# Search
+# ============================
+def document_result(document, rank):
+    return {
+        "type": document["entity_type"],
+        "id": str(document["object_id"]),
+        "name": document["name"],
+        "slug": document["slug"],
+        "subtitle": document["subtitle"],
+        "rank": round(rank, 4),
+    }
+
+
+def search_backend():
+    backend = settings.SEARCH_BACKEND
+    if backend == "auto":
+        return "postgres" if connection.vendor == "postgresql" else "memory"
+    return backend
+
+
+def to_tsquery(terms, prefix):
+    """Raw tsquery ANDing `terms` (folded words only, so nothing needs escaping)."""
+    return " & ".join(
+        f"{term}:*" if prefix and position == len(terms) - 1 else term
+        for position, term in enumerate(terms)
+    )
+
+
+def search(query, types=ENTITY_TYPES, limit=20, prefix=True):
+    """
+    Best matching entities for the free-text `query`, most relevant first.
+
+    Returns dicts with type, id, name, slug, subtitle and rank.
+    """
+    terms = tokenize(query)
+    if not terms:
+        return []
+    if search_backend() == "memory":
+        return search_index.get().search(terms, types, limit, prefix)
+
+    tsquery = SearchQuery(to_tsquery(terms, prefix), search_type="raw", config=SEARCH_CONFIG)
+    documents = (
+        SearchDocument.objects
+        .filter(search_vector=tsquery, entity_type__in=types)
+        .annotate(rank=SearchRank(F("search_vector"), tsquery))
+        .order_by("-rank", "name")
+        .values("entity_type", "object_id", "name", "slug", "subtitle", "rank")[:limit]
+    )
+    return [document_result(document, document["rank"]) for document in documents]
@@ -20,8 +20,19 @@ from .models import (
     SurfSpot,
     SurfZoneImage,
     SurfSpotImage,
+    SORT_KEY_FIELDS,   # Internal pagination keys, not part of the payloads
 )
 
+from .choices import MONTHS_CHOICES
+from .clusters import MAX_ZOOM   # Deepest map zoom level
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.images import srcset_map   # Thumbnail / WebP URLs
+from surfquest.fieldsets import SparseFieldsetMixin   # ?fields= / ?omit=
+from surfquest.memo import MemoizedSerializerMixin   # Nested payloads rendered once per response
+
 # ============================
 # External App Serializers
 # ============================
@@ -60,7 +71,7 @@ class SurfZoneSerializer(serializers.ModelSerializer):
     conditions = ConditionSerializer(many=True, read_only=True)
     class Meta:
         model = SurfZone
-        fields = '__all__'
+        exclude = SORT_KEY_FIELDS
 
 class SurfSpotImageSerializer(serializers.ModelSerializer):
     """Serializer for images associated with a SurfSpot."""
@@ -68,17 +79,23 @@ class SurfSpotImageSerializer(serializers.ModelSerializer):
         model = SurfSpotImage
         fields = '__all__'
 
+class NestedSurfZoneSerializer(MemoizedSerializerMixin, SurfZoneSerializer):
+    """SurfZoneSerializer nested in spot and review payloads: each zone is serialized once per response."""
+
 class SurfSpotSerializer(serializers.ModelSerializer):
     """
     Serializer for SurfSpot model.
 
     Includes nested surfzone and related images.
     """
-    surfzone = SurfZoneSerializer(read_only=True)
+    surfzone = NestedSurfZoneSerializer(read_only=True)
     spot_images = SurfSpotImageSerializer(many=True, read_only=True)
     class Meta:
         model = SurfSpot
-        fields = '__all__'
+        exclude = SORT_KEY_FIELDS
+
+class NestedSurfSpotSerializer(MemoizedSerializerMixin, SurfSpotSerializer):
+    """SurfSpotSerializer nested in review payloads: each spot is serialized once per response."""
 
 
 # ===============================================================================================================================================================
@@ -97,8 +114,27 @@ class CountryLiteSerializer(serializers.ModelSerializer):
 
 
 # ======================================================================
-# Shared helper (images -> list[str])
+# Shared helpers (images -> list[str])
 # ======================================================================
+def resolve_images(obj, related_name, limit=None):
+    """
+    Returns the first `limit` images of `obj.<related_name>`, ordered by created_at.
+
+    When the view prefetched the relation (with an ordered Prefetch queryset),
+    the cached list is sliced in Python and no query is issued. Re-ordering a
+    prefetched relation (`.all().order_by(...)`) would silently bypass the cache
+    and fire one query per object, so we never do it.
+    Without a prefetch, a single ordered + limited query is used.
+    """
+    cache = getattr(obj, "_prefetched_objects_cache", {})
+    if related_name in cache:
+        images = list(cache[related_name])
+        return images[:limit] if limit else images
+
+    images = getattr(obj, related_name).order_by("created_at")
+    return list(images[:limit] if limit else images)
+
+
 def build_image_urls(queryset, request=None, limit=None):
     """
     Returns a list of image URLs.
@@ -115,16 +151,30 @@ def build_image_urls(queryset, request=None, limit=None):
             # urls.append(url)  # /media/...   -->A utiliser pour les conteneurs productions sinon les images ne s'affichent pas
     return urls
 
+def build_image_srcsets(images, request=None):
+    """
+    Returns one srcset map per image (same order as `build_image_urls`):
+    {format: {"<width>w": url}}, empty until the derivatives exist.
+    """
+    return [srcset_map(img.image, img.variants, request=request) for img in images if img.image]
+
+
+RATING_HISTOGRAM_SOURCES = tuple(f"rating_{rating}_count" for rating in range(1, 6))   # Columns read by rating_histogram
+
+
 # ======================================================================
 # SurfZone - Lite Serializer (list/cards)
 # ======================================================================
-class SurfZoneLiteSerializer(serializers.ModelSerializer):
+class SurfZoneLiteSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     SurfZone list serializer (lite).
     - images: max 1 image (card usage)
+    - image_srcsets: thumbnail / WebP URLs of those images
+    - review_count / rating_avg / rating_histogram: stored review aggregates
     """
     country = CountryLiteSerializer(read_only=True)
     images = serializers.SerializerMethodField()
+    image_srcsets = serializers.SerializerMethodField()
 
     class Meta:
         model = SurfZone
@@ -151,32 +201,40 @@ class SurfZoneLiteSerializer(serializers.ModelSerializer):
             "description",
             "main_wave_direction",
             "images",
+            "image_srcsets",
+            "review_count",
+            "rating_avg",
+            "rating_histogram",
         )
+        field_sources = {   # ORM paths of the fields whose source doesn't tell (see surfquest/fieldsets.py)
+            "images": ("zone_images",),
+            "image_srcsets": ("zone_images",),
+            "rating_histogram": RATING_HISTOGRAM_SOURCES,
+        }
 
     def get_images(self, obj):
         request = self.context.get("request")
+        return build_image_urls(resolve_images(obj, "zone_images", limit=1), request=request)
 
-        cache = getattr(obj, "_prefetched_objects_cache", {})
-        if "zone_images" in cache:
-            images_qs = cache["zone_images"]
-        else:
-            images_qs = obj.zone_images.all().order_by("created_at")
-
-        return build_image_urls(images_qs, request=request, limit=1)
+    def get_image_srcsets(self, obj):
+        request = self.context.get("request")
+        return build_image_srcsets(resolve_images(obj, "zone_images", limit=1), request=request)
 
 
 # ======================================================================
 # SurfSpot - Lite Serializer (embedded or list)
 # ======================================================================
-class SurfSpotLiteSerializer(serializers.ModelSerializer):
+class SurfSpotLiteSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     SurfSpot lite serializer.
     - images: max 1 image
     - surfzone_name & slug for UI/routing
+    - review_count / rating_avg / rating_histogram: stored review aggregates
     """
     surfzone_name = serializers.CharField(source="surfzone.name", read_only=True)
     surfzone_slug = serializers.CharField(source="surfzone.slug", read_only=True)
     images = serializers.SerializerMethodField()
+    image_srcsets = serializers.SerializerMethodField()
 
     class Meta:
         model = SurfSpot
@@ -201,18 +259,24 @@ class SurfSpotLiteSerializer(serializers.ModelSerializer):
             "best_months",
             "description",
             "images",
+            "image_srcsets",
+            "review_count",
+            "rating_avg",
+            "rating_histogram",
         )
+        field_sources = {
+            "images": ("spot_images",),
+            "image_srcsets": ("spot_images",),
+            "rating_histogram": RATING_HISTOGRAM_SOURCES,
+        }
 
     def get_images(self, obj):
         request = self.context.get("request")
+        return build_image_urls(resolve_images(obj, "spot_images", limit=1), request=request)
 
-        cache = getattr(obj, "_prefetched_objects_cache", {})
-        if "spot_images" in cache:
-            images_qs = cache["spot_images"]
-        else:
-            images_qs = obj.spot_images.all().order_by("created_at")
-
-        return build_image_urls(images_qs, request=request, limit=1)
+    def get_image_srcsets(self, obj):
+        request = self.context.get("request")
+        return build_image_srcsets(resolve_images(obj, "spot_images", limit=1), request=request)
 
 
 # ======================================================================
@@ -224,6 +288,7 @@ class SurfSpotForZoneDetailSerializer(serializers.ModelSerializer):
     - images: max 5 images (carousel)
     """
     images = serializers.SerializerMethodField()
+    image_srcsets = serializers.SerializerMethodField()
 
     class Meta:
         model = SurfSpot
@@ -245,26 +310,32 @@ class SurfSpotForZoneDetailSerializer(serializers.ModelSerializer):
             "best_months",
             "description",
             "images",
+            "image_srcsets",
         )
 
     def get_images(self, obj):
         request = self.context.get("request")
-        imgs = obj.spot_images.all().order_by("created_at")
-        return build_image_urls(imgs, request=request, limit=5)
+        return build_image_urls(resolve_images(obj, "spot_images", limit=5), request=request)
+
+    def get_image_srcsets(self, obj):
+        request = self.context.get("request")
+        return build_image_srcsets(resolve_images(obj, "spot_images", limit=5), request=request)
 
 
 # ======================================================================
 # SurfZone - Detail Serializer (full)
 # ======================================================================
-class SurfZoneDetailSerializer(serializers.ModelSerializer):
+class SurfZoneDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     SurfZone detail serializer.
     - images: max 2 images
+    - review_count / rating_avg / rating_histogram: stored review aggregates
     - conditions
     - surf spots (lite with carousel images)
     """
     country = CountryLiteSerializer(read_only=True)
     images = serializers.SerializerMethodField()
+    image_srcsets = serializers.SerializerMethodField()
     conditions = ConditionSerializer(many=True, read_only=True)
     surf_spots = SurfSpotForZoneDetailSerializer(many=True, read_only=True)
 
@@ -293,28 +364,42 @@ class SurfZoneDetailSerializer(serializers.ModelSerializer):
             "description",
             "main_wave_direction",
             "images",
+            "image_srcsets",
+            "review_count",
+            "rating_avg",
+            "rating_histogram",
             "conditions",
             "surf_spots",
         )
+        field_sources = {
+            "images": ("zone_images",),
+            "image_srcsets": ("zone_images",),
+            "rating_histogram": RATING_HISTOGRAM_SOURCES,
+        }
 
     def get_images(self, obj):
         request = self.context.get("request")
-        imgs = obj.zone_images.all().order_by("created_at")
-        return build_image_urls(imgs, request=request, limit=2)
+        return build_image_urls(resolve_images(obj, "zone_images", limit=2), request=request)
+
+    def get_image_srcsets(self, obj):
+        request = self.context.get("request")
+        return build_image_srcsets(resolve_images(obj, "zone_images", limit=2), request=request)
 
 
 # ======================================================================
 # SurfSpot - Detail Serializer (full)
 # ======================================================================
-class SurfSpotDetailSerializer(serializers.ModelSerializer):
+class SurfSpotDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     SurfSpot detail serializer.
     - images: all images
     - surfzone name + slug
+    - review_count / rating_avg / rating_histogram: stored review aggregates
     """
     surfzone_name = serializers.CharField(source="surfzone.name", read_only=True)
     surfzone_slug = serializers.CharField(source="surfzone.slug", read_only=True)
     images = serializers.SerializerMethodField()
+    image_srcsets = serializers.SerializerMethodField()
 
     class Meta:
         model = SurfSpot
@@ -339,9 +424,123 @@ class SurfSpotDetailSerializer(serializers.ModelSerializer):
             "best_months",
             "description",
             "images",
+            "image_srcsets",
+            "review_count",
+            "rating_avg",
+            "rating_histogram",
         )
+        field_sources = {
+            "images": ("spot_images",),
+            "image_srcsets": ("spot_images",),
+            "rating_histogram": RATING_HISTOGRAM_SOURCES,
+        }
 
     def get_images(self, obj):
         request = self.context.get("request")
-        imgs = obj.spot_images.all().order_by("created_at")
-        return build_image_urls(imgs, request=request)
\ No newline at end of file
+        return build_image_urls(resolve_images(obj, "spot_images"), request=request)
+
+    def get_image_srcsets(self, obj):
+        request = self.context.get("request")
+        return build_image_srcsets(resolve_images(obj, "spot_images"), request=request)
+
+# ============================
+# Query Serializers
+# ============================
+class BoundingBoxField(serializers.Field):
+    """
+    `minLon,minLat,maxLon,maxLat` in degrees, as a tuple of floats.
+
+    minLon may exceed maxLon: the box then crosses the antimeridian.
+    """
+    default_error_messages = {
+        "invalid": "Expected minLon,minLat,maxLon,maxLat.",
+        "range": "Longitudes must be within [-180, 180] and latitudes within [-90, 90], minLat <= maxLat.",
+    }
+
+    def to_internal_value(self, data):
+        try:
+            min_lon, min_lat, max_lon, max_lat = (float(value) for value in str(data).split(","))
+        except ValueError:
+            self.fail("invalid")
+        if not (
+            all(-180 <= lon <= 180 for lon in (min_lon, max_lon))
+            and -90 <= min_lat <= max_lat <= 90
+        ):
+            self.fail("range")
+        return (min_lon, min_lat, max_lon, max_lat)
+
+    def to_representation(self, value):
+        return ",".join(str(coordinate) for coordinate in value)
+
+
+class NearbyQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the nearby (geo search) endpoint.
+
+    - lat / lon: origin (defaults to the authenticated user's coordinates)
+    - radius_km: only return points within this distance
+    - k: number of nearest points (default 10 when no radius is given)
+    - type: "zone", "spot" or "all"
+    """
+    lat = serializers.FloatField(min_value=-90, max_value=90, required=False)
+    lon = serializers.FloatField(min_value=-180, max_value=180, required=False)
+    radius_km = serializers.FloatField(min_value=0, max_value=20038, required=False)   # Half the Earth's circumference
+    k = serializers.IntegerField(min_value=1, required=False)
+    type = serializers.ChoiceField(choices=("zone", "spot", "all"), default="zone")
+
+    def validate(self, attrs):
+        if ("lat" in attrs) != ("lon" in attrs):
+            raise serializers.ValidationError("Provide both lat and lon.")
+        return attrs
+
+
+class ClusterQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the clusters endpoint.
+
+    - bbox: visible map area, minLon,minLat,maxLon,maxLat (whole world by default)
+    - zoom: map zoom level
+    - type: "zone", "spot" or "all"
+    """
+    bbox = BoundingBoxField(default=(-180.0, -90.0, 180.0, 90.0))
+    zoom = serializers.IntegerField(min_value=0, max_value=MAX_ZOOM)
+    type = serializers.ChoiceField(choices=("zone", "spot", "all"), default="all")
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the search endpoint.
+
+    - q: free text (every word must match)
+    - type: "zone", "spot", "country" or "all"
+    - prefix: match the last word as a prefix (typeahead), default true
+    - limit: number of results
+    """
+    q = serializers.CharField(max_length=200)
+    type = serializers.ChoiceField(choices=("zone", "spot", "country", "all"), default="all")
+    prefix = serializers.BooleanField(default=True)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the autocomplete endpoint.
+
+    - q: what the user typed so far
+    - type: "zone", "spot", "country", "city" or "all"
+    - limit: number of suggestions
+    """
+    q = serializers.CharField(max_length=100)
+    type = serializers.ChoiceField(choices=("zone", "spot", "country", "city", "all"), default="all")
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=8)
+
+
+class RecommendationQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the recommendations endpoint.
+
+    - month: month name (defaults to the current month)
+    - limit: number of zones returned
+    """
+    month = serializers.ChoiceField(choices=MONTHS_CHOICES.choices, required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
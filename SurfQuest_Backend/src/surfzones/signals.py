@@ -0,0 +1,127 @@
+"""
+Signal handlers for the surfzones app.
+
+Keeps derived data in sync with the catalogue:
+- any save or delete of a country, surf zone, surf spot or image invalidates
+  the cached API responses;
+- changes to what a surf zone embeds (country, spots, images) roll up into
+  `SurfZone.content_updated_at`, and spot image changes into
+  `SurfSpot.updated_at`, which drive the ETag / Last-Modified validators;
+- the pre-rendered surfzones-lite card of a zone is refreshed when the zone,
+  its country or its images change;
+- the search documents of a country, zone or spot are refreshed when it
+  changes, along with those of the zones / spots that mention its name;
+- the in-memory autocomplete index is patched the same way once committed.
+
+Stamps are written with `QuerySet.update()` so that no further signal fires.
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.db.models.signals import post_save, post_delete   # Model lifecycle signals
+from django.utils import timezone   # Version stamps
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import invalidate_catalogue_cache   # Bumps the cached API responses version
+
+# ============================
+# Local Application Imports
+# ============================
+from .models import Country, SurfZone, SurfSpot, SurfZoneImage, SurfSpotImage
+from .cards import refresh_zone_cards
+from .search import refresh_search_documents, remove_search_document
+from .autocomplete import autocomplete_index
+
+
+SEARCH_ENTITY_TYPES = {Country: "country", SurfZone: "zone", SurfSpot: "spot"}
+
+
+# ============================
+# Helpers
+# ============================
+def touch_surfzones(**filters):
+    """Set `content_updated_at` to now on the surf zones matching `filters`."""
+    SurfZone.objects.filter(**filters).update(content_updated_at=timezone.now())
+
+
+# ============================
+# Receivers
+# ============================
+def surfzone_saved(sender, instance, **kwargs):
+    """Re-render the zone card."""
+    refresh_zone_cards(pk=instance.pk)
+
+
+def country_search_saved(sender, instance, **kwargs):
+    """Zone and spot documents mention their country, zone suggestions show it."""
+    refresh_search_documents("country", pk=instance.pk)
+    refresh_search_documents("zone", country_id=instance.pk)
+    refresh_search_documents("spot", surfzone__country_id=instance.pk)
+    autocomplete_index.schedule_update(refresh=(("country", {"pk": instance.pk}), ("zone", {"country_id": instance.pk})))
+
+
+def surfzone_search_saved(sender, instance, **kwargs):
+    """Spot documents mention their zone and its nearest city, spot suggestions show the zone."""
+    refresh_search_documents("zone", pk=instance.pk)
+    refresh_search_documents("spot", surfzone_id=instance.pk)
+    autocomplete_index.schedule_update(refresh=(("zone", {"pk": instance.pk}), ("spot", {"surfzone_id": instance.pk})))
+
+
+def surfspot_search_saved(sender, instance, **kwargs):
+    refresh_search_documents("spot", pk=instance.pk)
+    autocomplete_index.schedule_update(refresh=(("spot", {"pk": instance.pk}),))
+
+
+def search_document_deleted(sender, instance, **kwargs):
+    remove_search_document(SEARCH_ENTITY_TYPES[sender], instance.pk)
+    autocomplete_index.schedule_update(remove=(instance.pk,))
+
+
+def country_changed(sender, instance, **kwargs):
+    """Country name/code is embedded in every zone payload of that country."""
+    touch_surfzones(country_id=instance.pk)
+    refresh_zone_cards(country_id=instance.pk)
+
+
+def surfspot_changed(sender, instance, **kwargs):
+    """A zone payload embeds its surf spots."""
+    touch_surfzones(pk=instance.surfzone_id)
+
+
+def surfzone_image_changed(sender, instance, **kwargs):
+    """A zone payload (and its card) embeds its images."""
+    touch_surfzones(pk=instance.surfzone_id)
+    refresh_zone_cards(pk=instance.surfzone_id)
+
+
+def surfspot_image_changed(sender, instance, **kwargs):
+    """Spot payloads embed their images, and zone payloads embed their spots."""
+    SurfSpot.objects.filter(pk=instance.surfspot_id).update(updated_at=timezone.now())
+    touch_surfzones(surf_spots=instance.surfspot_id)
+
+
+for model in (Country, SurfZone, SurfSpot, SurfZoneImage, SurfSpotImage):
+    post_save.connect(invalidate_catalogue_cache, sender=model, dispatch_uid=f"api-cache-save-{model.__name__}")
+    post_delete.connect(invalidate_catalogue_cache, sender=model, dispatch_uid=f"api-cache-delete-{model.__name__}")
+
+for model, receiver in (
+    (Country, country_changed),
+    (SurfSpot, surfspot_changed),
+    (SurfZoneImage, surfzone_image_changed),
+    (SurfSpotImage, surfspot_image_changed),
+):
+    post_save.connect(receiver, sender=model, dispatch_uid=f"derived-data-save-{model.__name__}")
+    post_delete.connect(receiver, sender=model, dispatch_uid=f"derived-data-delete-{model.__name__}")
+
+post_save.connect(surfzone_saved, sender=SurfZone, dispatch_uid="zone-card-save-SurfZone")
+
+for model, receiver in (
+    (Country, country_search_saved),
+    (SurfZone, surfzone_search_saved),
+    (SurfSpot, surfspot_search_saved),
+):
+    post_save.connect(receiver, sender=model, dispatch_uid=f"search-save-{model.__name__}")
+    post_delete.connect(search_document_deleted, sender=model, dispatch_uid=f"search-delete-{model.__name__}")
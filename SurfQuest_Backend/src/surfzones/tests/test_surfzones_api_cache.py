@@ -0,0 +1,105 @@
+"""
+Tests for the catalogue API response cache (surfquest/cache.py).
+
+These tests verify cache hits, query-string normalization and invalidation
+through model signals.
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+from conditions.models import Condition
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def sample_zone(db):
+    continent = Continent.objects.create(name="Oceania", code="OC")
+    country = Country.objects.create(name="Australia", code="AUS", continent=continent)
+    return SurfZone.objects.create(name="Gold Coast", country=country)
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_second_request_is_served_from_cache(api_client, sample_zone, django_assert_num_queries):
+    """Test that a repeated GET hits the cache and only runs the ETag version query."""
+    first = api_client.get("/api/v1/surfzones-lite/", {"all": "true"})
+    assert first["X-Cache"] == "MISS"
+
+    with django_assert_num_queries(1):
+        second = api_client.get("/api/v1/surfzones-lite/", {"all": "true"})
+
+    assert second.status_code == status.HTTP_200_OK
+    assert second["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+
+
+@pytest.mark.django_db
+def test_cache_key_ignores_query_param_order(api_client, sample_zone):
+    """Test that the same params in a different order share one cache entry."""
+    api_client.get("/api/v1/surfzones-lite/?all=true&country_code=AUS")
+    response = api_client.get("/api/v1/surfzones-lite/?country_code=AUS&all=true")
+    assert response["X-Cache"] == "HIT"
+
+    response = api_client.get("/api/v1/surfzones-lite/?country_code=FRA&all=true")
+    assert response["X-Cache"] == "MISS"
+
+
+@pytest.mark.django_db
+def test_saving_a_zone_invalidates_the_cache(api_client, sample_zone):
+    """Test that post_save on SurfZone drops cached responses."""
+    api_client.get(f"/api/v1/surfzones-detail/{sample_zone.id}/")
+
+    sample_zone.name = "Goldie"
+    sample_zone.save()
+
+    response = api_client.get(f"/api/v1/surfzones-detail/{sample_zone.id}/")
+    assert response["X-Cache"] == "MISS"
+    assert response.data["name"] == "Goldie"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/api/v1/surfspots-lite/", "/api/v1/conditions/"])
+def test_deleting_related_rows_invalidates_the_cache(api_client, sample_zone, url):
+    """Test that post_delete on SurfSpot / Condition drops cached responses."""
+    spot = SurfSpot.objects.create(name="Snapper Rocks", surfzone=sample_zone)
+    condition = Condition.objects.create(surfzone=sample_zone, month="March")
+    assert len(api_client.get(url, {"all": "true"}).data) == 1
+
+    spot.delete()
+    condition.delete()
+
+    response = api_client.get(url, {"all": "true"})
+    assert response["X-Cache"] == "MISS"
+    assert response.data == []
+
+
+@pytest.mark.django_db
+def test_cached_body_never_served_under_a_newer_etag(api_client, sample_zone):
+    """Test that a change this process did not see as a version bump (another worker's) still misses the cache."""
+    url = f"/api/v1/surfzones-detail/{sample_zone.id}/"
+    etag = api_client.get(url)["ETag"]
+
+    SurfZone.objects.filter(pk=sample_zone.pk).update(name="Goldie", content_updated_at=timezone.now())   # No signal, no bump
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response["X-Cache"] == "MISS"
+    assert response["ETag"] != etag and response.data["name"] == "Goldie"
@@ -0,0 +1,118 @@
+"""
+Tests for the typeahead autocomplete endpoint and its in-memory index.
+
+These tests verify that:
+- suggestions match name prefixes and later words, accent / case insensitively
+- results are ranked (exact, name start, entity type, length) and typed
+- committed changes patch the index in place, without a rebuild
+- the endpoint answers without querying the database once the index is built
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+from surfzones.autocomplete import Autocompleter, autocomplete_index
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def catalogue(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    portugal = Country.objects.create(name="Portugal", code="PRT", continent=continent)
+    peniche = SurfZone.objects.create(name="Peniche", country=portugal, nearest_city="Lisboa")
+    hossegor = SurfZone.objects.create(
+        name="Hossegor", country=Country.objects.create(name="France", code="FRA", continent=continent),
+    )
+    SurfSpot.objects.create(name="Supertubos", surfzone=peniche)
+    SurfSpot.objects.create(name="La Gravière", surfzone=hossegor)
+    SurfSpot.objects.create(name="Peniche Sul", surfzone=peniche)
+    autocomplete_index.invalidate()
+    return {"portugal": portugal, "peniche": peniche}
+
+
+def names(response):
+    return [suggestion["name"] for suggestion in response.data["results"]]
+
+
+# ============================
+# Test Cases
+# ============================
+def test_autocompleter_matches_later_words():
+    """Test word-start matching and folding on a standalone index."""
+    index = Autocompleter([
+        {"type": "spot", "id": "1", "name": "La Gravière", "slug": "la-graviere", "subtitle": "Hossegor"},
+    ])
+    assert [s["slug"] for s in index.complete("GRAV")] == ["la-graviere"]
+    assert index.complete("ravi") == []
+
+    index.remove("spot", "1")
+    assert index.complete("grav") == [] and index.keys == []
+
+
+@pytest.mark.django_db
+def test_autocomplete_ranks_suggestions(api_client, catalogue):
+    """Test that zones rank before spots with the same prefix, exact names first."""
+    response = api_client.get("/api/v1/autocomplete/", {"q": "péni"})
+    assert response.status_code == status.HTTP_200_OK
+    assert names(response) == ["Peniche", "Peniche Sul"]
+    assert [s["type"] for s in response.data["results"]] == ["zone", "spot"]
+    assert response.data["results"][0]["slug"] == catalogue["peniche"].slug
+
+
+@pytest.mark.django_db
+def test_autocomplete_city_points_to_zone(api_client, catalogue):
+    """Test that nearest-city suggestions carry the zone slug."""
+    response = api_client.get("/api/v1/autocomplete/", {"q": "lis", "type": "city"})
+    assert names(response) == ["Lisboa"]
+    assert response.data["results"][0]["slug"] == catalogue["peniche"].slug
+    assert response.data["results"][0]["subtitle"] == "Peniche"
+
+
+@pytest.mark.django_db
+def test_autocomplete_without_queries(api_client, catalogue, django_assert_num_queries):
+    """Test that a warm index answers with no database query."""
+    api_client.get("/api/v1/autocomplete/", {"q": "sup"})
+    with django_assert_num_queries(0):
+        assert names(api_client.get("/api/v1/autocomplete/", {"q": "sup"})) == ["Supertubos"]
+
+
+@pytest.mark.django_db
+def test_committed_changes_patch_the_index(catalogue, django_capture_on_commit_callbacks):
+    """Test that saves and deletes update the built index in place."""
+    index = autocomplete_index.get()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        spot = SurfSpot.objects.create(name="Molho Leste", surfzone=catalogue["peniche"])
+    assert autocomplete_index.get() is index   # Patched, not rebuilt
+    assert [s["name"] for s in index.complete("molho")] == ["Molho Leste"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        catalogue["portugal"].name = "Portugalia"
+        catalogue["portugal"].save()
+    assert autocomplete_index.get() is index
+    assert index.complete("peniche", types=("zone",))[0]["subtitle"] == "Portugalia"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        spot.delete()
+    assert autocomplete_index.get() is index
+    assert index.complete("molho") == []
+
+
+@pytest.mark.django_db
+def test_autocomplete_requires_query(api_client):
+    """Test that q is required."""
+    assert api_client.get("/api/v1/autocomplete/").status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,76 @@
+"""
+Tests for the bbox (map viewport) filter of surfzones-lite and surfspots-lite.
+
+These tests verify that:
+- only the rows inside the box are returned, on both endpoints
+- a box crossing the antimeridian keeps both sides of it
+- malformed boxes are rejected
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def catalogue(db):
+    continent = Continent.objects.create(name="Oceania", code="OC")
+    country = Country.objects.create(name="Fiji", code="FJI", continent=continent)
+    zones = {
+        "Popoyo": SurfZone.objects.create(name="Popoyo", country=country, latitude=11.45, longitude=-86.12),
+        "Taveuni": SurfZone.objects.create(name="Taveuni", country=country, latitude=-16.9, longitude=179.9),
+        "Kadavu": SurfZone.objects.create(name="Kadavu", country=country, latitude=-19.0, longitude=-179.9),
+        "Unmapped": SurfZone.objects.create(name="Unmapped", country=country),
+    }
+    for name, zone in zones.items():
+        SurfSpot.objects.create(
+            name=f"{name} Reef", surfzone=zone, latitude=zone.latitude, longitude=zone.longitude,
+        )
+    return zones
+
+
+def names(response):
+    return sorted(item["name"] for item in response.json())
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_bbox_filters_zones_and_spots(api_client, catalogue):
+    """Test that only the rows inside the viewport are listed."""
+    params = {"bbox": "-90,10,-80,12", "all": "true"}
+    assert names(api_client.get("/api/v1/surfzones-lite/", params)) == ["Popoyo"]
+    assert names(api_client.get("/api/v1/surfspots-lite/", params)) == ["Popoyo Reef"]
+
+
+@pytest.mark.django_db
+def test_bbox_across_antimeridian(api_client, catalogue):
+    """Test that minLon > maxLon keeps the longitudes on both sides of 180°."""
+    params = {"bbox": "179,-20,-179,-15", "all": "true"}
+    assert names(api_client.get("/api/v1/surfzones-lite/", params)) == ["Kadavu", "Taveuni"]
+    assert names(api_client.get("/api/v1/surfspots-lite/", params)) == ["Kadavu Reef", "Taveuni Reef"]
+
+
+@pytest.mark.django_db
+def test_invalid_bbox(api_client, catalogue):
+    """Test that malformed or out-of-range boxes are a 400 on the bbox param."""
+    for bbox in ("1,2,3", "a,b,c,d", "0,20,10,10", "-200,0,0,10"):
+        response = api_client.get("/api/v1/surfspots-lite/", {"bbox": bbox})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "bbox" in response.json()
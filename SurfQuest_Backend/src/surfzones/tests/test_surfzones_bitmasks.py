@@ -0,0 +1,107 @@
+"""
+Tests for the integer bitmask companions of the multi-choice ArrayFields.
+
+These tests verify that:
+- masks are kept in sync on save (including save(update_fields=...))
+- the sync_bitmasks command repairs rows written without save()
+- lite-list filters support any-of / all-of matching on several values
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from conditions.models import Condition
+from surfzones.bitmasks import encode, decode
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def sample_country(db):
+    continent = Continent.objects.create(name="Oceania", code="OC")
+    return Country.objects.create(name="Australia", code="AUS", continent=continent)
+
+@pytest.fixture
+def zones(sample_country):
+    return [
+        SurfZone.objects.create(name="Byron Bay", country=sample_country, traveler_type=["Solo", "Couple"]),
+        SurfZone.objects.create(name="Margaret River", country=sample_country, traveler_type=["Couple"], best_months=["May"]),
+        SurfZone.objects.create(name="Gold Coast", country=sample_country, traveler_type=["Family"]),
+    ]
+
+
+# ============================
+# Test Cases
+# ============================
+def test_encode_decode_roundtrip():
+    """Test that masks follow the declaration order of the choices."""
+    assert encode("best_months", ["January", "March"]) == 0b101
+    assert decode("best_months", encode("best_months", ["March", "January", "Nope"])) == ["January", "March"]
+
+
+@pytest.mark.django_db
+def test_masks_sync_on_save(zones):
+    """Test that save() and save(update_fields=...) refresh the masks."""
+    zone = zones[0]
+    assert zone.traveler_type_mask == encode("traveler_type", ["Solo", "Couple"])
+
+    zone.traveler_type = ["Family"]
+    zone.save(update_fields=["traveler_type"])
+    zone.refresh_from_db()
+    assert zone.traveler_type_mask == encode("traveler_type", ["Family"])
+
+    spot = SurfSpot.objects.create(name="The Pass", surfzone=zone, surf_level=["Beginner"], best_tide=["Low", "Mid"])
+    condition = Condition.objects.create(surfzone=zone, month="May", surf_level=["Pro"])
+    assert spot.best_tide_mask == encode("best_tide", ["Low", "Mid"])
+    assert condition.surf_level_mask == encode("surf_level", ["Pro"])
+
+
+@pytest.mark.django_db
+def test_sync_bitmasks_command(zones):
+    """Test that the command fixes masks of rows updated without save()."""
+    SurfZone.objects.filter(pk=zones[2].pk).update(traveler_type=["Solo"], traveler_type_mask=0)
+    call_command("sync_bitmasks")
+    assert SurfZone.objects.get(pk=zones[2].pk).traveler_type_mask == encode("traveler_type", ["Solo"])
+
+
+@pytest.mark.django_db
+def test_zone_lite_traveler_type_any_and_all(api_client, zones):
+    """Test any-of (default) and all-of matching on traveler_type."""
+    def names(params):
+        response = api_client.get("/api/v1/surfzones-lite/", {"all": "true", **params})
+        return sorted(zone["name"] for zone in response.json())
+
+    assert names({"traveler_type": "Couple"}) == ["Byron Bay", "Margaret River"]
+    assert names({"traveler_type": "Solo,Family"}) == ["Byron Bay", "Gold Coast"]
+    assert names({"traveler_type": "Solo,Couple", "traveler_type_match": "all"}) == ["Byron Bay"]
+    assert names({"best_month": "May"}) == ["Margaret River"]
+
+
+@pytest.mark.django_db
+def test_spot_lite_choice_filters(api_client, zones):
+    """Test surf_level / best_tide / best_month filters on surfspots-lite."""
+    SurfSpot.objects.create(name="Pass", surfzone=zones[0], surf_level=["Beginner", "Intermediate"], best_tide=["Low"])
+    SurfSpot.objects.create(name="Box", surfzone=zones[1], surf_level=["Pro"], best_tide=["High"], best_months=["June", "July"])
+
+    def names(params):
+        response = api_client.get("/api/v1/surfspots-lite/", {"all": "true", **params})
+        return sorted(spot["name"] for spot in response.json())
+
+    assert names({"surf_level": "Beginner,Pro"}) == ["Box", "Pass"]
+    assert names({"surf_level": ["Beginner", "Pro"], "surf_level_match": "all"}) == []
+    assert names({"best_tide": "High"}) == ["Box"]
+    assert names({"best_month": "June,July", "best_month_match": "all"}) == ["Box"]
+    assert names({"best_month": "Unknown"}) == []
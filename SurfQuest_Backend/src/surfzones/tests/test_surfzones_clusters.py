@@ -0,0 +1,102 @@
+"""
+Tests for the marker clusters endpoint (/api/v1/clusters/) and grid.
+
+These tests verify that:
+- nearby points are one cluster at low zoom and separate points at high zoom
+- clusters carry counts, centroid and the zoom at which they split
+- the bounding box filters cells, including across the antimeridian
+- saving a zone refreshes the grids
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+from surfzones.clusters import ClusterGrid, CLUSTER_MAX_ZOOM
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def catalogue(db):
+    continent = Continent.objects.create(name="America", code="AM")
+    country = Country.objects.create(name="Nicaragua", code="NIC", continent=continent)
+    zone = SurfZone.objects.create(name="Popoyo", country=country, latitude=11.45, longitude=-86.12)
+    SurfSpot.objects.create(name="Outer Reef", surfzone=zone, latitude=11.46, longitude=-86.13)
+    SurfSpot.objects.create(name="Playgrounds", surfzone=zone, latitude=11.50, longitude=-86.10)
+    SurfZone.objects.create(name="Fiji", country=country, latitude=-17.8, longitude=179.9)
+    return zone
+
+
+def point(name, latitude, longitude, entity_type="spot"):
+    return {"type": entity_type, "id": name, "name": name, "slug": name, "latitude": latitude, "longitude": longitude}
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_clusters_low_zoom(api_client, catalogue):
+    """Test that the Popoyo points form one cluster at zoom 3, and Fiji stays a point."""
+    response = api_client.get("/api/v1/clusters/", {"zoom": 3})
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["count"] == 4
+    [cluster] = data["clusters"]
+    assert (cluster["count"], cluster["zones"], cluster["spots"]) == (3, 1, 2)
+    assert cluster["latitude"] == pytest.approx(11.47, abs=1e-6)
+    assert 3 < cluster["expansion_zoom"] <= CLUSTER_MAX_ZOOM + 1
+    assert [p["name"] for p in data["points"]] == ["Fiji"]
+
+
+@pytest.mark.django_db
+def test_points_at_high_zoom_and_type(api_client, catalogue):
+    """Test that every point of the box is returned above the clustering zooms."""
+    response = api_client.get("/api/v1/clusters/", {"zoom": 16, "bbox": "-86.2,11.4,-86.0,11.6", "type": "spot"})
+    assert response.json()["clusters"] == []
+    assert sorted(p["name"] for p in response.json()["points"]) == ["Outer Reef", "Playgrounds"]
+
+
+@pytest.mark.django_db
+def test_bbox_across_antimeridian_and_validation(api_client, catalogue):
+    """Test a box crossing the antimeridian, and invalid boxes."""
+    response = api_client.get("/api/v1/clusters/", {"zoom": 5, "bbox": "170,-30,-170,0"})
+    assert [p["name"] for p in response.json()["points"]] == ["Fiji"]
+    assert response.json()["clusters"] == []
+
+    for bbox in ("1,2,3", "0,10,1,5", "0,0,200,1"):
+        response = api_client.get("/api/v1/clusters/", {"zoom": 5, "bbox": bbox})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_save_refreshes_clusters(api_client, catalogue):
+    """Test that moving a zone is reflected on the next query."""
+    api_client.get("/api/v1/clusters/", {"zoom": 3})
+    catalogue.latitude, catalogue.longitude = 48.0, -4.0
+    catalogue.save()
+    data = api_client.get("/api/v1/clusters/", {"zoom": 3}).json()
+    assert data["clusters"][0]["count"] == 2
+    assert "Popoyo" in [p["name"] for p in data["points"]]
+
+
+def test_expansion_zoom():
+    """Test that a cluster expands at the first zoom where its points fall into different cells."""
+    grid = ClusterGrid([point("a", 0.0, 0.0), point("b", 0.0, 0.7)])   # ~78 km apart
+    world = (-180.0, -90.0, 180.0, 90.0)
+    [cluster] = grid.query(world, 0)[0]
+    expansion = cluster["expansion_zoom"]
+    assert grid.query(world, expansion - 1)[0] and not grid.query(world, expansion)[0]
+    assert len(grid.query(world, expansion)[1]) == 2
@@ -0,0 +1,136 @@
+"""
+Tests for conditional GET (ETag / Last-Modified) on the catalogue endpoints.
+
+These tests verify that:
+- validators are sent and a matching If-None-Match answers 304 without serializing
+- related changes (conditions, spots, images, country) roll up into the zone ETag
+- list ETags change when rows are deleted
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfSpot, SurfSpotImage
+from conditions.models import Condition
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def sample_zone(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    country = Country.objects.create(name="Portugal", code="PRT", continent=continent)
+    return SurfZone.objects.create(name="Peniche", country=country)
+
+@pytest.fixture
+def zone_url(sample_zone):
+    return f"/api/v1/surfzones-detail/{sample_zone.id}/"
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_detail_sends_validators(api_client, zone_url):
+    """Test that the detail response carries ETag, Last-Modified and no-cache."""
+    response = api_client.get(zone_url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"].startswith('"')
+    assert "Last-Modified" in response
+    assert "no-cache" in response["Cache-Control"]
+
+
+@pytest.mark.django_db
+def test_if_none_match_returns_304_before_serialization(api_client, zone_url, django_assert_num_queries):
+    """Test that a matching If-None-Match answers 304 with only the version query."""
+    etag = api_client.get(zone_url)["ETag"]
+
+    with django_assert_num_queries(1):
+        response = api_client.get(zone_url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+
+@pytest.mark.django_db
+def test_if_modified_since_returns_304(api_client, zone_url):
+    """Test that If-Modified-Since with the Last-Modified value answers 304."""
+    last_modified = api_client.get(zone_url)["Last-Modified"]
+    response = api_client.get(zone_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_zone_etag_rolls_up_related_changes(api_client, sample_zone, zone_url):
+    """Test that conditions, spots, spot images and the country all change the zone ETag."""
+    etags = [api_client.get(zone_url)["ETag"]]
+
+    Condition.objects.create(surfzone=sample_zone, month="May")
+    etags.append(api_client.get(zone_url)["ETag"])
+
+    spot = SurfSpot.objects.create(name="Supertubos", surfzone=sample_zone)
+    etags.append(api_client.get(zone_url)["ETag"])
+
+    SurfSpotImage.objects.create(surfspot=spot, image="surfspots/surf_spots_images/supertubos.jpg")
+    etags.append(api_client.get(zone_url)["ETag"])
+
+    country = sample_zone.country
+    country.name = "Portugal (PT)"
+    country.save()
+    response = api_client.get(zone_url, HTTP_IF_NONE_MATCH=etags[-1])
+    assert response.status_code == status.HTTP_200_OK
+    etags.append(response["ETag"])
+
+    assert len(set(etags)) == len(etags)
+
+
+@pytest.mark.django_db
+def test_spot_etag_follows_parent_zone(api_client, sample_zone):
+    """Test that renaming the zone changes the ETag of its spots (they embed the zone name)."""
+    spot = SurfSpot.objects.create(name="Baleal", surfzone=sample_zone)
+    url = f"/api/v1/surfspots-detail/{spot.id}/"
+    etag = api_client.get(url)["ETag"]
+
+    sample_zone.name = "Peniche & Baleal"
+    sample_zone.save()
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["surfzone_name"] == "Peniche & Baleal"
+
+
+@pytest.mark.django_db
+def test_list_etag_changes_on_delete(api_client, sample_zone):
+    """Test that deleting a row changes the list ETag even though no stamp moved."""
+    other = SurfZone.objects.create(name="Ericeira", country=sample_zone.country)
+    etag = api_client.get("/api/v1/surfzones-lite/", {"all": "true"})["ETag"]
+
+    assert api_client.get(
+        "/api/v1/surfzones-lite/", {"all": "true"}, HTTP_IF_NONE_MATCH=etag
+    ).status_code == status.HTTP_304_NOT_MODIFIED
+
+    other.delete()
+    response = api_client.get("/api/v1/surfzones-lite/", {"all": "true"}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data) == 1
+    assert "Last-Modified" not in response
+
+
+@pytest.mark.django_db
+def test_unknown_object_still_returns_404(api_client, db):
+    """Test that a missing object is not answered with validators."""
+    response = api_client.get("/api/v1/surfzones-detail/00000000-0000-0000-0000-000000000000/")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert "ETag" not in response
@@ -0,0 +1,98 @@
+"""
+Tests for the optimized (v2) surfzones detail endpoints.
+
+These tests cover:
+- /api/v1/surfzones-detail/<uuid>/
+- /api/v1/surfspots-detail/<uuid>/
+including a bounded number of SQL queries regardless of the number of spots/images.
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfSpot, SurfZoneImage, SurfSpotImage
+from conditions.models import Condition
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def sample_zone(db):
+    continent = Continent.objects.create(name="Asia", code="AS")
+    country = Country.objects.create(name="Indonesia", code="IDN", continent=continent)
+    return SurfZone.objects.create(name="Bali", country=country)
+
+
+def populate_zone(zone, spot_count, images_per_object=3):
+    """Create spots, images and conditions for a zone."""
+    for i in range(images_per_object):
+        SurfZoneImage.objects.create(surfzone=zone, image=f"surfzones/surf_zones_images/{zone.name}_{i}.jpg")
+    for month in ("January", "February"):
+        Condition.objects.create(surfzone=zone, month=month)
+    for n in range(spot_count):
+        spot = SurfSpot.objects.create(
+            name=f"Spot {n}", surfzone=zone, surf_level=["Beginner"], best_tide=["Mid"]
+        )
+        for i in range(images_per_object):
+            SurfSpotImage.objects.create(surfspot=spot, image=f"surfspots/surf_spots_images/spot_{n}_{i}.jpg")
+
+
+# ============================
+# SurfZone detail
+# ============================
+@pytest.mark.django_db
+def test_surfzone_detail_images_are_ordered_and_limited(api_client, sample_zone):
+    """Test that the zone keeps its 2 oldest images and each spot its 5 oldest."""
+    populate_zone(sample_zone, spot_count=1, images_per_object=6)
+
+    response = api_client.get(f"/api/v1/surfzones-detail/{sample_zone.id}/")
+    assert response.status_code == status.HTTP_200_OK
+    assert [url.rsplit("/", 1)[-1] for url in response.data["images"]] == ["Bali_0.jpg", "Bali_1.jpg"]
+    spot_images = response.data["surf_spots"][0]["images"]
+    assert [url.rsplit("/", 1)[-1] for url in spot_images] == [f"spot_0_{i}.jpg" for i in range(5)]
+    assert response.data["surf_spots"][0]["surf_level"] == ["Beginner"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("spot_count", [1, 10])
+def test_surfzone_detail_query_count_is_constant(api_client, sample_zone, spot_count, django_assert_num_queries):
+    """
+    Test that the detail endpoint issues a fixed number of queries:
+    ETag version stamp, zone + country, zone images, conditions, surf spots, spot images.
+    """
+    populate_zone(sample_zone, spot_count=spot_count)
+
+    with django_assert_num_queries(6):
+        response = api_client.get(f"/api/v1/surfzones-detail/{sample_zone.id}/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["surf_spots"]) == spot_count
+
+
+# ============================
+# SurfSpot detail
+# ============================
+@pytest.mark.django_db
+def test_surfspot_detail_query_count(api_client, sample_zone, django_assert_num_queries):
+    """Test that the spot detail endpoint uses the prefetched images (version stamp, spot + zone, images)."""
+    populate_zone(sample_zone, spot_count=1, images_per_object=4)
+    spot = SurfSpot.objects.get(surfzone=sample_zone)
+
+    with django_assert_num_queries(3):
+        response = api_client.get(f"/api/v1/surfspots-detail/{spot.id}/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["images"]) == 4
+    assert response.data["surfzone_name"] == "Bali"
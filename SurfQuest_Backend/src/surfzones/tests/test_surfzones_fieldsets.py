@@ -0,0 +1,116 @@
+"""
+Tests for sparse fieldsets (?fields= / ?omit=) on the lite and detail endpoints.
+
+These tests verify that:
+- only the selected fields are returned, in the serializer's order
+- unselected columns, joins and prefetches are not queried
+- surfzones-lite skips the stored cards for a selection of plain columns
+- unknown field names are rejected
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfSpot, SurfZoneImage, SurfSpotImage
+from conditions.models import Condition
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def sample_zone(db):
+    continent = Continent.objects.create(name="America", code="AM")
+    country = Country.objects.create(name="Nicaragua", code="NIC", continent=continent)
+    zone = SurfZone.objects.create(
+        name="Popoyo", country=country, latitude=11.45, longitude=-86.12, description="Long description.",
+    )
+    SurfZoneImage.objects.create(surfzone=zone, image="surfzones/surf_zones_images/popoyo.jpg")
+    spot = SurfSpot.objects.create(name="Outer Reef", surfzone=zone, description="Heavy.")
+    SurfSpotImage.objects.create(surfspot=spot, image="surfzones/surf_spots_images/outer.jpg")
+    Condition.objects.create(surfzone=zone, month="January")
+    return zone
+
+
+def get_with_sql(client, path, params):
+    """Response and SQL of the queries it ran."""
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(path, params)
+    return response, " ".join(query["sql"] for query in queries.captured_queries)
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_zone_lite_map_fields_skip_cards(api_client, sample_zone):
+    """Test that plain columns are read from the zone row, not from the stored card."""
+    response, sql = get_with_sql(
+        api_client, "/api/v1/surfzones-lite/", {"fields": "longitude,id,name,latitude", "all": "true"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"id": str(sample_zone.id), "name": "Popoyo", "latitude": 11.45, "longitude": -86.12}]
+    assert "payload" not in sql and '"description"' not in sql
+
+
+@pytest.mark.django_db
+def test_zone_lite_selection_from_cards(api_client, sample_zone):
+    """Test that fields reading relations are cut from the stored card."""
+    response = api_client.get("/api/v1/surfzones-lite/", {"fields": "id,country,images", "all": "true"})
+    card = response.json()[0]
+    assert list(card) == ["id", "country", "images"]
+    assert card["images"][0].endswith("popoyo.jpg")
+
+
+@pytest.mark.django_db
+def test_spot_lite_omit_skips_image_prefetch(api_client, sample_zone):
+    """Test that omitting the image fields drops the image prefetch and the omitted columns."""
+    response, sql = get_with_sql(
+        api_client, "/api/v1/surfspots-lite/", {"omit": "images,image_srcsets,description", "all": "true"},
+    )
+    spot = response.json()[0]
+    assert "images" not in spot and "description" not in spot
+    assert spot["surfzone_name"] == "Popoyo"
+    assert "surfzones_surfspotimage" not in sql and '"description"' not in sql
+
+
+@pytest.mark.django_db
+def test_zone_detail_fields_skip_prefetches(api_client, sample_zone):
+    """Test that the detail endpoint only runs the prefetches of the selected fields."""
+    response, sql = get_with_sql(
+        api_client, f"/api/v1/surfzones-detail/{sample_zone.id}/", {"fields": "id,name,conditions"},
+    )
+    assert list(response.json()) == ["id", "name", "conditions"]
+    assert len(response.json()["conditions"]) == 1
+    assert "surfzones_surfzoneimage" not in sql and "surfzones_surfspot" not in sql
+    assert "surfzones_country" not in sql
+
+
+@pytest.mark.django_db
+def test_spot_detail_omit(api_client, sample_zone):
+    """Test omit on the spot detail endpoint."""
+    spot = sample_zone.surf_spots.get()
+    response = api_client.get(f"/api/v1/surfspots-detail/{spot.id}/", {"omit": "images,image_srcsets"})
+    assert "images" not in response.json()
+    assert response.json()["surfzone_slug"] == sample_zone.slug
+
+
+@pytest.mark.django_db
+def test_unknown_fields_are_rejected(api_client, sample_zone):
+    """Test that an unknown field name is a 400 naming it."""
+    response = api_client.get("/api/v1/surfzones-lite/", {"fields": "id,nope"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "nope" in response.json()["fields"][0]
@@ -0,0 +1,120 @@
+"""
+Tests for the responsive image derivatives (thumbnails + WebP).
+
+These tests verify that:
+- derivatives are generated at upload time for zone / spot images and avatars
+- widths never exceed the original, and unreadable files don't break saves
+- serializers (and pre-rendered cards) expose srcset maps
+- the backfill command fills in missing derivatives through the process pool
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import io
+import pytest
+from PIL import Image
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfquest.images import generate_derivatives
+from surfzones.models import Continent, Country, SurfZone, SurfZoneImage
+from users.models import User
+from users.serializers import UserLiteSerializer
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.MEDIA_URL = "/media/"
+    settings.IMAGE_DERIVATIVE_WIDTHS = [320, 640, 1280]
+    settings.IMAGE_DERIVATIVE_FORMATS = ["webp"]
+    return tmp_path
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def sample_zone(db):
+    continent = Continent.objects.create(name="America", code="AM")
+    country = Country.objects.create(name="Mexico", code="MEX", continent=continent)
+    return SurfZone.objects.create(name="Puerto Escondido", country=country)
+
+
+def make_upload(name="wave.png", size=(1000, 500)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "teal").save(buffer, "PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_derivatives_generated_on_upload(sample_zone, media_root):
+    """Test that an upload stores JPEG + WebP copies up to the original width."""
+    image = SurfZoneImage.objects.create(surfzone=sample_zone, image=make_upload())
+
+    assert image.variants["source"] == image.image.name
+    assert set(image.variants) == {"source", "jpeg", "webp"}
+    assert sorted(image.variants["webp"], key=int) == ["320", "640"]   # 1280 > 1000 px original
+
+    thumb = Image.open(media_root / image.variants["webp"]["320"])
+    assert thumb.format == "WEBP" and thumb.size == (320, 160)
+
+
+@pytest.mark.django_db
+def test_small_and_unreadable_images(sample_zone):
+    """Test a single copy for small originals and a graceful failure for missing files."""
+    small = SurfZoneImage.objects.create(surfzone=sample_zone, image=make_upload("tiny.png", (100, 80)))
+    assert list(small.variants["jpeg"]) == ["100"]
+
+    missing = SurfZoneImage.objects.create(surfzone=sample_zone, image="surfzones/surf_zones_images/missing.jpg")
+    assert missing.variants == {}
+    assert generate_derivatives("surfzones/surf_zones_images/missing.jpg") == {}
+
+
+@pytest.mark.django_db
+def test_lite_card_exposes_srcsets(api_client, sample_zone):
+    """Test that surfzones-lite cards expose absolute srcset URLs."""
+    SurfZoneImage.objects.create(surfzone=sample_zone, image=make_upload())
+
+    card = api_client.get("/api/v1/surfzones-lite/", {"all": "true"}).json()[0]
+    srcset = card["image_srcsets"][0]
+    assert set(srcset) == {"jpeg", "webp"}
+    assert list(srcset["webp"]) == ["320w", "640w"]
+    assert srcset["webp"]["320w"].startswith("http://testserver/media/") and srcset["webp"]["320w"].endswith("_320w.webp")
+
+
+@pytest.mark.django_db
+def test_avatar_derivatives():
+    """Test avatar derivatives and the avatar_srcset field."""
+    user = User.objects.create_user(username="rider", email="r@example.com", password="pw", avatar=make_upload("me.png", (400, 400)))
+    assert list(user.avatar_variants["webp"]) == ["320"]
+
+    data = UserLiteSerializer(user).data
+    assert data["avatar_srcset"]["webp"]["320w"].endswith("me_320w.webp")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("workers", [1, 2])
+def test_backfill_command(sample_zone, media_root, workers):
+    """Test that the command builds missing derivatives and refreshes the cards."""
+    first = SurfZoneImage.objects.create(surfzone=sample_zone, image=make_upload("a.png"))
+    second = SurfZoneImage.objects.create(surfzone=sample_zone, image=make_upload("b.png"))
+    SurfZoneImage.objects.update(variants={})
+
+    call_command("generate_image_derivatives", "--workers", str(workers))
+
+    for image in (first, second):
+        image.refresh_from_db()
+        assert sorted(image.variants["webp"], key=int) == ["320", "640"]
+    assert sample_zone.card.__class__.objects.get(pk=sample_zone.pk).payload["image_srcsets"][0]["webp"]
@@ -0,0 +1,107 @@
+"""
+Tests for the query count of the legacy surfzones/ and surfspots/ endpoints.
+
+These tests verify that:
+- listing zones or spots runs a fixed number of queries, whatever the row count
+- each zone is serialized once and shared by the payloads of its spots
+- the payloads are those of the plain serializers
+"""
+
+# ============================
+# Standard Library
+# ============================
+import json
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfSpot, SurfZoneImage, SurfSpotImage
+from surfzones.serializers import SurfSpotSerializer, SurfZoneSerializer
+from conditions.models import Condition
+
+
+# ============================
+# Fixtures
+# ============================
+def add_zone(country, name, spots):
+    zone = SurfZone.objects.create(name=name, country=country, latitude=11.45, longitude=-86.12)
+    SurfZoneImage.objects.create(surfzone=zone, image=f"surfzones/surf_zones_images/{name}.jpg")
+    Condition.objects.create(surfzone=zone, month="January")
+    Condition.objects.create(surfzone=zone, month="February")
+    for i in range(spots):
+        spot = SurfSpot.objects.create(name=f"{name} {i}", surfzone=zone)
+        SurfSpotImage.objects.create(surfspot=spot, image=f"surfzones/surf_spots_images/{name}{i}.jpg")
+    return zone
+
+@pytest.fixture
+def country(db):
+    continent = Continent.objects.create(name="America", code="AM")
+    return Country.objects.create(name="Nicaragua", code="NIC", continent=continent)
+
+
+def count_queries(path):
+    cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+        response = APIClient().get(path)
+    return response, len(queries.captured_queries)
+
+
+def as_json(data):
+    return json.loads(JSONRenderer().render(data))
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_list_query_counts_are_bounded(country):
+    """Test that adding zones and spots adds no query."""
+    add_zone(country, "Popoyo", 2)
+    _, zone_queries = count_queries("/api/v1/surfzones/")
+    _, spot_queries = count_queries("/api/v1/surfspots/")
+
+    add_zone(country, "Maderas", 3)
+    add_zone(country, "Colorado", 4)
+    response, more_zone_queries = count_queries("/api/v1/surfzones/")
+    assert len(response.json()) == 3
+    response, more_spot_queries = count_queries("/api/v1/surfspots/")
+    assert len(response.json()) == 9
+    assert (more_zone_queries, more_spot_queries) == (zone_queries, spot_queries)
+    assert spot_queries <= 6
+
+
+@pytest.mark.django_db
+def test_spot_payloads_match_plain_serializers(country):
+    """Test that the optimized lists return the plain serializers' payloads."""
+    add_zone(country, "Popoyo", 2)
+    add_zone(country, "Maderas", 1)
+    client = APIClient()
+    zones = client.get("/api/v1/surfzones/").json()
+    assert zones == as_json(SurfZoneSerializer(SurfZone.objects.all(), many=True).data)
+    spots = client.get("/api/v1/surfspots/").json()
+    assert spots == as_json(SurfSpotSerializer(SurfSpot.objects.all(), many=True).data)
+    assert spots[0]["surfzone"]["conditions"][0]["month"] == "February"
+
+
+@pytest.mark.django_db
+def test_zone_serialized_once_per_request(country, monkeypatch):
+    """Test that the nested zone payload is built once and reused for every spot of the zone."""
+    add_zone(country, "Popoyo", 3)
+    calls = []
+    original = SurfZoneSerializer.to_representation
+    monkeypatch.setattr(
+        SurfZoneSerializer, "to_representation",
+        lambda self, instance: calls.append(instance.pk) or original(self, instance),
+    )
+    data = SurfSpotSerializer(SurfSpot.objects.all(), many=True).data
+    assert len(data) == 3 and len(calls) == 1
@@ -0,0 +1,93 @@
+"""
+Tests for the optimized (v2) surfzones endpoints.
+
+These tests cover the public lite list endpoints:
+- /api/v1/surfzones-lite/
+- /api/v1/surfspots-lite/
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def sample_country(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    return Country.objects.create(name="France", code="FRA", continent=continent)
+
+@pytest.fixture
+def sample_zones(db, sample_country):
+    return [
+        SurfZone.objects.create(name=name, country=sample_country)
+        for name in ("Biarritz", "Hossegor", "Lacanau", "Seignosse", "Anglet")
+    ]
+
+
+# ============================
+# Pagination
+# ============================
+@pytest.mark.django_db
+def test_surfzones_lite_is_cursor_paginated_by_name(api_client, sample_zones):
+    """Test that surfzones-lite pages are ordered by name and chained by cursor."""
+    first = api_client.get("/api/v1/surfzones-lite/", {"page_size": 2})
+    assert first.status_code == status.HTTP_200_OK
+    assert [z["name"] for z in first.data["results"]] == ["Anglet", "Biarritz"]
+    assert first.data["previous"] is None
+
+    second = api_client.get(first.data["next"])
+    assert [z["name"] for z in second.data["results"]] == ["Hossegor", "Lacanau"]
+
+    third = api_client.get(second.data["next"])
+    assert [z["name"] for z in third.data["results"]] == ["Seignosse"]
+    assert third.data["next"] is None
+
+
+@pytest.mark.django_db
+def test_surfzones_lite_fetch_all_returns_plain_list(api_client, sample_zones):
+    """Test that all=true bypasses pagination for the map view."""
+    response = api_client.get("/api/v1/surfzones-lite/", {"all": "true"})
+    assert response.status_code == status.HTTP_200_OK
+    assert isinstance(response.data, list)
+    assert len(response.data) == len(sample_zones)
+
+
+@pytest.mark.django_db
+def test_surfzones_lite_page_size_is_capped(api_client, sample_zones, settings):
+    """Test that page_size cannot exceed API_MAX_PAGE_SIZE."""
+    settings.API_MAX_PAGE_SIZE = 3
+    response = api_client.get("/api/v1/surfzones-lite/", {"page_size": 100})
+    assert len(response.data["results"]) == 3
+
+
+@pytest.mark.django_db
+def test_surfspots_lite_is_cursor_paginated(api_client, sample_zones):
+    """Test that surfspots-lite walks every spot exactly once across pages."""
+    zone = sample_zones[0]
+    for name in ("Grande Plage", "Côte des Basques", "Marbella"):
+        SurfSpot.objects.create(name=name, surfzone=zone)
+
+    names = []
+    url, params = "/api/v1/surfspots-lite/", {"page_size": 2}
+    while url:
+        response = api_client.get(url, params)
+        assert response.status_code == status.HTTP_200_OK
+        names += [s["name"] for s in response.data["results"]]
+        url, params = response.data["next"], None
+
+    assert names == ["Côte des Basques", "Grande Plage", "Marbella"]
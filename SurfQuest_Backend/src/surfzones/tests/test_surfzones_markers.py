@@ -0,0 +1,96 @@
+"""
+Tests for the map markers endpoint (/api/v1/markers/).
+
+These tests verify that:
+- the JSON form lists zones then spots as parallel arrays, without unlocated rows
+- the binary form decodes to the same markers
+- a matching If-None-Match gets a 304, and catalogue changes move the ETag
+- a warm request runs no query
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+from surfzones.markers import decode_binary, marker_index
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def catalogue(db):
+    continent = Continent.objects.create(name="America", code="AM")
+    country = Country.objects.create(name="Nicaragua", code="NIC", continent=continent)
+    zone = SurfZone.objects.create(name="Popoyo", country=country, latitude=11.451234567, longitude=-86.12)
+    SurfZone.objects.create(name="Unmapped", country=country)
+    spot = SurfSpot.objects.create(name="Outer Reef", surfzone=zone, latitude=11.46, longitude=-86.13)
+    marker_index.invalidate()
+    return zone, spot
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_markers_json_columns(api_client, catalogue):
+    """Test the columnar JSON form."""
+    zone, spot = catalogue
+    response = api_client.get("/api/v1/markers/")
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/json"
+    assert response.json() == {
+        "count": 2,
+        "types": ["zone", "spot"],
+        "type": [0, 1],
+        "id": [str(zone.id), str(spot.id)],
+        "slug": [zone.slug, spot.slug],
+        "lat": [11.45123, 11.46],
+        "lon": [-86.12, -86.13],
+    }
+
+
+@pytest.mark.django_db
+def test_markers_binary_form(api_client, catalogue):
+    """Test that ?format=bin and the Accept header serve the packed form."""
+    zone, spot = catalogue
+    response = api_client.get("/api/v1/markers/", {"format": "bin"})
+    assert response["Content-Type"] == "application/octet-stream"
+    rows = decode_binary(response.content)
+    assert [row[:3] for row in rows] == [("zone", zone.id.hex, zone.slug), ("spot", spot.id.hex, spot.slug)]
+    assert rows[1][3] == pytest.approx(11.46, abs=1e-5) and rows[1][4] == pytest.approx(-86.13, abs=1e-5)
+
+    negotiated = api_client.get("/api/v1/markers/", HTTP_ACCEPT="application/octet-stream")
+    assert negotiated.content == response.content
+
+
+@pytest.mark.django_db
+def test_markers_etag(api_client, catalogue):
+    """Test revalidation, per-format ETags and invalidation on catalogue changes."""
+    zone, _ = catalogue
+    etag = api_client.get("/api/v1/markers/")["ETag"]
+    assert api_client.get("/api/v1/markers/", {"format": "bin"})["ETag"] != etag
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get("/api/v1/markers/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert len(queries.captured_queries) == 0
+
+    zone.latitude = 11.5
+    zone.save()
+    response = api_client.get("/api/v1/markers/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["lat"][0] == 11.5
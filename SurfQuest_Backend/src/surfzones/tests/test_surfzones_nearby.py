@@ -0,0 +1,125 @@
+"""
+Tests for the nearby (geo search) endpoint and its k-d tree index.
+
+These tests verify that:
+- k-nearest and radius queries match a brute-force haversine scan
+- distances are correct across the antimeridian
+- the endpoint validates its parameters and falls back to the user's location
+- the index is refreshed when a zone is saved
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import random
+import pytest
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.geo import GeoPoints, haversine_km
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+from users.models import User
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def sample_country(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    return Country.objects.create(name="France", code="FRA", continent=continent)
+
+@pytest.fixture
+def zones(sample_country):
+    return {
+        "Hossegor": SurfZone.objects.create(name="Hossegor", country=sample_country, latitude=43.66, longitude=-1.44),
+        "Biarritz": SurfZone.objects.create(name="Biarritz", country=sample_country, latitude=43.48, longitude=-1.56),
+        "Lacanau": SurfZone.objects.create(name="Lacanau", country=sample_country, latitude=45.00, longitude=-1.20),
+        "Nowhere": SurfZone.objects.create(name="Nowhere", country=sample_country),
+    }
+
+
+# ============================
+# Index
+# ============================
+def test_index_matches_brute_force():
+    """Test k-nearest and radius queries against a linear haversine scan."""
+    rng = random.Random(42)
+    entries = [
+        {"id": i, "latitude": rng.uniform(-90, 90), "longitude": rng.uniform(-180, 180)}
+        for i in range(500)
+    ]
+    points = GeoPoints(entries)
+
+    for _ in range(20):
+        lat, lon = rng.uniform(-90, 90), rng.uniform(-180, 180)
+        expected = sorted(entries, key=lambda e: haversine_km(lat, lon, e["latitude"], e["longitude"]))
+
+        assert [e["id"] for e in points.nearest(lat, lon, 7)] == [e["id"] for e in expected[:7]]
+
+        within = [e["id"] for e in expected if haversine_km(lat, lon, e["latitude"], e["longitude"]) <= 1500]
+        assert [e["id"] for e in points.radius(lat, lon, 1500)] == within
+
+
+def test_distance_across_antimeridian():
+    """Test that points on both sides of longitude 180 are close."""
+    points = GeoPoints([{"id": "fiji", "latitude": -17.0, "longitude": 179.9}])
+    result = points.nearest(-17.0, -179.9, 1)
+    assert result[0]["distance_km"] == pytest.approx(21.3, abs=0.1)
+
+
+# ============================
+# Endpoint
+# ============================
+@pytest.mark.django_db
+def test_nearby_k_nearest(api_client, zones):
+    """Test the default k-nearest search with distances."""
+    response = api_client.get("/api/v1/nearby/", {"lat": 43.6, "lon": -1.45, "k": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["name"] for r in data["results"]] == ["Hossegor", "Biarritz"]
+    assert data["results"][0]["distance_km"] < data["results"][1]["distance_km"]
+    assert data["results"][0]["type"] == "zone"
+
+
+@pytest.mark.django_db
+def test_nearby_radius_and_spots(api_client, zones):
+    """Test radius search over zones and spots together."""
+    SurfSpot.objects.create(name="La Graviere", surfzone=zones["Hossegor"], latitude=43.67, longitude=-1.44)
+
+    response = api_client.get("/api/v1/nearby/", {"lat": 43.66, "lon": -1.44, "radius_km": 10, "type": "all"})
+    results = response.json()["results"]
+    assert [(r["type"], r["name"]) for r in results] == [("zone", "Hossegor"), ("spot", "La Graviere")]
+    assert results[1]["surfzone_slug"] == "hossegor"
+
+
+@pytest.mark.django_db
+def test_nearby_validation_and_user_origin(api_client, zones):
+    """Test parameter validation and the authenticated user's coordinates fallback."""
+    assert api_client.get("/api/v1/nearby/").status_code == 400
+    assert api_client.get("/api/v1/nearby/", {"lat": 43}).status_code == 400
+    assert api_client.get("/api/v1/nearby/", {"lat": 91, "lon": 0}).status_code == 400
+
+    user = User.objects.create_user(username="surfer", email="s@example.com", password="pw", latitude=45.0, longitude=-1.2)
+    api_client.force_authenticate(user=user)
+    response = api_client.get("/api/v1/nearby/", {"k": 1})
+    assert response.json()["results"][0]["name"] == "Lacanau"
+
+
+@pytest.mark.django_db
+def test_nearby_index_refreshes_on_save(api_client, zones):
+    """Test that moving a zone is reflected by the next query."""
+    api_client.get("/api/v1/nearby/", {"lat": 0, "lon": 0, "k": 1})   # Build the index
+
+    zone = zones["Lacanau"]
+    zone.latitude, zone.longitude = 0.1, 0.1
+    zone.save()
+
+    response = api_client.get("/api/v1/nearby/", {"lat": 0, "lon": 0, "k": 1})
+    assert response.json()["results"][0]["name"] == "Lacanau"
@@ -0,0 +1,108 @@
+"""
+Tests for the trip recommendation engine and endpoint.
+
+These tests verify that:
+- preferences are normalized (invalid values ignored, budget -> cost)
+- zones are ranked by month conditions, level, cost and distance
+- ranked results are cached and invalidated on catalogue changes
+- the endpoint requires authentication and uses the user's profile
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from conditions.models import Condition
+from surfzones.models import Continent, Country, SurfZone
+from surfzones.recommendations import normalize_preferences, recommend
+from users.models import User
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def zones(db):
+    continent = Continent.objects.create(name="Asia", code="AS")
+    country = Country.objects.create(name="Indonesia", code="IDN", continent=continent)
+    bali = SurfZone.objects.create(name="Bali", country=country, cost="Moderate", latitude=-8.7, longitude=115.2)
+    mentawai = SurfZone.objects.create(name="Mentawai", country=country, cost="Expensive", latitude=-2.1, longitude=99.6)
+    Condition.objects.create(surfzone=bali, month="July", world_surf_rating=4, surf_level=["Beginner", "Intermediate"], water_temp_c=27)
+    Condition.objects.create(surfzone=mentawai, month="July", world_surf_rating=5, surf_level=["Advanced", "Pro"], water_temp_c=28)
+    Condition.objects.create(surfzone=bali, month="January", world_surf_rating=2, surf_level=["Beginner"])
+    return bali, mentawai
+
+
+# ============================
+# Test Cases
+# ============================
+def test_normalize_preferences():
+    """Test that garbage is ignored and the budget sets the maximum cost."""
+    prefs = normalize_preferences({"surf_level": "Pro", "confort": "Palace", "weights": {"cost": "x", "swell": 0}}, budget=800)
+    assert prefs["surf_level"] == ["Pro"]
+    assert prefs["confort"] is None
+    assert prefs["cost"] == "Cheap"
+    assert prefs["weights"]["swell"] == 0 and prefs["weights"]["cost"] == 1.0
+    assert normalize_preferences("not a dict")["surf_level"] == []
+
+
+@pytest.mark.django_db
+def test_ranking_follows_level_and_month(zones):
+    """Test that the user's level outweighs a slightly better rating."""
+    ranked = recommend({"surf_level": "Beginner", "cost": "Moderate"}, month="July")
+    assert [r["zone"]["name"] for r in ranked] == ["Bali", "Mentawai"]
+    assert ranked[0]["breakdown"]["surf_level"] == 1.0
+    assert 0 <= ranked[-1]["score"] <= ranked[0]["score"] <= 1
+
+    ranked = recommend({"surf_level": "Pro"}, month="July")
+    assert ranked[0]["zone"]["name"] == "Mentawai"
+
+
+@pytest.mark.django_db
+def test_distance_limit(zones):
+    """Test max_distance_km against the origin."""
+    ranked = recommend({"max_distance_km": 500}, month="July", origin=(-8.6, 115.1))
+    assert [r["zone"]["name"] for r in ranked] == ["Bali"]
+    assert ranked[0]["distance_km"] < 20
+
+
+@pytest.mark.django_db
+def test_results_are_cached_and_invalidated(zones, django_assert_num_queries):
+    """Test that a repeated query hits the cache, and a condition change re-ranks."""
+    recommend({"surf_level": "Beginner"}, month="July")
+    with django_assert_num_queries(0):
+        recommend({"surf_level": "Beginner"}, month="July")
+
+    bali, _ = zones
+    condition = Condition.objects.get(surfzone=bali, month="July")
+    condition.surf_level = ["Pro"]
+    condition.save()
+    assert recommend({"surf_level": "Beginner"}, month="July")[0]["breakdown"]["surf_level"] == 0.0
+
+
+@pytest.mark.django_db
+def test_recommendations_endpoint(api_client, zones):
+    """Test the authenticated endpoint with the user's stored preferences."""
+    assert api_client.get("/api/v1/recommendations/").status_code == 401
+
+    user = User.objects.create_user(
+        username="kook", email="k@example.com", password="pw",
+        preferences={"surf_level": "Intermediate"}, budget=3000, latitude=-8.7, longitude=115.2,
+    )
+    api_client.force_authenticate(user=user)
+    response = api_client.get("/api/v1/recommendations/", {"month": "July", "limit": 1})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["month"] == "July"
+    assert [r["zone"]["slug"] for r in data["results"]] == ["bali"]
+
+    assert api_client.get("/api/v1/recommendations/", {"month": "Juillet"}).status_code == 400
@@ -0,0 +1,135 @@
+"""
+Tests for the full-text search endpoint and index.
+
+These tests verify that:
+- documents are indexed on save (and on related renames), removed on delete
+- both backends (PostgreSQL tsvector, in-memory inverted index) match
+  accent / case insensitively, with prefix matching on the last word
+- name matches rank above description matches
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfSpot, SearchDocument
+from surfzones.search import fold, rebuild_search_index
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture(params=["postgres", "memory"])
+def backend(request, settings):
+    settings.SEARCH_BACKEND = request.param
+    return request.param
+
+@pytest.fixture
+def catalogue(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    portugal = Country.objects.create(name="Portugal", code="PRT", continent=continent)
+    france = Country.objects.create(name="France", code="FRA", continent=continent)
+    peniche = SurfZone.objects.create(
+        name="Peniche", country=portugal, nearest_city="Lisboa", description="Consistent beach breaks.",
+    )
+    hossegor = SurfZone.objects.create(
+        name="Hossegor", country=france, nearest_city="Bayonne", description="Heavy barrels, near Peniche's rival.",
+    )
+    SurfSpot.objects.create(name="Supertubos", surfzone=peniche, description="Powerful barrels.")
+    SurfSpot.objects.create(name="La Gravière", surfzone=hossegor)
+    return {"portugal": portugal, "peniche": peniche, "hossegor": hossegor}
+
+
+def names(response):
+    return [result["name"] for result in response.data["results"]]
+
+
+# ============================
+# Test Cases
+# ============================
+def test_fold_strips_accents_and_case():
+    """Test accent and case folding of indexed text."""
+    assert fold("La Gravière ÉTÉ") == "la graviere ete"
+
+
+@pytest.mark.django_db
+def test_documents_indexed_on_save(catalogue):
+    """Test that each zone, spot and country gets a search document."""
+    assert SearchDocument.objects.filter(entity_type="zone").count() == 2
+    assert SearchDocument.objects.filter(entity_type="spot").count() == 2
+    assert SearchDocument.objects.filter(entity_type="country").count() == 2
+    assert SearchDocument.objects.get(name="Supertubos").subtitle == "Peniche, Portugal"
+
+
+@pytest.mark.django_db
+def test_search_is_accent_and_case_insensitive(api_client, catalogue, backend):
+    """Test that folded queries match accented names."""
+    response = api_client.get("/api/v1/search/", {"q": "GRAVIERE"})
+    assert response.status_code == status.HTTP_200_OK
+    assert names(response) == ["La Gravière"]
+    assert response.data["results"][0]["type"] == "spot"
+
+
+@pytest.mark.django_db
+def test_search_prefix_matching(api_client, catalogue, backend):
+    """Test that the last word matches as a prefix unless prefix=false."""
+    assert names(api_client.get("/api/v1/search/", {"q": "super"})) == ["Supertubos"]
+    assert names(api_client.get("/api/v1/search/", {"q": "super", "prefix": "false"})) == []
+
+
+@pytest.mark.django_db
+def test_search_ranks_name_above_description(api_client, catalogue, backend):
+    """Test that a name match outranks a mention in a description."""
+    response = api_client.get("/api/v1/search/", {"q": "peniche", "type": "zone"})
+    assert names(response) == ["Peniche", "Hossegor"]
+    assert response.data["results"][0]["rank"] > response.data["results"][1]["rank"]
+
+
+@pytest.mark.django_db
+def test_search_all_words_must_match(api_client, catalogue, backend):
+    """Test that several words narrow the results, across fields (name + country)."""
+    response = api_client.get("/api/v1/search/", {"q": "barrels portugal"})
+    assert names(response) == ["Supertubos"]
+
+
+@pytest.mark.django_db
+def test_related_rename_updates_documents(api_client, catalogue, backend):
+    """Test that renaming a country re-indexes the zones and spots mentioning it."""
+    portugal = catalogue["portugal"]
+    portugal.name = "Portugalia"
+    portugal.save()
+
+    response = api_client.get("/api/v1/search/", {"q": "portugalia", "type": "spot"})
+    assert names(response) == ["Supertubos"]
+
+
+@pytest.mark.django_db
+def test_deleted_spot_is_removed(api_client, catalogue, backend):
+    """Test that deleting a spot removes its document."""
+    SurfSpot.objects.get(name="Supertubos").delete()
+    assert names(api_client.get("/api/v1/search/", {"q": "supertubos"})) == []
+
+
+@pytest.mark.django_db
+def test_rebuild_search_index(catalogue):
+    """Test that the rebuild restores documents created by bulk operations."""
+    SearchDocument.objects.all().delete()
+    assert rebuild_search_index() == 6
+    assert SearchDocument.objects.exclude(search_vector=None).count() == 6
+
+
+@pytest.mark.django_db
+def test_search_requires_query(api_client):
+    """Test that q is required."""
+    response = api_client.get("/api/v1/search/")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,108 @@
+"""
+Tests for the SurfZoneCard read model (pre-rendered surfzones-lite cards).
+
+These tests verify that cards:
+- match the SurfZoneLiteSerializer payload
+- are refreshed when the zone, its country or its images change
+- are built on the fly or by the management command when missing
+- let surfzones-lite run a constant number of queries
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from django.core.management import call_command
+from rest_framework.test import APIClient, APIRequestFactory
+
+# ============================
+# Local Application Imports
+# ============================
+from surfzones.models import Continent, Country, SurfZone, SurfZoneImage, SurfZoneCard
+from surfzones.serializers import SurfZoneLiteSerializer
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def sample_country(db):
+    continent = Continent.objects.create(name="America", code="AM")
+    return Country.objects.create(name="Nicaragua", code="NIC", continent=continent)
+
+@pytest.fixture
+def sample_zone(sample_country):
+    return SurfZone.objects.create(name="Popoyo", country=sample_country, traveler_type=["Solo"])
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_card_is_created_with_the_lite_payload(sample_zone):
+    """Test that saving a zone stores its lite payload."""
+    card = SurfZoneCard.objects.get(surfzone=sample_zone)
+    assert card.payload == SurfZoneLiteSerializer(sample_zone).data
+
+
+@pytest.mark.django_db
+def test_lite_endpoint_matches_serializer_output(api_client, sample_zone):
+    """Test that served cards equal the DRF serializer output, absolute image URLs included."""
+    SurfZoneImage.objects.create(surfzone=sample_zone, image="surfzones/surf_zones_images/Popoyo_2.JPG")
+
+    response = api_client.get("/api/v1/surfzones-lite/", {"all": "true"})
+
+    request = APIRequestFactory().get("/api/v1/surfzones-lite/")
+    expected = SurfZoneLiteSerializer(SurfZone.objects.get(pk=sample_zone.pk), context={"request": request}).data
+    assert response.json() == [expected]
+    assert response.json()[0]["images"][0].endswith("Popoyo_2.JPG")
+
+
+@pytest.mark.django_db
+def test_card_refreshes_on_country_and_image_changes(sample_zone, sample_country):
+    """Test incremental refresh from Country and SurfZoneImage signals."""
+    sample_country.name = "Nicaragua (NI)"
+    sample_country.save()
+    assert SurfZoneCard.objects.get(surfzone=sample_zone).payload["country"]["name"] == "Nicaragua (NI)"
+
+    image = SurfZoneImage.objects.create(surfzone=sample_zone, image="surfzones/surf_zones_images/a.jpg")
+    assert len(SurfZoneCard.objects.get(surfzone=sample_zone).payload["images"]) == 1
+
+    image.delete()
+    assert SurfZoneCard.objects.get(surfzone=sample_zone).payload["images"] == []
+
+
+@pytest.mark.django_db
+def test_missing_card_is_built_on_the_fly(api_client, sample_zone):
+    """Test that a zone without card is still listed (and gets its card)."""
+    SurfZoneCard.objects.all().delete()
+
+    response = api_client.get("/api/v1/surfzones-lite/", {"all": "true"})
+    assert response.json()[0]["name"] == "Popoyo"
+    assert SurfZoneCard.objects.filter(surfzone=sample_zone).exists()
+
+
+@pytest.mark.django_db
+def test_refresh_zone_cards_command(sample_zone):
+    """Test that the management command backfills missing cards."""
+    SurfZoneCard.objects.all().delete()
+    call_command("refresh_zone_cards", "--missing")
+    assert SurfZoneCard.objects.get(surfzone=sample_zone).payload["slug"] == "popoyo"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("zone_count", [1, 15])
+def test_lite_list_query_count_is_constant(api_client, sample_country, zone_count, django_assert_num_queries):
+    """Test that surfzones-lite runs the ETag query + one card query, whatever the number of zones."""
+    for i in range(zone_count):
+        zone = SurfZone.objects.create(name=f"Zone {i}", country=sample_country)
+        SurfZoneImage.objects.create(surfzone=zone, image=f"surfzones/surf_zones_images/{i}.jpg")
+
+    with django_assert_num_queries(2):
+        response = api_client.get("/api/v1/surfzones-lite/", {"all": "true"})
+
+    assert len(response.json()) == zone_count
@@ -26,6 +26,12 @@ from .views import (
     SurfZoneDetailAPIView,
     SurfSpotLiteListAPIView,
     SurfSpotDetailAPIView,  # Import ViewSets for surf zones and surf spots
+    NearbyAPIView,
+    RecommendationsAPIView,
+    SearchAPIView,
+    AutocompleteAPIView,
+    MarkersAPIView,
+    ClustersAPIView,
 )
 
 # ============================
@@ -47,6 +53,12 @@ urlpatterns = [
     path("surfzones-detail/<uuid:id>/", SurfZoneDetailAPIView.as_view(), name="surfzones-detail"),
     path("surfspots-lite/", SurfSpotLiteListAPIView.as_view(), name="surfspots-lite"),
     path("surfspots-detail/<uuid:id>/", SurfSpotDetailAPIView.as_view(), name="surfspots-detail"),
+    path("nearby/", NearbyAPIView.as_view(), name="nearby"),
+    path("recommendations/", RecommendationsAPIView.as_view(), name="recommendations"),
+    path("search/", SearchAPIView.as_view(), name="search"),
+    path("autocomplete/", AutocompleteAPIView.as_view(), name="autocomplete"),
+    path("markers/", MarkersAPIView.as_view(), name="markers"),
+    path("clusters/", ClustersAPIView.as_view(), name="clusters"),
 ]
 
 # ============================
@@ -10,38 +10,205 @@ We add new v2 endpoints:
 - surfzones-detail/<uuid:id>/
 - surfspots-lite/
 - surfspots-detail/<uuid:id>/
+- nearby/ (geo search, answered from an in-memory spatial index)
+- recommendations/ (zones ranked for the authenticated user)
+- search/ (full-text search over zones, spots and countries)
+- autocomplete/ (typeahead suggestions, answered from memory)
+
+Every catalogue endpoint here is public and GET-only: responses are cached and
+invalidated on catalogue changes (see surfquest/cache.py), and carry ETags
+computed from version stamps so that unchanged payloads answer 304
+(see surfquest/conditional.py). In ASGI serving mode they are dispatched
+asynchronously with the async ORM (see surfquest/async_views.py).
 """
 
 # ============================
 # Django REST Framework Imports
 # ============================
-from django.db.models import Prefetch   # For optimizing related object queries
+from django.db.models import Prefetch, Q   # For optimizing related object queries; bbox across the antimeridian
+from django.db.models.functions import Greatest   # Spot version = newest of spot / parent zone stamps
+from django.conf import settings   # API_MAX_PAGE_SIZE
 from rest_framework import viewsets   # Base class for building ViewSets
+from rest_framework.views import APIView   # Plain API views (geo search, recommendations)
+from rest_framework.response import Response   # Responses built from in-memory indexes
+from rest_framework.exceptions import ValidationError   # 400 on missing origin
 from rest_framework.generics import ListAPIView, RetrieveAPIView   # Generic views for list and detail endpoints
 from rest_framework.permissions import IsAuthenticated, AllowAny   # Restrict access to authenticated users only
+from django.utils import timezone   # Current month
+from django.utils.cache import patch_vary_headers   # Marker formats negotiated on Accept
+from rest_framework.settings import api_settings   # JSON renderer of the API
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.pagination import CatalogueCursorPagination   # Keyset pagination by name or rating
+from surfquest.fieldsets import SparseFieldsetViewMixin, fieldset_requirements   # ?fields= / ?omit=
+from surfquest.cache import CachedResponseMixin   # Cached responses, invalidated on catalogue changes
+from surfquest.conditional import ConditionalGetMixin, precomputed_response   # ETag / Last-Modified from version stamps; precomputed bodies
+from surfquest.async_views import AsyncReadOnlyMixin   # Async dispatch in ASGI serving mode
+from conditions.matrix import condition_matrix, WINDOW_MATCHES   # In-memory zone x month condition matrix
+from conditions.models import ZoneMonthScore   # Computed best months (top_month filter)
 
 # ============================
 # Local Application Imports
 # ============================
 from .models import SurfZone, SurfSpot, SurfZoneImage, SurfSpotImage   # Surf-related models
 from .serializers import SurfZoneSerializer, SurfSpotSerializer, SurfZoneLiteSerializer, SurfSpotLiteSerializer, SurfZoneDetailSerializer, SurfSpotDetailSerializer   # Corresponding serializers
+from .serializers import NearbyQuerySerializer, RecommendationQuerySerializer, SearchQuerySerializer, AutocompleteQuerySerializer, ClusterQuerySerializer, BoundingBoxField   # Query params of the index-backed endpoints
+from .cards import SurfZoneCardSerializer   # Pre-rendered surfzones-lite cards
+from .bitmasks import bitmask_q   # any-of / all-of filters on the choice bitmask columns
+from .geo import geo_index   # In-memory spatial index of zones and spots
+from .recommendations import recommend, MAX_RESULTS   # Zone ranking from user preferences
+from .search import search, ENTITY_TYPES   # Full-text search (tsvector or in-memory inverted index)
+from .autocomplete import autocomplete_index, SUGGESTION_TYPES   # In-memory typeahead index
+from .markers import marker_index, MarkersBinaryRenderer   # Precomputed map markers
+from .clusters import cluster_index   # Per-zoom marker clusters
+from .choices import MONTHS_CHOICES   # Default month of the recommendations
+
+
+CURSOR_COLUMNS = ("name", "rating_sort_key", "review_count_sort_key")   # Read by the cursor paginator (see CatalogueCursorPagination)
+
+# (metric, min query param, max query param, cast) of the month-based range filters
+CONDITION_RANGE_FILTERS = (
+    ("sunny_days", "sunny_days_min", "sunny_days_max", int),
+    ("rain_days", "rain_days_min", "rain_days_max", int),
+    ("water_temp_c", "water_temp_c_min", "water_temp_c_max", int),
+    ("world_surf_rating", "surf_rating_min", None, int),
+    ("swell_size_meter", "swell_size_meter_min", "swell_size_meter_max", float),
+)
+
+
+def get_choice_values(params, name):
+    """Values of a multi-choice query param: repeated (`?a=x&a=y`) and/or comma-separated (`?a=x,y`)."""
+    values = []
+    for raw in params.getlist(name):
+        for value in raw.split(","):
+            value = value.strip()
+            if value and value not in values:
+                values.append(value)
+    return values
+
+
+def filter_choices(qs, params, param, field_name):
+    """
+    Filter `qs` on the bitmask column of an ArrayField from a multi-choice param.
+
+    `<param>_match=all` requires every value, otherwise any value matches.
+    """
+    values = get_choice_values(params, param)
+    if values:
+        match = "all" if params.get(f"{param}_match") == "all" else "any"
+        qs = qs.filter(bitmask_q(field_name, values, match))
+    return qs
+
+
+def filter_review_aggregates(qs, params):
+    """Filter `qs` on the stored review aggregates (rating_min, review_count_min)."""
+    rating_min = params.get("rating_min")
+    if rating_min is not None:
+        qs = qs.filter(rating_avg__gte=float(rating_min))
+
+    review_count_min = params.get("review_count_min")
+    if review_count_min is not None:
+        qs = qs.filter(review_count__gte=int(review_count_min))
+    return qs
+
+
+def filter_bbox(qs, params):
+    """
+    Filter `qs` on the `bbox=minLon,minLat,maxLon,maxLat` viewport (400 when malformed).
+
+    A box with minLon > maxLon crosses the antimeridian: it keeps the
+    longitudes east of minLon or west of maxLon. Runs on the
+    (latitude, longitude) index.
+    """
+    raw = params.get("bbox")
+    if not raw:
+        return qs
+    try:
+        min_lon, min_lat, max_lon, max_lat = BoundingBoxField().run_validation(raw)
+    except ValidationError as error:
+        raise ValidationError({"bbox": error.detail})
+
+    qs = qs.filter(latitude__range=(min_lat, max_lat))
+    if min_lon <= max_lon:
+        return qs.filter(longitude__range=(min_lon, max_lon))
+    return qs.filter(Q(longitude__gte=min_lon) | Q(longitude__lte=max_lon))
 
 
-class surfZoneViewSet(viewsets.ModelViewSet):
+def get_month_window(params):
+    """
+    (start, end, match, length) of the window_start / window_end month window,
+    None without one (400 when malformed or combined with `month`).
+    """
+    start, end = params.get("window_start"), params.get("window_end")
+    if not start and not end:
+        return None
+    errors = {}
+    for name, month in (("window_start", start), ("window_end", end)):
+        if month not in MONTHS_CHOICES.values:
+            errors[name] = f"A month is required (e.g. July), got {month!r}."
+    match = params.get("window_match", "all")
+    if match not in WINDOW_MATCHES:
+        errors["window_match"] = f"One of: {', '.join(WINDOW_MATCHES)}."
+    length = params.get("window_length")
+    if length is not None:
+        length = int(length) if length.isdigit() else 0
+        if not 1 <= length <= 12:
+            errors["window_length"] = "A number of months between 1 and 12 is required."
+    if params.get("month"):
+        errors["month"] = "Use either month or window_start / window_end."
+    if errors:
+        raise ValidationError(errors)
+    return start, end, match, length
+
+
+def filter_top_month(qs, params):
+    """
+    Keep the zones for which `top_month` ranks among their `top_month_rank`
+    (default 3) best computed months (see conditions/best_months.py).
+    """
+    month = params.get("top_month")
+    if not month:
+        return qs
+    if month not in MONTHS_CHOICES.values:
+        raise ValidationError({"top_month": f"Unknown month: {month}."})
+    try:
+        rank = int(params.get("top_month_rank", 3))
+    except ValueError:
+        rank = 0
+    if rank < 1:
+        raise ValidationError({"top_month_rank": "A positive integer is required."})
+    top = ZoneMonthScore.objects.filter(month=month, rank__lte=rank).values("surfzone_id")
+    return qs.filter(id__in=top)
+
+
+def legacy_zone_queryset():
+    """Zones with everything SurfZoneSerializer reads: country joined, images and conditions prefetched."""
+    return SurfZone.objects.select_related("country").prefetch_related("zone_images", "conditions")
+
+
+class surfZoneViewSet(ConditionalGetMixin, CachedResponseMixin, AsyncReadOnlyMixin, viewsets.ModelViewSet):
     """
     ViewSet for SurfZone model.
 
     Provides read-only access to all surf zones.
     Only GET requests are allowed.
     Authentication is required.
+
+    Kept for older clients: a list costs 3 queries whatever the number of zones.
     """
     queryset = SurfZone.objects.all()
     serializer_class = SurfZoneSerializer
     permission_classes = [AllowAny]
     http_method_names = ['get']   # Restrict to GET requests only
+    version_field = "content_updated_at"   # Zone stamp rolled up from spots, conditions, images, country
+
+    def get_queryset(self):
+        return legacy_zone_queryset()
 
 
-class surfSpotViewSet(viewsets.ModelViewSet):
+class surfSpotViewSet(ConditionalGetMixin, CachedResponseMixin, AsyncReadOnlyMixin, viewsets.ModelViewSet):
     """
     ViewSet for SurfSpot model.
 
@@ -53,53 +220,110 @@ class surfSpotViewSet(viewsets.ModelViewSet):
     serializer_class = SurfSpotSerializer
     permission_classes = [AllowAny]
     http_method_names = ['get']   # Restrict to GET requests only
+    version_field = Greatest("updated_at", "surfzone__content_updated_at")   # Spot payloads embed zone data
+
+    def get_queryset(self):
+        # The zones are prefetched, not joined: each zone row (and its images
+        # and conditions) is loaded once and shared by all its spots, and
+        # NestedSurfZoneSerializer serializes it once. 5 queries per list.
+        return SurfSpot.objects.prefetch_related(
+            "spot_images",
+            Prefetch("surfzone", queryset=legacy_zone_queryset()),
+        )
 
 
 # ============================
 # V2 endpoints (optimized)
 # ============================
 
-class SurfZoneLiteListAPIView(ListAPIView):
+class SurfZoneLiteListAPIView(SparseFieldsetViewMixin, ConditionalGetMixin, CachedResponseMixin, AsyncReadOnlyMixin, ListAPIView):
     """
     List SurfZones with lightweight payload + backend filtering.
 
     Filters supported (query params):
     - country_id (UUID) OR country_code (e.g. "FRA") OR country_slug
-    - traveler_type (e.g. "Couple")  -> ArrayField contains
+    - traveler_type (e.g. "Couple" or "Solo,Couple")  -> traveler_type_mask
+    - best_month (e.g. "July" or "July,August")  -> best_months_mask
     - safety
     - confort
     - cost
     - main_wave_direction
 
-    Month-based filters (apply on related Condition rows):
-    - month (e.g. "July")  (recommended: always send this if using any condition filter)
-    - surf_level (e.g. "Beginner")  -> ArrayField contains
+    Month-based filters (apply on related Condition rows, all on the same row):
+    - month (e.g. "July")  (without it, a zone matches if any month satisfies every filter)
+    - surf_level (e.g. "Beginner" or "Beginner,Intermediate")  -> Condition.surf_level_mask
     - sunny_days_min / sunny_days_max
     - rain_days_min / rain_days_max
     - water_temp_c_min / water_temp_c_max
     - surf_rating_min (uses world_surf_rating by default)
     - swell_size_meter_min / swell_size_meter_max
     - crowd (e.g. "Low")
+
+    Month window (instead of month; the month-based filters then apply to
+    the window, see ConditionMatrix.filter_window_zone_ids):
+    - window_start / window_end (e.g. June / September, wraps around the year)
+    - window_match: all (default, every month), any (at least one month) or
+      avg (ranges on the day-weighted average of the window)
+    - window_length: with all / avg, any run of that many consecutive months
+      within the window is enough (e.g. window_length=1: one good month)
+
+    Multi-choice filters accept several values (comma-separated or repeated)
+    and match any of them, or all of them with `<param>_match=all`
+    (e.g. traveler_type=Solo,Couple&traveler_type_match=all).
+
+    Review filters (stored aggregates, see users/ratings.py):
+    - rating_min (average rating, e.g. 4)
+    - review_count_min
+
+    Map viewport:
+    - bbox=minLon,minLat,maxLon,maxLat (minLon > maxLon crosses the antimeridian)
+
+    Computed best months (conditions/best_months.py):
+    - top_month (e.g. "July"): the month is among the zone's best months
+    - top_month_rank (default 3): how many best months count
+
+    Pagination (cursor):
+    - page_size (default settings.API_PAGE_SIZE)
+    - cursor (opaque, taken from the `next` / `previous` links)
+    - all=true to get the full unpaginated list (map view)
+    - ordering: name (default), rating, -rating, review_count, -review_count
+
+    Sparse fieldsets: fields=id,name,latitude,longitude (map) or
+    omit=description,surroundings (see surfquest/fieldsets.py).
+
+    Cards are served from the precomputed SurfZoneCard read model
+    (same payload as SurfZoneLiteSerializer, see surfzones/cards.py).
+    A selection of plain zone columns is read from the zone rows instead,
+    so the rest of the card never leaves the database.
     """
     permission_classes = [AllowAny]
     http_method_names = ["get"]
-    serializer_class = SurfZoneLiteSerializer
+    version_field = "content_updated_at"   # Zone stamp rolled up from spots, conditions, images, country
+    serializer_class = SurfZoneCardSerializer
+    fieldset_serializer_class = SurfZoneLiteSerializer
+    pagination_class = CatalogueCursorPagination
+
+    def uses_cards(self):
+        """True unless the selected fields are all columns of the zone row."""
+        fieldset = self.get_fieldset()
+        if fieldset is None:
+            return True
+        _, selects, prefetches = fieldset_requirements(SurfZoneLiteSerializer, fieldset)
+        return bool(selects or prefetches)
+
+    def get_serializer_class(self):
+        return SurfZoneCardSerializer if self.uses_cards() else SurfZoneLiteSerializer
 
     def get_queryset(self):
-        # ✅ Prefetch optimized: only columns needed + stable ordering
-        zone_images_qs = (
-            SurfZoneImage.objects
-            .only("id", "image", "description", "created_at", "surfzone_id")
-            .order_by("created_at")
-        )
-
-        qs = (
-            SurfZone.objects
-            .select_related("country")
-            .prefetch_related(
-                Prefetch("zone_images", queryset=zone_images_qs),
+        if self.uses_cards():
+            # ✅ Pre-rendered cards: a single joined query, only the columns needed for ordering + payload
+            qs = (
+                SurfZone.objects
+                .select_related("card")
+                .only(*CURSOR_COLUMNS, "card__payload")
             )
-        )
+        else:
+            qs = self.sparse_queryset(SurfZone.objects.all(), keep=CURSOR_COLUMNS)
 
         p = self.request.query_params
 
@@ -118,9 +342,8 @@ class SurfZoneLiteListAPIView(ListAPIView):
         if country_slug:
             qs = qs.filter(country__slug=country_slug)
 
-        traveler_type = p.get("traveler_type")
-        if traveler_type:
-            qs = qs.filter(traveler_type__contains=[traveler_type])
+        qs = filter_choices(qs, p, "traveler_type", "traveler_type")
+        qs = filter_choices(qs, p, "best_month", "best_months")
 
         safety = p.get("safety")
         if safety:
@@ -138,82 +361,52 @@ class SurfZoneLiteListAPIView(ListAPIView):
         if main_wave_direction:
             qs = qs.filter(main_wave_direction=main_wave_direction)
 
+        qs = filter_review_aggregates(qs, p)
+        qs = filter_bbox(qs, p)
+        qs = filter_top_month(qs, p)
+
         # ----------------------------
         # Condition (month-based) filters
         # ----------------------------
+        # Evaluated on the in-memory zone x month matrix: every predicate must
+        # hold for the same condition row (month), and no join on conditions.
         month = p.get("month")
-        condition_filter_used = any(
-            k in p for k in (
-                "surf_level",
-                "sunny_days_min", "sunny_days_max",
-                "rain_days_min", "rain_days_max",
-                "water_temp_c_min", "water_temp_c_max",
-                "surf_rating_min",
-                "swell_size_meter_min", "swell_size_meter_max",
-                "crowd",
+        ranges = [
+            (metric, cast(p[low]) if low in p else None, cast(p[high]) if high in p else None)
+            for metric, low, high, cast in CONDITION_RANGE_FILTERS
+            if low in p or high in p
+        ]
+        surf_level = get_choice_values(p, "surf_level")
+        crowd = p.get("crowd")
+        surf_level_match = "all" if p.get("surf_level_match") == "all" else "any"
+        window = get_month_window(p)
+
+        if window:
+            start, end, match, length = window
+            zone_ids = condition_matrix.get().filter_window_zone_ids(
+                start, end, match=match, length=length, ranges=ranges,
+                surf_level=surf_level, crowd=crowd, surf_level_match=surf_level_match,
             )
-        )
-
-        if month or condition_filter_used:
-            if month:
-                qs = qs.filter(conditions__month=month)
-
-            surf_level = p.get("surf_level")
-            if surf_level:
-                qs = qs.filter(conditions__surf_level__contains=[surf_level])
-
-            sunny_min = p.get("sunny_days_min")
-            if sunny_min is not None:
-                qs = qs.filter(conditions__sunny_days__gte=int(sunny_min))
-
-            sunny_max = p.get("sunny_days_max")
-            if sunny_max is not None:
-                qs = qs.filter(conditions__sunny_days__lte=int(sunny_max))
-
-            rain_min = p.get("rain_days_min")
-            if rain_min is not None:
-                qs = qs.filter(conditions__rain_days__gte=int(rain_min))
-
-            rain_max = p.get("rain_days_max")
-            if rain_max is not None:
-                qs = qs.filter(conditions__rain_days__lte=int(rain_max))
-
-            water_min = p.get("water_temp_c_min")
-            if water_min is not None:
-                qs = qs.filter(conditions__water_temp_c__gte=int(water_min))
-
-            water_max = p.get("water_temp_c_max")
-            if water_max is not None:
-                qs = qs.filter(conditions__water_temp_c__lte=int(water_max))
-
-            surf_rating_min = p.get("surf_rating_min")
-            if surf_rating_min is not None:
-                qs = qs.filter(conditions__world_surf_rating__gte=int(surf_rating_min))
-
-            swell_min = p.get("swell_size_meter_min")
-            if swell_min is not None:
-                qs = qs.filter(conditions__swell_size_meter__gte=float(swell_min))
-
-            swell_max = p.get("swell_size_meter_max")
-            if swell_max is not None:
-                qs = qs.filter(conditions__swell_size_meter__lte=float(swell_max))
-
-            crowd = p.get("crowd")
-            if crowd:
-                qs = qs.filter(conditions__crowd=crowd)
-
-            qs = qs.distinct()
+            qs = qs.filter(id__in=zone_ids)
+        elif month or ranges or surf_level or crowd:
+            zone_ids = condition_matrix.get().filter_zone_ids(
+                month=month, ranges=ranges, surf_level=surf_level, crowd=crowd,
+                surf_level_match=surf_level_match,
+            )
+            qs = qs.filter(id__in=zone_ids)
 
-        return qs
+        return qs.order_by(*self.paginator.get_ordering(self.request))
 
 
-class SurfZoneDetailAPIView(RetrieveAPIView):
+class SurfZoneDetailAPIView(SparseFieldsetViewMixin, ConditionalGetMixin, CachedResponseMixin, AsyncReadOnlyMixin, RetrieveAPIView):
     """
     Retrieve detailed info for a single SurfZone by ID.
     Includes related country, images, conditions, and surf spots + their images.
+    With fields= / omit=, only the joins and prefetches of the selected fields run.
     """
     permission_classes = [AllowAny]
     http_method_names = ["get"]
+    version_field = "content_updated_at"   # Zone stamp rolled up from spots, conditions, images, country
     serializer_class = SurfZoneDetailSerializer
     lookup_field = "id"
 
@@ -221,25 +414,27 @@ class SurfZoneDetailAPIView(RetrieveAPIView):
         # ✅ Prefetch optimized: only columns needed + stable ordering
         zone_images_qs = (
             SurfZoneImage.objects
-            .only("id", "image", "description", "created_at", "surfzone_id")
+            .only("id", "image", "variants", "description", "created_at", "surfzone_id")
             .order_by("created_at")
         )
 
         spot_images_qs = (
             SurfSpotImage.objects
-            .only("id", "image", "description", "created_at", "surfspot_id")
+            .only("id", "image", "variants", "description", "created_at", "surfspot_id")
             .order_by("created_at")
         )
 
         surf_spots_qs = (
             SurfSpot.objects
             .only(
-                "id", "name", "slug", "latitude", "longitude",
+                "id", "name", "slug", "surfzone_id", "latitude", "longitude",
                 "break_type", "wave_direction",
                 "best_wind_direction", "best_swell_direction",
                 "best_swell_size_feet", "best_swell_size_meter",
+                "best_tide", "surf_level", "surf_hazards", "best_months",
                 "description",
-                # plus any fields your serializer reads directly from SurfSpot
+                # every field read by SurfSpotForZoneDetailSerializer: a deferred
+                # field would be lazily loaded with one extra query per spot
             )
             .order_by("name")
             .prefetch_related(
@@ -247,40 +442,53 @@ class SurfZoneDetailAPIView(RetrieveAPIView):
             )
         )
 
-        return (
-            SurfZone.objects
-            .select_related("country")
-            .prefetch_related(
+        return self.sparse_queryset(
+            SurfZone.objects.all(),
+            select_related=("country",),
+            prefetch_related=(
                 Prefetch("zone_images", queryset=zone_images_qs),
                 "conditions",
                 Prefetch("surf_spots", queryset=surf_spots_qs),
-            )
-            .all()
+            ),
         )
 
 
-class SurfSpotLiteListAPIView(ListAPIView):
+class SurfSpotLiteListAPIView(SparseFieldsetViewMixin, ConditionalGetMixin, CachedResponseMixin, AsyncReadOnlyMixin, ListAPIView):
     """
     List SurfSpots with lightweight payload + backend filtering.
+
+    Multi-choice filters (best_month, surf_level, best_tide) accept several
+    values and match any of them, or all with `<param>_match=all`; they run
+    on the integer bitmask columns (see surfzones/bitmasks.py).
+    rating_min / review_count_min filter on the stored review aggregates.
+    bbox=minLon,minLat,maxLon,maxLat keeps the spots of the map viewport
+    (minLon > maxLon crosses the antimeridian).
+
+    Paginated by cursor (page_size / cursor), or unpaginated with all=true,
+    sorted by name or with ordering=rating|-rating|review_count|-review_count.
+
+    Sparse fieldsets (fields= / omit=) also trim the loaded columns, and skip
+    the zone join and the image prefetch when no selected field reads them.
     """
     permission_classes = [AllowAny]
     serializer_class = SurfSpotLiteSerializer
     http_method_names = ["get"]
+    version_field = Greatest("updated_at", "surfzone__content_updated_at")   # Spot payloads embed zone data
+    pagination_class = CatalogueCursorPagination
 
     def get_queryset(self):
         # ✅ Prefetch optimized: only columns needed + stable ordering
         spot_images_qs = (
             SurfSpotImage.objects
-            .only("id", "image", "description", "created_at", "surfspot_id")
+            .only("id", "image", "variants", "description", "created_at", "surfspot_id")
             .order_by("created_at")
         )
 
-        qs = (
-            SurfSpot.objects
-            .select_related("surfzone", "surfzone__country")
-            .prefetch_related(
-                Prefetch("spot_images", queryset=spot_images_qs),
-            )
+        qs = self.sparse_queryset(
+            SurfSpot.objects.all(),
+            select_related=("surfzone", "surfzone__country"),
+            prefetch_related=(Prefetch("spot_images", queryset=spot_images_qs),),
+            keep=CURSOR_COLUMNS,
         )
 
         p = self.request.query_params
@@ -293,17 +501,9 @@ class SurfSpotLiteListAPIView(ListAPIView):
         if surfzone_slug:
             qs = qs.filter(surfzone__slug=surfzone_slug)
 
-        best_month = p.get("best_month")
-        if best_month:
-            qs = qs.filter(best_months__contains=[best_month])
-
-        surf_level = p.get("surf_level")
-        if surf_level:
-            qs = qs.filter(surf_level__contains=[surf_level])
-
-        best_tide = p.get("best_tide")
-        if best_tide:
-            qs = qs.filter(best_tide__contains=[best_tide])
+        qs = filter_choices(qs, p, "best_month", "best_months")
+        qs = filter_choices(qs, p, "surf_level", "surf_level")
+        qs = filter_choices(qs, p, "best_tide", "best_tide")
 
         break_type = p.get("break_type")
         if break_type:
@@ -329,16 +529,20 @@ class SurfSpotLiteListAPIView(ListAPIView):
         if swell_max is not None:
             qs = qs.filter(best_swell_size_meter__lte=float(swell_max))
 
-        return qs.order_by("name")
+        qs = filter_review_aggregates(qs, p)
+        qs = filter_bbox(qs, p)
+
+        return qs.order_by(*self.paginator.get_ordering(self.request))
 
 
-class SurfSpotDetailAPIView(RetrieveAPIView):
+class SurfSpotDetailAPIView(SparseFieldsetViewMixin, ConditionalGetMixin, CachedResponseMixin, AsyncReadOnlyMixin, RetrieveAPIView):
     """
     Retrieve detailed info for a single SurfSpot by ID.
-    Includes related surfzone, images.
+    Includes related surfzone, images (joined / prefetched only when selected with fields= / omit=).
     """
     permission_classes = [AllowAny]
     http_method_names = ["get"]
+    version_field = Greatest("updated_at", "surfzone__content_updated_at")   # Spot payloads embed zone data
     serializer_class = SurfSpotDetailSerializer
     lookup_field = "id"
 
@@ -346,15 +550,209 @@ class SurfSpotDetailAPIView(RetrieveAPIView):
         # ✅ Prefetch optimized: only columns needed + stable ordering
         spot_images_qs = (
             SurfSpotImage.objects
-            .only("id", "image", "description", "created_at", "surfspot_id")
+            .only("id", "image", "variants", "description", "created_at", "surfspot_id")
             .order_by("created_at")
         )
 
-        return (
-            SurfSpot.objects
-            .select_related("surfzone")
-            .prefetch_related(
-                Prefetch("spot_images", queryset=spot_images_qs),
-            )
-            .all()
+        return self.sparse_queryset(
+            SurfSpot.objects.all(),
+            select_related=("surfzone",),
+            prefetch_related=(Prefetch("spot_images", queryset=spot_images_qs),),
         )
+
+
+class NearbyAPIView(APIView):
+    """
+    Surf zones and/or spots closest to a point, with their distance in km.
+
+    Query params (see NearbyQuerySerializer):
+    - lat / lon (default: the authenticated user's latitude / longitude)
+    - radius_km: radius search (every point within the distance)
+    - k: k-nearest search (default 10 without radius_km); with radius_km,
+      the k nearest points within the radius
+    - type: zone (default), spot or all
+
+    Answered from the in-memory k-d tree (see surfzones/geo.py): no database
+    query once the index is built. Results are sorted by distance and capped
+    at settings.API_MAX_PAGE_SIZE.
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ["get"]
+    default_k = 10
+
+    def get(self, request, *args, **kwargs):
+        query = NearbyQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        lat, lon = self.get_origin(request, params)
+        radius_km = params.get("radius_km")
+        k = params.get("k", None if radius_km is not None else self.default_k)
+        limit = min(k or settings.API_MAX_PAGE_SIZE, settings.API_MAX_PAGE_SIZE)
+
+        index = geo_index.get()
+        kinds = ("zone", "spot") if params["type"] == "all" else (params["type"],)
+        results = []
+        for kind in kinds:
+            if k is None:
+                results += index[kind].radius(lat, lon, radius_km)
+            else:
+                results += index[kind].nearest(lat, lon, limit, radius_km)
+        results.sort(key=lambda entry: entry["distance_km"])
+        results = results[:limit]
+
+        return Response({
+            "origin": {"latitude": lat, "longitude": lon},
+            "count": len(results),
+            "results": results,
+        })
+
+    def get_origin(self, request, params):
+        """Origin from lat / lon, or from the authenticated user's coordinates."""
+        if "lat" in params:
+            return params["lat"], params["lon"]
+        user = request.user
+        if user.is_authenticated and user.latitude is not None and user.longitude is not None:
+            return user.latitude, user.longitude
+        raise ValidationError({"lat": "Provide lat and lon (or set coordinates on your profile)."})
+
+
+class RecommendationsAPIView(APIView):
+    """
+    Surf zones ranked for the authenticated user and a month.
+
+    Scores combine the month's conditions with User.preferences, User.budget
+    and the distance from the user's latitude / longitude
+    (see surfzones/recommendations.py for the preferences format).
+
+    Query params:
+    - month (default: current month)
+    - limit (default 10, max 50)
+    """
+    permission_classes = [IsAuthenticated]
+    http_method_names = ["get"]
+
+    def get(self, request, *args, **kwargs):
+        query = RecommendationQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        month = query.validated_data.get("month") or MONTHS_CHOICES.values[timezone.now().month - 1]
+        limit = query.validated_data["limit"]
+
+        user = request.user
+        origin = None
+        if user.latitude is not None and user.longitude is not None:
+            origin = (user.latitude, user.longitude)
+
+        results = recommend(user.preferences, user.budget, month, origin, min(limit, MAX_RESULTS))
+        return Response({"month": month, "count": len(results), "results": results})
+
+
+class SearchAPIView(APIView):
+    """
+    Full-text search over surf zones, surf spots and countries.
+
+    Query params (see SearchQuerySerializer):
+    - q: free text, accent and case insensitive; every word must match
+    - type: zone, spot, country or all (default)
+    - prefix: the last word also matches longer words (default true, typeahead)
+    - limit (default 20, max 100)
+
+    Searches the precomputed SearchDocument index: PostgreSQL tsvector + GIN,
+    or the in-process inverted index (see surfzones/search.py). Results are
+    ranked (name matches first, then location, then descriptions).
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ["get"]
+
+    def get(self, request, *args, **kwargs):
+        query = SearchQuerySerializer(data=request.query_params.dict())   # dict(): a missing boolean keeps its default
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        types = ENTITY_TYPES if params["type"] == "all" else (params["type"],)
+        results = search(params["q"], types, params["limit"], params["prefix"])
+        return Response({"query": params["q"], "count": len(results), "results": results})
+
+
+class AutocompleteAPIView(APIView):
+    """
+    Typeahead suggestions over zone, spot, country and nearest-city names.
+
+    Query params (see AutocompleteQuerySerializer):
+    - q: what the user typed so far (accent and case insensitive)
+    - type: zone, spot, country, city or all (default)
+    - limit (default 8, max 50)
+
+    Each suggestion has type, id, name, slug and subtitle; city suggestions
+    point to the zone they are nearest to. Answered from the in-memory
+    sorted index (see surfzones/autocomplete.py): no database query.
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ["get"]
+
+    def get(self, request, *args, **kwargs):
+        query = AutocompleteQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        types = SUGGESTION_TYPES if params["type"] == "all" else (params["type"],)
+        results = autocomplete_index.get().complete(params["q"], types, params["limit"])
+        return Response({"query": params["q"], "count": len(results), "results": results})
+
+
+class MarkersAPIView(APIView):
+    """
+    Every located surf zone and surf spot as map markers: id, slug, type,
+    latitude and longitude, in columnar JSON (parallel arrays) or, with
+    `?format=bin` / `Accept: application/octet-stream`, as packed float32
+    coordinates (layouts in surfzones/markers.py).
+
+    The bodies are encoded once per catalogue version and served as is, with
+    an ETag: a client holding the current set gets a 304.
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ["get"]
+    renderer_classes = [api_settings.DEFAULT_RENDERER_CLASSES[0], MarkersBinaryRenderer]
+
+    def get(self, request, *args, **kwargs):
+        markers = marker_index.get()
+        renderer = request.accepted_renderer
+        fmt = "bin" if isinstance(renderer, MarkersBinaryRenderer) else "json"
+
+        response = precomputed_response(request, markers.bodies[fmt], markers.etags[fmt], renderer.media_type)
+        if response.status_code == 200:
+            response["X-Marker-Count"] = markers.count
+        patch_vary_headers(response, ("Accept",))
+        return response
+
+
+class ClustersAPIView(APIView):
+    """
+    Markers of the visible map area, clustered for the zoom level.
+
+    Query params (see ClusterQuerySerializer):
+    - bbox: minLon,minLat,maxLon,maxLat (minLon > maxLon crosses the antimeridian)
+    - zoom: map zoom level (0-22)
+    - type: zone, spot or all (default)
+
+    Returns `clusters` (count, zones, spots, centroid latitude / longitude and
+    the `expansion_zoom` at which the cluster splits) and the lone `points`
+    (type, id, name, slug, latitude, longitude); above zoom 14 every point is
+    returned. Answered from the in-memory grids (see surfzones/clusters.py):
+    no database query once they are built.
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ["get"]
+
+    def get(self, request, *args, **kwargs):
+        query = ClusterQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        clusters, points = cluster_index.get()[params["type"]].query(params["bbox"], params["zoom"])
+        return Response({
+            "zoom": params["zoom"],
+            "count": sum(cluster["count"] for cluster in clusters) + len(points),
+            "clusters": clusters,
+            "points": points,
+        })
@@ -17,3 +17,7 @@ class UsersConfig(AppConfig):
     """Configuration class for the users app."""
     default_auto_field = 'django.db.models.BigAutoField'  # Default auto-generated primary key type
     name = 'users'  # Name used to reference this app throughout the Django project
+
+    def ready(self):
+        """Connect signal handlers (review aggregates)."""
+        from . import signals  # noqa: F401
@@ -19,6 +19,11 @@ from django.conf import settings   # Access project settings (e.g., custom user
 from django.utils.text import slugify   # Used to generate slugs from usernames
 from django.urls import reverse   # Used to generate absolute URLs for model instances
 
+# ============================
+# Project Imports
+# ============================
+from surfquest.images import prepare_variants   # Responsive avatar derivatives
+
 # ============================
 # Django built-in user model extension
 # ============================
@@ -44,6 +49,7 @@ class User(AbstractUser):
     longitude = models.FloatField(max_length=10, null=True, blank=True)
     nearest_airport = models.CharField(max_length=100, null=True, blank=True)
     avatar = models.ImageField(upload_to='avatars/', null=True, blank=True)   # User profile image
+    avatar_variants = models.JSONField(default=dict, blank=True, editable=False)   # Avatar thumbnails / WebP (see surfquest/images.py)
     bio = models.TextField(max_length=500, blank=True)
     preferences = models.JSONField(null=True, blank=True)   # Stores user surfing preferences
     budget = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)   # User's trip budget
@@ -54,9 +60,12 @@ class User(AbstractUser):
         return self.username
     
     def save(self, *args, **kwargs):
-        """Auto-generate slug from username if not set."""
+        """Auto-generate slug from username if not set, build the avatar derivatives."""
         if not self.slug:
             self.slug = slugify(self.username)
+        self.avatar_variants = prepare_variants(self.avatar, self.avatar_variants)
+        if kwargs.get("update_fields") is not None and "avatar" in kwargs["update_fields"]:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "avatar_variants"}
         super().save(*args, **kwargs)
     
     class Meta:
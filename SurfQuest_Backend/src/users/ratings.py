@@ -0,0 +1,128 @@
+"""
+Maintenance of the review aggregates of surf zones and surf spots.
+
+Each zone / spot row carries `review_count`, `rating_sum`, `rating_avg` and a
+1 to 5 histogram (`rating_<n>_count`, see surfzones.models.ReviewAggregates).
+They are updated by the users signals on every review create / update /
+delete with relative `F()` updates, so concurrent reviews never overwrite
+each other, in the same transaction as the review itself. The version stamps
+of the rated rows move along, so cached responses and ETags follow, and the
+surfzones-lite card of a rated zone is re-rendered.
+
+`recount_review_aggregates` recomputes them from the reviews (migration
+backfill, `manage.py recount_review_aggregates`).
+"""
+
+# ============================
+# Standard Library
+# ============================
+from collections import defaultdict   # Histograms of the recounted rows
+
+# ============================
+# Django Imports
+# ============================
+from django.db import transaction   # Review + aggregates commit together
+from django.db.models import Count, F, FloatField, Value   # Relative updates, recount
+from django.db.models.functions import Cast, Coalesce, NullIf   # Average of the updated row
+from django.utils import timezone   # Version stamps
+
+# ============================
+# Project Imports
+# ============================
+from surfquest.cache import invalidate_catalogue_cache   # Cached responses embed the aggregates
+from surfzones.models import SurfZone, SurfSpot   # Rated rows
+from surfzones.cards import refresh_zone_cards   # Zone cards embed the aggregates
+
+
+RATINGS = range(1, 6)
+AGGREGATE_FIELDS = ("review_count", "rating_sum", "rating_avg", *(f"rating_{rating}_count" for rating in RATINGS))
+STAMP_FIELDS = {SurfZone: ("updated_at", "content_updated_at"), SurfSpot: ("updated_at",)}
+
+
+# ============================
+# Incremental updates
+# ============================
+def add_rating(model, pk, rating, sign=1):
+    """Add (sign=1) or remove (sign=-1) one `rating` from the aggregates of a zone / spot, in one UPDATE."""
+    count_field = f"rating_{rating}_count"
+    now = timezone.now()
+    model.objects.filter(pk=pk).update(
+        review_count=F("review_count") + sign,
+        rating_sum=F("rating_sum") + sign * rating,
+        # Every right-hand side reads the row before the update: recompute from the new totals
+        rating_avg=Coalesce(
+            Cast(F("rating_sum") + sign * rating, FloatField()) / NullIf(F("review_count") + sign, 0),
+            Value(0.0),
+        ),
+        **{count_field: F(count_field) + sign},
+        **{field: now for field in STAMP_FIELDS[model]},
+    )
+
+
+def apply_review_change(previous, current, skip=()):
+    """
+    Move the aggregates from the `previous` to the `current` state of a review.
+
+    Both are (rating, surf_zone_id, surf_spot_id) tuples, or None before a
+    create / after a delete. Rows whose pk is in `skip` are left alone (being
+    deleted along with their reviews).
+    """
+    if previous == current:
+        return   # Comment-only edit
+    zone_ids = set()
+    with transaction.atomic():
+        for state, sign in ((previous, -1), (current, 1)):
+            if state is None:
+                continue
+            rating, zone_id, spot_id = state
+            for model, pk in ((SurfZone, zone_id), (SurfSpot, spot_id)):
+                if pk is None or pk in skip:
+                    continue
+                add_rating(model, pk, rating, sign)
+                if model is SurfZone:
+                    zone_ids.add(pk)
+        if zone_ids:
+            refresh_zone_cards(pk__in=zone_ids)
+    invalidate_catalogue_cache()
+
+
+# ============================
+# Recount
+# ============================
+def aggregate_values(histogram):
+    """Aggregate field values of a [1 star, ..., 5 stars] histogram."""
+    review_count = sum(histogram)
+    rating_sum = sum(rating * count for rating, count in zip(RATINGS, histogram))
+    return {
+        "review_count": review_count,
+        "rating_sum": rating_sum,
+        "rating_avg": rating_sum / review_count if review_count else 0.0,
+        **{f"rating_{rating}_count": count for rating, count in zip(RATINGS, histogram)},
+    }
+
+
+def recount_review_aggregates(model, review_model, field, **filters):
+    """
+    Recompute the aggregates of the `model` rows matching `filters` from the
+    reviews pointing to them through `field` ("surf_zone" / "surf_spot").
+
+    Takes the models as arguments so that migrations can pass historical ones.
+    Returns the number of recounted rows.
+    """
+    rows = list(model.objects.filter(**filters).only("pk"))
+    histograms = defaultdict(lambda: [0] * len(RATINGS))
+    counts = (
+        review_model.objects
+        .filter(**{f"{field}__in": model.objects.filter(**filters).values("pk")})
+        .values_list(field, "rating")
+        .annotate(count=Count("pk"))
+        .order_by()
+    )
+    for pk, rating, count in counts:
+        histograms[pk][rating - 1] = count
+
+    for row in rows:
+        for name, value in aggregate_values(histograms[row.pk]).items():
+            setattr(row, name, value)
+    model.objects.bulk_update(rows, AGGREGATE_FIELDS, batch_size=500)
+    return len(rows)
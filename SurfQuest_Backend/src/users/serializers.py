@@ -21,7 +21,9 @@ from .models import User, Review
 # External App Imports
 # ============================
 from surfzones.models import SurfZone, SurfSpot
-from surfzones.serializers import SurfZoneSerializer, SurfSpotSerializer
+from surfzones.serializers import NestedSurfZoneSerializer, NestedSurfSpotSerializer
+from surfquest.images import srcset_map   # Avatar thumbnail / WebP URLs
+from surfquest.memo import MemoizedSerializerMixin   # Nested payloads rendered once per response
 
 
 # ============================
@@ -33,6 +35,8 @@ class UserSerializer(serializers.ModelSerializer):
 
     Handles password validation, hashing, and user creation/update logic.
     """
+    avatar_srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = User
         fields = (
@@ -51,6 +55,7 @@ class UserSerializer(serializers.ModelSerializer):
             'nearest_airport', 
             'bio', 
             'avatar',
+            'avatar_srcset',
             'preferences', 
             'budget',
         )
@@ -58,6 +63,10 @@ class UserSerializer(serializers.ModelSerializer):
             'password': {'write_only': True}  # Hide password from GET: Ensure password is only writable, never readable
         }
 
+    def get_avatar_srcset(self, obj):
+        """Avatar thumbnail / WebP URLs (see surfquest/images.py)."""
+        return srcset_map(obj.avatar, obj.avatar_variants, request=self.context.get("request"))
+
 
     def validate(self, attrs):
         """
@@ -100,6 +109,10 @@ class UserSerializer(serializers.ModelSerializer):
         return instance
 
 
+class NestedUserSerializer(MemoizedSerializerMixin, UserSerializer):
+    """UserSerializer nested in review payloads: each author is serialized once per response."""
+
+
 class ReviewSerializer(serializers.ModelSerializer):
 
 
@@ -110,7 +123,7 @@ class ReviewSerializer(serializers.ModelSerializer):
     Validates uniqueness of review per user and surf zone/spot.
     Allows linking to surf zones and surf spots via ID, and includes nested details.
     """
-    user = UserSerializer(read_only=True)
+    user = NestedUserSerializer(read_only=True)
 
     # Allow setting surf zone ID when creating a review
     surf_zone = serializers.PrimaryKeyRelatedField(
@@ -122,8 +135,8 @@ class ReviewSerializer(serializers.ModelSerializer):
     )
     # Nested serializers for surf zone and surf spot details
     # These are read-only fields that will be populated in the response
-    surf_zone_details = SurfZoneSerializer(source="surf_zone", read_only=True) 
-    surf_spot_details = SurfSpotSerializer(source="surf_spot", read_only=True)
+    surf_zone_details = NestedSurfZoneSerializer(source="surf_zone", read_only=True)
+    surf_spot_details = NestedSurfSpotSerializer(source="surf_spot", read_only=True)
     
     class Meta:
         model = Review
@@ -186,10 +199,16 @@ class ReviewSerializer(serializers.ModelSerializer):
 # Nouveaux Serializers (lite):
 # ============================
 
-class UserLiteSerializer(serializers.ModelSerializer):
+class UserLiteSerializer(MemoizedSerializerMixin, serializers.ModelSerializer):
+    # Nested in review lists: a prolific author's avatar URLs are built once per response
+    avatar_srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = User
-        fields = ("id", "username", "avatar")
+        fields = ("id", "username", "avatar", "avatar_srcset")
+
+    def get_avatar_srcset(self, obj):
+        return srcset_map(obj.avatar, obj.avatar_variants, request=self.context.get("request"))
 
 
 class ReviewReadLiteSerializer(serializers.ModelSerializer):
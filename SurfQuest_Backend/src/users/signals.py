@@ -0,0 +1,50 @@
+"""
+Signal handlers for the users app.
+
+Saving or deleting a Review moves the review aggregates of the rated surf
+zone / surf spot (count, sum, average, histogram; see users/ratings.py),
+along with their version stamps and cached responses.
+"""
+
+# ============================
+# Django Imports
+# ============================
+from django.db.models.signals import pre_save, post_save, post_delete   # Model lifecycle signals
+
+# ============================
+# Local Application Imports
+# ============================
+from .models import Review
+from .ratings import apply_review_change
+
+
+def rated_state(review):
+    """What a review contributes to the aggregates: (rating, surf_zone_id, surf_spot_id)."""
+    return (review.rating, review.surf_zone_id, review.surf_spot_id)
+
+
+# ============================
+# Receivers
+# ============================
+def review_pre_save(sender, instance, raw=False, **kwargs):
+    """Remember the stored state of an updated review (fixtures may overwrite existing rows)."""
+    instance._rated_state = None
+    if raw or not instance._state.adding:
+        instance._rated_state = (
+            Review.objects.filter(pk=instance.pk).values_list("rating", "surf_zone_id", "surf_spot_id").first()
+        )
+
+
+def review_saved(sender, instance, **kwargs):
+    apply_review_change(getattr(instance, "_rated_state", None), rated_state(instance))
+
+
+def review_deleted(sender, instance, origin=None, **kwargs):
+    """Rows deleted along with their reviews (zone / spot deletion) are not updated."""
+    skip = () if isinstance(origin, Review) else (getattr(origin, "pk", None),)
+    apply_review_change(rated_state(instance), None, skip=skip)
+
+
+pre_save.connect(review_pre_save, sender=Review, dispatch_uid="review-aggregates-pre-save")
+post_save.connect(review_saved, sender=Review, dispatch_uid="review-aggregates-save")
+post_delete.connect(review_deleted, sender=Review, dispatch_uid="review-aggregates-delete")
@@ -0,0 +1,166 @@
+"""
+Tests for the review aggregates stored on surf zones and surf spots.
+
+These tests verify that:
+- creating, updating and deleting reviews through /api/v1/user-reviews/
+  keeps review_count, rating_sum, rating_avg and the histogram in sync
+- the lite and detail payloads expose them, and change their ETag
+- the lite lists can be filtered and sorted by rating
+- the recount rebuilds them from the reviews
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# ============================
+# Local Application Imports
+# ============================
+from users.models import User, Review
+from users.ratings import recount_review_aggregates
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+from surfquest.pagination import CatalogueCursorPagination
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def catalogue(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    country = Country.objects.create(name="Portugal", code="PRT", continent=continent)
+    peniche = SurfZone.objects.create(name="Peniche", country=country)
+    ericeira = SurfZone.objects.create(name="Ericeira", country=country)
+    spot = SurfSpot.objects.create(name="Supertubos", surfzone=peniche)
+    return {"peniche": peniche, "ericeira": ericeira, "spot": spot}
+
+@pytest.fixture
+def users(db):
+    return [User.objects.create_user(username=f"rider{i}", email=f"rider{i}@example.com") for i in range(3)]
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+def aggregates(obj):
+    obj.refresh_from_db()
+    return obj.review_count, obj.rating_sum, obj.rating_avg, obj.rating_histogram
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_review_lifecycle_updates_aggregates(catalogue, users):
+    """Test create, rating change and delete through the user-reviews endpoint."""
+    zone = catalogue["peniche"]
+    response = client_for(users[0]).post("/api/v1/user-reviews/", {"surf_zone": str(zone.id), "rating": 5})
+    assert response.status_code == status.HTTP_201_CREATED
+    client_for(users[1]).post("/api/v1/user-reviews/", {"surf_zone": str(zone.id), "rating": 2})
+    assert aggregates(zone) == (2, 7, 3.5, [0, 1, 0, 0, 1])
+
+    review_id = response.data["id"]
+    client_for(users[0]).patch(f"/api/v1/user-reviews/{review_id}/", {"rating": 3, "comment": "Crowded"})
+    assert aggregates(zone) == (2, 5, 2.5, [0, 1, 1, 0, 0])
+
+    client_for(users[0]).delete(f"/api/v1/user-reviews/{review_id}/")
+    assert aggregates(zone) == (1, 2, 2.0, [0, 1, 0, 0, 0])
+
+
+@pytest.mark.django_db
+def test_review_moved_to_another_target(catalogue, users):
+    """Test that changing the reviewed zone / spot moves the rating."""
+    review = Review.objects.create(user=users[0], surf_zone=catalogue["peniche"], rating=4)
+    review.surf_zone, review.surf_spot = None, catalogue["spot"]
+    review.save()
+
+    assert aggregates(catalogue["peniche"]) == (0, 0, 0.0, [0, 0, 0, 0, 0])
+    assert aggregates(catalogue["spot"]) == (1, 4, 4.0, [0, 0, 0, 1, 0])
+
+
+@pytest.mark.django_db
+def test_payloads_expose_aggregates(catalogue, users):
+    """Test the lite card and detail payloads, and that a review changes the ETag."""
+    client = APIClient()
+    zone = catalogue["peniche"]
+    etag = client.get("/api/v1/surfzones-lite/", {"all": "true"})["ETag"]
+
+    Review.objects.create(user=users[0], surf_zone=zone, rating=4)
+    Review.objects.create(user=users[0], surf_spot=catalogue["spot"], rating=1)
+
+    response = client.get("/api/v1/surfzones-lite/", {"all": "true"})
+    assert response["ETag"] != etag
+    card = next(card for card in response.data if card["id"] == str(zone.id))
+    assert (card["review_count"], card["rating_avg"], card["rating_histogram"]) == (1, 4.0, [0, 0, 0, 1, 0])
+
+    detail = client.get(f"/api/v1/surfzones-detail/{zone.id}/").data
+    assert detail["rating_avg"] == 4.0
+    spot = client.get("/api/v1/surfspots-lite/", {"all": "true"}).data[0]
+    assert (spot["review_count"], spot["rating_histogram"]) == (1, [1, 0, 0, 0, 0])
+
+
+@pytest.mark.django_db
+def test_lite_lists_sort_and_filter_by_rating(catalogue, users):
+    """Test ordering=-rating (paginated and unpaginated) and rating_min."""
+    Review.objects.create(user=users[0], surf_zone=catalogue["ericeira"], rating=5)
+    Review.objects.create(user=users[0], surf_zone=catalogue["peniche"], rating=3)
+    Review.objects.create(user=users[1], surf_zone=catalogue["peniche"], rating=4)
+    client = APIClient()
+
+    response = client.get("/api/v1/surfzones-lite/", {"ordering": "-rating", "page_size": 1})
+    assert [card["name"] for card in response.data["results"]] == ["Ericeira"]
+    response = client.get(response.data["next"])
+    assert [card["name"] for card in response.data["results"]] == ["Peniche"]
+
+    response = client.get("/api/v1/surfzones-lite/", {"ordering": "-review_count", "all": "true"})
+    assert [card["name"] for card in response.data] == ["Peniche", "Ericeira"]
+
+    response = client.get("/api/v1/surfzones-lite/", {"rating_min": 4, "all": "true"})
+    assert [card["name"] for card in response.data] == ["Ericeira"]
+
+    response = client.get("/api/v1/surfspots-lite/", {"ordering": "stars"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", ["rating", "-rating", "review_count", "-review_count"])
+def test_rating_pages_beyond_the_offset_cutoff(catalogue, monkeypatch, ordering):
+    """Test that pages of tied (unreviewed) zones neither repeat nor skip rows past DRF's tie offset cutoff."""
+    monkeypatch.setattr(CatalogueCursorPagination, "offset_cutoff", 2)
+    for i in range(6):
+        SurfZone.objects.create(name=f"Zone {i}", country=catalogue["peniche"].country)
+    client = APIClient()
+
+    names = []
+    response = client.get("/api/v1/surfzones-lite/", {"ordering": ordering, "page_size": 2})
+    while True:
+        names += [card["name"] for card in response.data["results"]]
+        if not response.data["next"]:
+            break
+        response = client.get(response.data["next"])
+    assert sorted(names) == sorted(SurfZone.objects.values_list("name", flat=True))
+
+
+@pytest.mark.django_db
+def test_recount_review_aggregates(catalogue, users):
+    """Test that the recount restores aggregates skipped by bulk operations."""
+    zone = catalogue["peniche"]
+    Review.objects.bulk_create([Review(user=user, surf_zone=zone, rating=5) for user in users])
+    assert aggregates(zone)[0] == 0
+
+    recount_review_aggregates(SurfZone, Review, "surf_zone")
+    assert aggregates(zone) == (3, 15, 5.0, [0, 0, 0, 0, 3])
+
+
+@pytest.mark.django_db
+def test_deleting_a_zone_deletes_its_reviews(catalogue, users):
+    """Test that the cascade does not try to update the zone being deleted."""
+    Review.objects.create(user=users[0], surf_zone=catalogue["ericeira"], rating=5)
+    catalogue["ericeira"].delete()
+    assert not Review.objects.exists()
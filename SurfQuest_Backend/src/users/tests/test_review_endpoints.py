@@ -150,4 +150,25 @@ def test_user_reviews_post_creates_review_and_covers_perform_create():
 
     assert response.status_code == status.HTTP_201_CREATED  # type: ignore
     assert response.data["comment"] == "Testing perform_create"  # type: ignore
-    assert response.data["rating"] == 5  # type: ignore
\ No newline at end of file
+    assert response.data["rating"] == 5  # type: ignore
+
+@pytest.mark.django_db
+def test_public_reviews_are_paginated_newest_first():
+    """Test that /api/v1/reviews/ is cursor-paginated with the newest review first."""
+    continent = Continent.objects.create(name="Europe")
+    country = Country.objects.create(name="Portugal", code="PT", continent=continent)
+    zone = SurfZone.objects.create(name="Ericeira", country=country)
+    for i in range(3):
+        user = User.objects.create_user(username=f"reviewer{i}", email=f"reviewer{i}@example.com", password="StrongPassword123!")
+        Review.objects.create(user=user, surf_zone=zone, rating=4, comment=f"Review {i}")
+
+    client = APIClient()
+    response = client.get("/api/v1/reviews/", {"surf_zone_id": str(zone.id), "page_size": 2})
+    assert response.status_code == status.HTTP_200_OK  # type: ignore
+    assert [r["comment"] for r in response.data["results"]] == ["Review 2", "Review 1"]  # type: ignore
+
+    response = client.get(response.data["next"])  # type: ignore
+    assert [r["comment"] for r in response.data["results"]] == ["Review 0"]  # type: ignore
+
+    response = client.get("/api/v1/reviews/", {"surf_zone_id": str(zone.id), "all": "true"})
+    assert len(response.data) == 3  # type: ignore
@@ -0,0 +1,73 @@
+"""
+Tests for the per-response memo of nested payloads in review lists (surfquest/memo.py).
+
+These tests verify that:
+- an author, zone or spot shared by several reviews is serialized once
+- the memoized payloads are the same as without the memo
+- the memo does not outlive the serializer it belongs to
+"""
+
+# ============================
+# Third-Party Imports
+# ============================
+import pytest
+
+# ============================
+# Local Application Imports
+# ============================
+from users import serializers as user_serializers
+from users.models import User, Review
+from users.serializers import ReviewReadLiteSerializer, ReviewSerializer, UserLiteSerializer
+from surfzones.models import Continent, Country, SurfZone, SurfSpot
+from surfzones.serializers import SurfZoneSerializer
+
+
+# ============================
+# Fixtures
+# ============================
+@pytest.fixture
+def reviews(db):
+    continent = Continent.objects.create(name="Europe", code="EU")
+    country = Country.objects.create(name="Portugal", code="PRT", continent=continent)
+    zone = SurfZone.objects.create(name="Peniche", country=country)
+    spots = [SurfSpot.objects.create(name=f"Spot {i}", surfzone=zone) for i in range(3)]
+    author = User.objects.create_user(username="prolific", email="prolific@example.com", password="StrongPassword123!")
+    other = User.objects.create_user(username="other", email="other@example.com", password="StrongPassword123!")
+    Review.objects.create(user=author, surf_zone=zone, rating=5)
+    for spot in spots:
+        Review.objects.create(user=author, surf_spot=spot, rating=4)
+    Review.objects.create(user=other, surf_spot=spots[0], rating=3)
+    return Review.objects.select_related("user", "surf_zone", "surf_spot").order_by("created_at")
+
+
+def count_calls(monkeypatch, owner, name):
+    calls = []
+    original = getattr(owner, name)
+    monkeypatch.setattr(owner, name, lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs))
+    return calls
+
+
+# ============================
+# Test Cases
+# ============================
+@pytest.mark.django_db
+def test_author_avatar_built_once_per_response(reviews, monkeypatch):
+    """Test that the avatar URLs of an author are built once for all their reviews."""
+    calls = count_calls(monkeypatch, user_serializers, "srcset_map")
+    data = ReviewReadLiteSerializer(reviews, many=True).data
+    assert len(data) == 5 and len(calls) == 2
+
+    ReviewReadLiteSerializer(reviews, many=True).data
+    assert len(calls) == 4   # A new serializer starts with an empty memo
+    assert data[0]["user"] == UserLiteSerializer(reviews[0].user).data
+
+
+@pytest.mark.django_db
+def test_review_serializer_nested_payloads(reviews, monkeypatch):
+    """Test that the full nested zone is serialized once for the zone review and the three spot reviews."""
+    calls = count_calls(monkeypatch, SurfZoneSerializer, "to_representation")
+    data = ReviewSerializer(reviews, many=True).data
+    assert len(calls) == 1
+    assert data[1]["surf_spot_details"]["surfzone"] == data[0]["surf_zone_details"]
+    assert data[4]["surf_spot_details"] == data[1]["surf_spot_details"]
+    assert data[4]["user"]["username"] == "other"
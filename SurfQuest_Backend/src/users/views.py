@@ -9,6 +9,7 @@ and review creation and filtering based on the authenticated user.
 # Django Imports
 # ============================
 from django.contrib.auth import authenticate   # Django login validation function
+from django.db import transaction   # Reviews and the rating aggregates commit together
 
 # ============================
 # Django Rest Framework Imports
@@ -20,6 +21,12 @@ from rest_framework.permissions import IsAuthenticated, AllowAny   # Access cont
 from rest_framework.generics import RetrieveAPIView   # Add at the top with DRF imports
 from rest_framework import status   # HTTP status codes
 
+# ============================
+# Project Imports
+# ============================
+from surfquest.pagination import CreatedAtCursorPagination   # Keyset pagination, newest first
+from surfquest.async_views import AsyncReadOnlyMixin   # Async dispatch in ASGI serving mode
+
 # ============================
 # Local Application Imports
 # ============================
@@ -76,9 +83,16 @@ class ProtectedView(APIView):
         return Response({"message": "This is a protected view"})
 
 
-class ReviewViewSet(viewsets.ReadOnlyModelViewSet):
+class ReviewViewSet(AsyncReadOnlyMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Public read-only list of reviews, filterable by surf_zone_id / surf_spot_id.
+
+    Cursor-paginated newest first (page_size / cursor), or unpaginated with all=true.
+    Dispatched asynchronously in ASGI serving mode (see surfquest/async_views.py).
+    """
     permission_classes = [AllowAny]
     serializer_class = ReviewReadLiteSerializer
+    pagination_class = CreatedAtCursorPagination
 
     queryset = Review.objects.select_related("user", "surf_zone", "surf_spot").order_by("-created_at")
 
@@ -98,6 +112,12 @@ class ReviewViewSet(viewsets.ReadOnlyModelViewSet):
 
 
 class UserReviewsViewSet(viewsets.ModelViewSet):
+    """
+    Reviews of the authenticated user.
+
+    Writes run in one transaction with the review aggregates of the rated
+    zone / spot (see users/ratings.py).
+    """
     permission_classes = [IsAuthenticated]
     serializer_class = ReviewReadLiteSerializer
     http_method_names = ["get", "post", "put", "patch", "delete"]
@@ -115,6 +135,7 @@ class UserReviewsViewSet(viewsets.ModelViewSet):
             return ReviewWriteSerializer
         return ReviewReadLiteSerializer
     
+    @transaction.atomic
     def create(self, request, *args, **kwargs):
         write_serializer = self.get_serializer(data=request.data)
         write_serializer.is_valid(raise_exception=True)
@@ -123,6 +144,7 @@ class UserReviewsViewSet(viewsets.ModelViewSet):
         read_serializer = ReviewReadLiteSerializer(review, context={"request": request})
         return Response(read_serializer.data, status=status.HTTP_201_CREATED)
 
+    @transaction.atomic
     def update(self, request, *args, **kwargs):
         instance = self.get_object()
         write_serializer = self.get_serializer(instance, data=request.data)
@@ -131,3 +153,7 @@ class UserReviewsViewSet(viewsets.ModelViewSet):
 
         read_serializer = ReviewReadLiteSerializer(review, context={"request": request})
         return Response(read_serializer.data, status=status.HTTP_200_OK)
+
+    @transaction.atomic
+    def destroy(self, request, *args, **kwargs):
+        return super().destroy(request, *args, **kwargs)
@@ -42,7 +42,7 @@ const monthNames = [
 async function fetchSurfZonesLite() {
   const url = API.server.surfzones;
   if (!url) throw new Error("Missing API base URL...");
-  return fetchSurfZones(url, { cache: "no-store" });
+  return fetchSurfZones(`${url}?all=true`, { cache: "no-store" });
 }
 
 export default async function HomePage() {
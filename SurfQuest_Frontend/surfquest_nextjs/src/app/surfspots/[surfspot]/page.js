@@ -12,7 +12,7 @@ async function fetchLiteSpots() {
   const url = API.server.surfspots;
   if (!url) throw new Error("Missing API base URL.");
 
-  const res = await fetch(url, {
+  const res = await fetch(`${url}?all=true`, {
     cache: "no-store",
     headers: { Accept: "application/json" },
   });
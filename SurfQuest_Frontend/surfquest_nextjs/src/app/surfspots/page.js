@@ -9,7 +9,7 @@ import SearchSurfSpotsClient from "@/components/SurfSpots/SearchSurfSpotsClient"
 async function fetchInitialSpots() {
   const url = API.server.surfspots;
   if (!url) throw new Error("Missing API base URL.");
-  const res = await fetch(url, {
+  const res = await fetch(`${url}?all=true`, {
     cache: "no-store",
     headers: { Accept: "application/json" },
   });
@@ -20,7 +20,7 @@ async function fetchInitialSpots() {
 async function fetchZonesForDropdown() {
   const url = API.server.surfzones;
   if (!url) return [];
-  const res = await fetch(url, {
+  const res = await fetch(`${url}?all=true`, {
     cache: "no-store",
     headers: { Accept: "application/json" },
   });
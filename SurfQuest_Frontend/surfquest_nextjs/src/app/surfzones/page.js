@@ -38,7 +38,7 @@ export default async function SurfZonesPage() {
   // SSR: initial list, no-store for dev freshness
   let initialZones = [];
   try {
-    const data = await fetchSurfZones(url, { cache: "no-store" });
+    const data = await fetchSurfZones(`${url}?all=true`, { cache: "no-store" });
     initialZones = Array.isArray(data) ? data : [];
   } catch {
     initialZones = [];
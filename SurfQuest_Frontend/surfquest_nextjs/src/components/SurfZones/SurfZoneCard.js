@@ -2,6 +2,7 @@
 
 import React from "react";
 import Link from "next/link";
+import { toSrcSet } from "@/utils/images";
 
 export default function SurfZoneCard({ surfzone }) {
   // Normalise l’image quel que soit le serializer
@@ -20,6 +21,10 @@ export default function SurfZoneCard({ surfzone }) {
     surfzone?.main_image_url ||
     null;
 
+  // Thumbnails / WebP du backend (image_srcsets[0] = { webp: {"320w": url}, jpeg: {...} })
+  const srcsets = (Array.isArray(surfzone?.image_srcsets) && surfzone.image_srcsets[0]) || {};
+  const cardSizes = "(max-width: 768px) 100vw, 33vw";
+
   return (
     <div className="bg-black rounded-lg relative overflow-hidden group flex items-center justify-center w-full h-64">
       {/* Link overlay */}
@@ -32,12 +37,18 @@ export default function SurfZoneCard({ surfzone }) {
 
       {/* Background image */}
       {imageUrl ? (
-        <img
-          src={imageUrl}
-          alt={surfzone.name}
-          className="inset-0 w-full h-full object-cover rounded-md transform transition-transform duration-500 group-hover:scale-125"
-          loading="lazy"
-        />
+        <picture className="inset-0 w-full h-full">
+          {srcsets.avif && <source type="image/avif" srcSet={toSrcSet(srcsets.avif)} sizes={cardSizes} />}
+          {srcsets.webp && <source type="image/webp" srcSet={toSrcSet(srcsets.webp)} sizes={cardSizes} />}
+          <img
+            src={imageUrl}
+            srcSet={toSrcSet(srcsets.jpeg)}
+            sizes={cardSizes}
+            alt={surfzone.name}
+            className="inset-0 w-full h-full object-cover rounded-md transform transition-transform duration-500 group-hover:scale-125"
+            loading="lazy"
+          />
+        </picture>
       ) : (
         // Fallback visuel si pas d'image
         <div className="w-full h-full flex items-center justify-center bg-gray-900 text-gray-500">
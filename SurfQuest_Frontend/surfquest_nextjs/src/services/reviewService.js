@@ -14,6 +14,7 @@ export async function fetchReviews({ surfZoneId, surfSpotId } = {}) {
   if (!base) throw new Error("Missing reviews API base URL.");
 
   const params = new URLSearchParams();
+  params.set("all", "true"); // reviews are cursor-paginated by default
   if (surfZoneId) params.set("surf_zone_id", surfZoneId);
   if (surfSpotId) params.set("surf_spot_id", surfSpotId);
 
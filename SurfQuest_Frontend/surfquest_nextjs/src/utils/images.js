@@ -12,4 +12,11 @@ export function normalizeImages(images) {
 // A utiliser comme ceci:
 
 // import { normalizeImages } from "@/utils/images";
-// const images = normalizeImages(surfzone.zone_images);
\ No newline at end of file
+// const images = normalizeImages(surfzone.zone_images);
+
+// srcset map from the API ({ "320w": url, "640w": url }) -> "url 320w, url 640w"
+export function toSrcSet(widths) {
+  if (!widths || typeof widths !== "object") return undefined;
+  const entries = Object.entries(widths).map(([width, url]) => `${url} ${width}`);
+  return entries.length ? entries.join(", ") : undefined;
+}
@@ -19,6 +19,9 @@
 export function buildSurfSpotQuery(filters, opts) {
   const p = new URLSearchParams();
 
+  // The list is cursor-paginated by default: ask for the full list
+  p.set("all", "true");
+
   // zone (slug)
   if (filters.surfZone) p.set("surfzone_slug", filters.surfZone);
 
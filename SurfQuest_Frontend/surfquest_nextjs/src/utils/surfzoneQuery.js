@@ -6,6 +6,9 @@
 export function buildSurfZoneQuery(filters, ranges) {
   const p = new URLSearchParams();
 
+  // The list is cursor-paginated by default: ask for the full list
+  p.set("all", "true");
+
   // ----------------------------
   // SurfZone-level filters
   // ----------------------------